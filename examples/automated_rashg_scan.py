@@ -30,6 +30,8 @@ from pymodaq_plugins_urashg.analysis import rashg_analysis
 
 # URASHG plugin imports
 from pymodaq_plugins_urashg.hardware.urashg import URASHGSystem
+from pymodaq_plugins_urashg.hardware.urashg.calibration import FrameCalibration
+from pymodaq_plugins_urashg.hardware.urashg.frame_stream import FrameAccumulator
 from pymodaq_plugins_urashg.utils import configuration_manager
 
 
@@ -71,6 +73,7 @@ class AutomatedμRASHGScanner:
         self.is_initialized = False
         self.measurement_active = False
         self.background_image = None
+        self.background_correction = None
 
         # Data storage
         self.scan_data = []
@@ -261,13 +264,13 @@ class AutomatedμRASHGScanner:
 
         input("Please block the laser and press Enter to continue...")
 
-        background_frames = []
+        accumulator = FrameAccumulator()
         for i in range(num_frames):
-            frame = self.hardware_system.camera.acquire_frame()
-            background_frames.append(frame)
+            accumulator.add(self.hardware_system.camera.acquire_frame())
             self.logger.info(f"Background frame {i+1}/{num_frames} acquired")
 
-        self.background_image = np.mean(background_frames, axis=0)
+        self.background_image = accumulator.mean()
+        self.background_correction = FrameCalibration(dark=self.background_image)
         self.logger.info("Background acquisition complete")
 
         input("Please unblock the laser and press Enter to continue...")
@@ -375,13 +378,12 @@ class AutomatedμRASHGScanner:
             self.measurement_active = False
 
     def _acquire_averaged_frames(self, num_frames: int) -> np.ndarray:
-        """Acquire and average multiple frames."""
-        frames = []
+        """Acquire and average multiple frames in constant memory."""
+        accumulator = FrameAccumulator()
         for i in range(num_frames):
-            frame = self.hardware_system.camera.acquire_frame()
-            frames.append(frame)
+            accumulator.add(self.hardware_system.camera.acquire_frame())
 
-        return np.mean(frames, axis=0)
+        return accumulator.mean()
 
     def _process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, float]:
         """
@@ -396,11 +398,11 @@ class AutomatedμRASHGScanner:
         # Background subtraction if enabled
         if (
             self.config["measurement"]["background_subtraction"]
-            and self.background_image is not None
+            and self.background_correction is not None
         ):
-            processed_frame = frame - self.background_image
-            # Clip negative values
-            processed_frame = np.clip(processed_frame, 0, None)
+            # Subtracted and clipped at zero without temporaries, in place
+            # for averaged frames
+            processed_frame = self.background_correction.apply(frame)
         else:
             processed_frame = frame.copy()
 
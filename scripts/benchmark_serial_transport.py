@@ -0,0 +1,112 @@
+"""
+Benchmark the URASHG controllers' serial paths against the pty simulators.
+
+Every controller runs in hardware mode, talking through its real transport
+to a simulated instrument with the given link model, e.g.::
+
+    python scripts/benchmark_serial_transport.py --baudrate 9600 --latency 0.005
+
+Reports the median and 95th percentile duration of typical operations;
+``--metrics FILE`` also appends the per-command serial metrics to FILE.
+"""
+
+import argparse
+import statistics
+import time
+
+from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import ElliptecController
+from pymodaq_plugins_urashg.hardware.urashg.esp300_controller import (
+    AxisConfig,
+    ESP300Controller,
+)
+from pymodaq_plugins_urashg.hardware.urashg.maitai_control import MaiTaiController
+from pymodaq_plugins_urashg.hardware.urashg.newport1830c_controller import (
+    Newport1830CController,
+)
+from pymodaq_plugins_urashg.hardware.urashg.serial_metrics import METRICS
+from pymodaq_plugins_urashg.hardware.urashg.simulators import (
+    ElliptecSimulator,
+    ESP300Simulator,
+    MaiTaiSimulator,
+    Newport1830CSimulator,
+)
+
+
+def time_operation(operation, iterations):
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        operation()
+        durations.append(time.perf_counter() - start)
+    durations.sort()
+    return statistics.median(durations), durations[int(0.95 * (len(durations) - 1))]
+
+
+def benchmark_elliptec(link):
+    with ElliptecSimulator("2,3,8", **link) as simulator:
+        controller = ElliptecController(
+            port=simulator.port, mount_addresses="2,3,8", position_cache_ttl=0.0
+        )
+        controller.connect()
+        yield "Elliptec get_position", lambda: controller.get_position("2")
+        yield "Elliptec get_all_positions", controller.get_all_positions
+        controller.disconnect()
+
+
+def benchmark_esp300(link):
+    with ESP300Simulator(num_axes=3, **link) as simulator:
+        controller = ESP300Controller(
+            port=simulator.port,
+            axes_config=[AxisConfig(num, name) for num, name in enumerate("xyz", 1)],
+        )
+        controller.connect()
+        yield "ESP300 get_status", controller.get_status
+        yield "ESP300 get_device_info", controller.get_device_info
+        controller.disconnect()
+
+
+def benchmark_maitai(link):
+    with MaiTaiSimulator(**link) as simulator:
+        controller = MaiTaiController(port=simulator.port)
+        controller.connect()
+        yield "MaiTai get_wavelength", controller.get_wavelength
+        yield "MaiTai check_system_errors", controller.check_system_errors
+        controller.disconnect()
+
+
+def benchmark_newport(link):
+    with Newport1830CSimulator(**link) as simulator:
+        controller = Newport1830CController(port=simulator.port)
+        controller.connect()
+        yield "Newport get_power", controller.get_power
+        yield "Newport get_device_info", controller.get_device_info
+        controller.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--baudrate", type=int, default=None)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--metrics", help="append serial metrics (JSON) to file")
+    args = parser.parse_args()
+
+    link = {"latency": args.latency, "jitter": args.jitter, "baudrate": args.baudrate}
+    print(f"{'operation':32s} {'median ms':>10s} {'p95 ms':>10s}")
+    for benchmark in (
+        benchmark_elliptec,
+        benchmark_esp300,
+        benchmark_maitai,
+        benchmark_newport,
+    ):
+        for name, operation in benchmark(link):
+            median, p95 = time_operation(operation, args.iterations)
+            print(f"{name:32s} {median * 1e3:10.2f} {p95 * 1e3:10.2f}")
+
+    if args.metrics:
+        METRICS.dump(args.metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ general XYZ stage movements. Supports up to 3 axes with individual configuration
 Compatible with PyMoDAQ 5.0+ multi-axis architecture.
 """
 
-from typing import List, Union
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 from pymodaq.control_modules.move_utility_classes import (
@@ -531,8 +531,14 @@ class DAQ_Move_ESP300(DAQ_Move_base):
         # For now, we'll update positions on each get_actuator_value call
         pass
 
-    def _update_status_display(self):
-        """Update status display parameters and notify PyMoDAQ UI."""
+    def _update_status_display(self, positions: Optional[Dict[int, float]] = None):
+        """
+        Update status display parameters and notify PyMoDAQ UI.
+
+        Args:
+            positions: Positions just read by the caller, to avoid a second
+                query of the controller
+        """
         try:
             if not self.controller or not self.controller.is_connected():
                 self.settings.child("status_group", "connection_status").setValue(
@@ -545,7 +551,8 @@ class DAQ_Move_ESP300(DAQ_Move_base):
             )
 
             # Update positions
-            positions = self.controller.get_all_positions()
+            if positions is None:
+                positions = self.controller.get_all_positions()
             for i, (axis_num, position) in enumerate(positions.items(), 1):
                 if i <= 3:  # Only update up to 3 axes in status
                     param_name = f"axis{i}_position"
@@ -593,7 +600,7 @@ class DAQ_Move_ESP300(DAQ_Move_base):
                     position_list.append(positions.get(axis_num, 0.0))
 
                 # Update status display
-                self._update_status_display()
+                self._update_status_display(positions)
 
                 return position_list
             else:
@@ -686,9 +693,17 @@ class DAQ_Move_ESP300(DAQ_Move_base):
                 wait_for_motion = self.settings.child(
                     "motion_group", "wait_motion"
                 ).value()
+                timeout = self.settings.child("motion_group", "motion_timeout").value()
                 if not self.controller.move_multiple_axes(
-                    target_positions, wait=wait_for_motion
+                    target_positions, wait=wait_for_motion, timeout=timeout
                 ):
+                    # An error popped by the status polls during the move
+                    error_code = getattr(self.controller, "last_error", 0)
+                    if error_code:
+                        raise RuntimeError(
+                            "Multi-axis move failed: "
+                            f"{self.controller.describe_error(error_code)}"
+                        )
                     raise RuntimeError("Multi-axis move failed")
 
             else:
@@ -894,12 +909,8 @@ class DAQ_Move_ESP300(DAQ_Move_base):
             if not self.controller or not self.controller.is_connected():
                 return True  # Assume OK if disconnected (mock mode)
 
-            # Check if all axes have completed motion
-            for axis in self.controller.axes.values():
-                if not axis.is_motion_done():
-                    return False
-
-            return True
+            # Check if all axes have completed motion (one batched query)
+            return all(self.controller.get_motion_done().values())
 
         except Exception as e:
             self.emit_status(
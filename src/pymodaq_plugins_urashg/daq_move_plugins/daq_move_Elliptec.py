@@ -125,6 +125,15 @@ class DAQ_Move_Elliptec(DAQ_Move_base):
                     "value": elliptec_config.get("mount_addresses", "2,3,8"),
                     "tip": "Comma-separated Elliptec addresses: HWP_Incident(2), QWP(3), HWP_Analyzer(8)",
                 },
+                {
+                    "title": "Position Cache (s):",
+                    "name": "position_cache_ttl",
+                    "type": "float",
+                    "value": elliptec_config.get("position_cache_ttl", 0.5),
+                    "min": 0.0,
+                    "max": 10.0,
+                    "tip": "Reuse positions younger than this instead of querying idle mounts",
+                },
                 {
                     "title": "Mock Mode:",
                     "name": "mock_mode",
@@ -409,6 +418,9 @@ class DAQ_Move_Elliptec(DAQ_Move_base):
                 )
             elif param.name() == "test_connection":
                 self.test_hardware_connection()
+            elif param.name() == "position_cache_ttl":
+                if self.controller is not None:
+                    self.controller.position_cache_ttl = param.value()
 
             # Axis 1 (HWP Incident) controls
             elif param.name() == "axis1_home":
@@ -481,6 +493,9 @@ class DAQ_Move_Elliptec(DAQ_Move_base):
                 "connection_group", "mount_addresses"
             ).value()
             mock_mode = self.settings.child("connection_group", "mock_mode").value()
+            position_cache_ttl = self.settings.child(
+                "connection_group", "position_cache_ttl"
+            ).value()
 
             # Use existing controller if provided (slave mode)
             if controller is not None:
@@ -493,6 +508,7 @@ class DAQ_Move_Elliptec(DAQ_Move_base):
                     timeout=timeout,
                     mount_addresses=mount_addresses,
                     mock_mode=mock_mode,
+                    position_cache_ttl=position_cache_ttl,
                 )
 
             # Connect to hardware
@@ -560,31 +576,33 @@ class DAQ_Move_Elliptec(DAQ_Move_base):
             for i, pos in enumerate(target_positions):
                 target_positions[i] = self.check_bound(pos)
 
-            # Move all axes individually (no move_absolute_all method exists)
-            success = True
-            for i, pos in enumerate(target_positions):
-                if i < len(self.controller.mount_addresses):
-                    mount_addr = str(self.controller.mount_addresses[i])
-                    if not self.controller.move_absolute(mount_addr, pos):
-                        success = False
-                        self.emit_status(
-                            ThreadCommand(
-                                "Update_Status",
-                                [
-                                    f"Failed to move {self._axis_names[i]} to {pos}°",
-                                    "log",
-                                ],
-                            )
-                        )
+            # Move all mounts together so they rotate in parallel
+            axes = {
+                str(mount_addr): (axis_name, pos)
+                for mount_addr, axis_name, pos in zip(
+                    self.controller.mount_addresses, self._axis_names, target_positions
+                )
+            }
+            results = self.controller.move_absolute_multiple(
+                {addr: pos for addr, (_, pos) in axes.items()}
+            )
+            failed = [
+                f"{axis_name} to {pos}°"
+                for addr, (axis_name, pos) in axes.items()
+                if not results.get(addr, False)
+            ]
 
-            if success:
+            if not failed:
                 self.emit_status(
                     ThreadCommand("Update_Status", ["Move completed", "log"])
                 )
                 self.move_done()  # Signal completion
             else:
                 self.emit_status(
-                    ThreadCommand("Update_Status", ["Some moves failed", "log"])
+                    ThreadCommand(
+                        "Update_Status",
+                        [f"Failed to move {', '.join(failed)}", "log"],
+                    )
                 )
 
         except Exception as e:
@@ -106,6 +106,15 @@ class DAQ_Move_MaiTai(DAQ_Move_base):
                     "max": 10.0,
                     "tip": "Communication timeout in seconds",
                 },
+                {
+                    "title": "Status Poll (s):",
+                    "name": "poll_interval",
+                    "type": "float",
+                    "value": maitai_config.get("poll_interval", 0.0),
+                    "min": 0.0,
+                    "max": 60.0,
+                    "tip": "Background status polling period (0 disables polling)",
+                },
                 {
                     "title": "Mock Mode:",
                     "name": "mock_mode",
@@ -221,6 +230,7 @@ class DAQ_Move_MaiTai(DAQ_Move_base):
                 )
 
                 if self.controller.connect():
+                    self._apply_poll_interval()
                     info = f"MaiTai Laser connected on {port}"
                     self.emit_status(ThreadCommand("close_splash"))
                     self.emit_status(ThreadCommand("Update_Status", [info]))
@@ -255,6 +265,16 @@ class DAQ_Move_MaiTai(DAQ_Move_base):
         max_wl = self.settings.child("bounds_group", "max_position").value()
         return max(min_wl, min(max_wl, wavelength))
 
+    def _apply_poll_interval(self):
+        """Start, retune or stop the controller status poller."""
+        if not hasattr(self.controller, "start_polling"):
+            return
+        interval = self.settings.child("connection_group", "poll_interval").value()
+        if interval > 0:
+            self.controller.start_polling(interval)
+        else:
+            self.controller.stop_polling()
+
     def get_actuator_value(self):
         """Get current wavelength position."""
         try:
@@ -390,6 +410,9 @@ class DAQ_Move_MaiTai(DAQ_Move_base):
             elif param.name() == "target_wavelength":
                 wavelength = param.value()
                 self.move_abs(wavelength)
+            elif param.name() == "poll_interval":
+                if self.controller is not None:
+                    self._apply_poll_interval()
         except Exception as e:
             self.emit_status(
                 ThreadCommand("Update_Status", [f"Error in commit_settings: {e}"])
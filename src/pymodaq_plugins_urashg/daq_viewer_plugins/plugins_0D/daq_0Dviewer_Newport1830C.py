@@ -6,6 +6,8 @@ Updated for PyMoDAQ 5.0+ with DataWithAxes format.
 Provides power measurement capability for URASHG calibration.
 """
 
+import time
+
 import numpy as np
 from pymodaq.control_modules.viewer_utility_classes import (
     DAQ_Viewer_base,
@@ -33,6 +35,8 @@ except ImportError:
         "default_wavelength": 780.0,
         "default_units": "W",
         "averaging_count": 3,
+        "streaming": False,
+        "stream_window": 0.5,
     }
 
 
@@ -140,6 +144,21 @@ class DAQ_0DViewer_Newport1830C(DAQ_Viewer_base):
                     "min": 1,
                     "max": 20,
                 },
+                {
+                    "title": "Streaming:",
+                    "name": "streaming",
+                    "type": "bool",
+                    "value": newport_config.get("streaming", False),
+                    "tip": "Read the power continuously and average over a time window",
+                },
+                {
+                    "title": "Stream Window (s):",
+                    "name": "stream_window",
+                    "type": "float",
+                    "value": newport_config.get("stream_window", 0.5),
+                    "min": 0.01,
+                    "max": 60.0,
+                },
             ],
         },
         # Calibration actions
@@ -217,6 +236,7 @@ class DAQ_0DViewer_Newport1830C(DAQ_Viewer_base):
 
             # Apply measurement settings
             self._apply_measurement_settings()
+            self._apply_streaming()
 
             # Set up data structure
             current_units = self.settings.child("measurement_group", "units").value()
@@ -283,6 +303,15 @@ class DAQ_0DViewer_Newport1830C(DAQ_Viewer_base):
                 ThreadCommand("Update_Status", [f"Error applying settings: {e}"])
             )
 
+    def _apply_streaming(self):
+        """Start or stop the controller's streaming reader."""
+        if not self.controller or not self.controller.is_connected():
+            return
+        if self.settings.child("measurement_group", "streaming").value():
+            self.controller.start_streaming()
+        else:
+            self.controller.stop_streaming()
+
     def close(self):
         """Close connection to power meter."""
         try:
@@ -306,6 +335,10 @@ class DAQ_0DViewer_Newport1830C(DAQ_Viewer_base):
             if not self.controller or not self.controller.is_connected():
                 raise RuntimeError("Power meter not connected")
 
+            if self.controller.is_streaming:
+                self._grab_streamed_data()
+                return
+
             # Get averaging setting
             averaging = self.settings.child("measurement_group", "averaging").value()
             total_readings = max(Naverage, averaging)
@@ -360,6 +393,37 @@ class DAQ_0DViewer_Newport1830C(DAQ_Viewer_base):
             )
             self.dte_signal.emit(DataToExport("Newport1830C_data", data=[zero_data]))
 
+    def _grab_streamed_data(self):
+        """Export the mean and spread of the streamed readings."""
+        window = self.settings.child("measurement_group", "stream_window").value()
+        stats = self.controller.get_stream_statistics(window)
+        if stats is None:
+            # Nothing streamed yet within the window; wait for one window
+            time.sleep(window)
+            stats = self.controller.get_stream_statistics(window)
+        if stats is None:
+            raise RuntimeError("No streamed power readings")
+
+        self.settings.child("status_group", "current_power").setValue(stats["mean"])
+        units = self.settings.child("measurement_group", "units").value()
+        data_export = DataWithAxes(
+            name="Newport1830C_Power",
+            source=DataSource.raw,
+            data=[np.array([stats["mean"]])],
+            labels=["Power"],
+            units=units,
+        )
+        std_export = DataWithAxes(
+            name="Newport1830C_Power_std",
+            source=DataSource.raw,
+            data=[np.array([stats["std"]])],
+            labels=["Power std"],
+            units=units,
+        )
+        self.dte_signal.emit(
+            DataToExport("Newport1830C_data", data=[data_export, std_export])
+        )
+
     def commit_settings(self, param):
         """Handle parameter changes."""
         try:
@@ -376,6 +440,9 @@ class DAQ_0DViewer_Newport1830C(DAQ_Viewer_base):
                     ThreadCommand("Update_Status", [f"Updated {param_name}"])
                 )
 
+            elif param_name == "streaming":
+                self._apply_streaming()
+
             elif param_name == "zero_adjust":
                 self._perform_zero_adjust()
 
@@ -1,3 +1,8 @@
+import queue
+import threading
+import time
+from pathlib import Path
+
 import numpy as np
 from pymodaq.control_modules.viewer_utility_classes import (
     DAQ_Viewer_base,
@@ -9,6 +14,25 @@ from pymodaq_data.data import Axis, DataSource, DataToExport, DataWithAxes
 from pymodaq_gui.parameter import Parameter
 from pymodaq_utils.utils import ThreadCommand
 
+from pymodaq_plugins_urashg.hardware.urashg.calibration import (
+    DARK,
+    FLAT,
+    CalibrationStore,
+    FrameCalibration,
+    default_calibration_dir,
+)
+from pymodaq_plugins_urashg.hardware.urashg.frame_stream import (
+    ContinuousAcquisition,
+    FrameAccumulator,
+    FramePool,
+    PreviewStream,
+)
+from pymodaq_plugins_urashg.hardware.urashg.roi_integration import (
+    RoiIntegrator,
+    parse_rectangles,
+)
+from pymodaq_plugins_urashg.hardware.urashg.shg_scene import default_scene
+
 # Import URASHG configuration
 try:
     from pymodaq_plugins_urashg import get_config
@@ -21,10 +45,14 @@ except ImportError:
         "exposure_default": 50.0,
         "cooling_enabled": True,
         "cooling_temperature": -20,
+        "binning": 1,
+        "roi_enabled": False,
         "roi_x": 0,
         "roi_y": 0,
         "roi_width": 2048,
         "roi_height": 2048,
+        "continuous_acquisition": False,
+        "buffer_frames": 16,
     }
 
 # Try to import PyVCAM and handle the case where it's not installed
@@ -57,6 +85,12 @@ except ImportError as e:
         TEMP_SETPOINT = None
 
 
+# ROI settings programmed into the sensor readout
+READOUT_PARAMS = ("sensor_roi", "roi_x", "roi_y", "roi_width", "roi_height", "binning")
+# Display preview settings, applied without restarting the acquisition
+PREVIEW_PARAMS = ("preview", "preview_factor", "preview_mode", "preview_rate")
+
+
 class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
     """
     PyMoDAQ Plugin for Photometrics Prime BSI and other PVCAM-compatible cameras.
@@ -67,6 +101,16 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
     - Dynamic querying of camera features, including post-processing and advanced parameters.
     - Control over exposure, gain, readout speed, and triggering.
     - Dynamic ROI selection and on-the-fly intensity integration for 0D data export.
+    - ROI-only sensor readout with hardware binning, reporting the achieved
+      frame rate.
+    - Any number of rectangular or mask-defined ROIs integrated per frame and
+      exported together as 1D data.
+    - Continuous acquisition (start_live/poll_frame) into a ring buffer, with
+      frames averaged and emitted by a consumer thread.
+    - Dark and flat-field correction from master frames stored per exposure,
+      readout port, speed, gain and ROI.
+    - A binned or decimated preview for display, rate-limited in continuous
+      mode, while full-resolution frames are only saved.
     """
 
     params = comon_parameters + [
@@ -106,6 +150,23 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
                     "suffix": "ms",
                     "tip": "Camera exposure time in milliseconds",
                 },
+                {
+                    "title": "Continuous Acquisition",
+                    "name": "continuous",
+                    "type": "bool",
+                    "value": camera_config.get("continuous_acquisition", False),
+                    "tip": "Stream frames at the sensor rate instead of one "
+                    "get_frame call per grab",
+                },
+                {
+                    "title": "Buffer Frames:",
+                    "name": "buffer_frames",
+                    "type": "int",
+                    "value": camera_config.get("buffer_frames", 16),
+                    "min": 2,
+                    "max": 1024,
+                    "tip": "Frames kept in the continuous acquisition ring buffer",
+                },
                 {
                     "title": "Readout Port:",
                     "name": "readout_port",
@@ -152,6 +213,14 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
                     "type": "float",
                     "readonly": True,
                 },
+                {
+                    "title": "Frame Rate (Hz):",
+                    "name": "frame_rate",
+                    "type": "float",
+                    "value": 0.0,
+                    "readonly": True,
+                    "tip": "Achieved acquisition frame rate",
+                },
                 {
                     "title": "Temp. Setpoint (°C):",
                     "name": "temperature_setpoint",
@@ -187,6 +256,157 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
                     "type": "bool",
                     "value": True,
                 },
+                {
+                    "title": "Sensor ROI Readout",
+                    "name": "sensor_roi",
+                    "type": "bool",
+                    "value": camera_config.get("roi_enabled", False),
+                    "tip": "Read out only the region below from the sensor",
+                },
+                {
+                    "title": "ROI X:",
+                    "name": "roi_x",
+                    "type": "int",
+                    "value": camera_config.get("roi_x", 0),
+                    "min": 0,
+                },
+                {
+                    "title": "ROI Y:",
+                    "name": "roi_y",
+                    "type": "int",
+                    "value": camera_config.get("roi_y", 0),
+                    "min": 0,
+                },
+                {
+                    "title": "ROI Width:",
+                    "name": "roi_width",
+                    "type": "int",
+                    "value": camera_config.get("roi_width", 2048),
+                    "min": 1,
+                },
+                {
+                    "title": "ROI Height:",
+                    "name": "roi_height",
+                    "type": "int",
+                    "value": camera_config.get("roi_height", 2048),
+                    "min": 1,
+                },
+                {
+                    "title": "Binning:",
+                    "name": "binning",
+                    "type": "list",
+                    "limits": [1, 2, 4],
+                    "value": camera_config.get("binning", 1),
+                    "tip": "On-chip binning, applied to both axes",
+                },
+                {
+                    "title": "ROIs (y, h, x, w):",
+                    "name": "rois",
+                    "type": "text",
+                    "value": "",
+                    "tip": "Rectangular ROIs, one 'y, height, x, width' per line",
+                },
+                {
+                    "title": "ROI Mask File:",
+                    "name": "roi_mask_file",
+                    "type": "browsepath",
+                    "value": "",
+                    "filetype": True,
+                    "tip": ".npy label image (one ROI per non-zero label) or "
+                    "stack of boolean masks",
+                },
+            ],
+        },
+        {
+            "title": "Calibration",
+            "name": "calibration",
+            "type": "group",
+            "children": [
+                {
+                    "title": "Dark Correction",
+                    "name": "dark_correction",
+                    "type": "bool",
+                    "value": False,
+                    "tip": "Subtract the master dark taken with the current settings",
+                },
+                {
+                    "title": "Flat Correction",
+                    "name": "flat_correction",
+                    "type": "bool",
+                    "value": False,
+                    "tip": "Divide by the normalized master flat of the current "
+                    "readout settings",
+                },
+                {
+                    "title": "Calibration Frames:",
+                    "name": "calibration_frames",
+                    "type": "int",
+                    "value": 16,
+                    "min": 1,
+                    "max": 1024,
+                    "tip": "Frames averaged into a master dark or flat",
+                },
+                {
+                    "title": "Acquire Dark:",
+                    "name": "acquire_dark",
+                    "type": "action",
+                },
+                {
+                    "title": "Acquire Flat:",
+                    "name": "acquire_flat",
+                    "type": "action",
+                },
+                {
+                    "title": "Calibration Directory:",
+                    "name": "calibration_dir",
+                    "type": "browsepath",
+                    "value": "",
+                    "tip": "Where master frames are stored (default: PyMoDAQ "
+                    "local directory)",
+                },
+            ],
+        },
+        {
+            "title": "Preview",
+            "name": "preview_settings",
+            "type": "group",
+            "children": [
+                {
+                    "title": "Display Preview",
+                    "name": "preview",
+                    "type": "bool",
+                    "value": False,
+                    "tip": "Display a reduced frame; full-resolution frames are "
+                    "saved but not displayed",
+                },
+                {
+                    "title": "Reduction Factor:",
+                    "name": "preview_factor",
+                    "type": "int",
+                    "value": 4,
+                    "min": 1,
+                    "max": 32,
+                    "tip": "Preview pixels per frame pixel, along each axis",
+                },
+                {
+                    "title": "Reduction:",
+                    "name": "preview_mode",
+                    "type": "list",
+                    "limits": ["bin", "decimate"],
+                    "value": "bin",
+                    "tip": "Average each block of pixels or keep one of them",
+                },
+                {
+                    "title": "Preview Rate (Hz):",
+                    "name": "preview_rate",
+                    "type": "float",
+                    "value": 30.0,
+                    "min": 0.1,
+                    "max": 240.0,
+                    "suffix": "Hz",
+                    "tip": "Maximum preview updates per second in continuous "
+                    "acquisition, e.g. the display refresh rate",
+                },
             ],
         },
     ]
@@ -199,6 +419,16 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
         self.camera: Camera = None
         self.x_axis = None
         self.y_axis = None
+        self._acquisition: ContinuousAcquisition = None
+        self._grab_requests = queue.Queue()
+        self._consumer: threading.Thread = None
+        self._frame_pools = {}
+        self._roi_integrator: RoiIntegrator = None
+        self._calibration_store: CalibrationStore = None
+        self._calibration = None
+        # Programmed readout: (x, y, width, height, binning) in sensor pixels
+        self._readout = None
+        self._preview = PreviewStream()
 
     def ini_detector(self, controller=None):
         """Initialize the camera - PyMoDAQ 5.x standard method"""
@@ -222,14 +452,37 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
                 self.camera.exp_modes = {"Internal Trigger": 1792}
                 self.camera.clear_modes = {"Auto": 0}
 
-                # Mock methods
-                self.camera.get_frame = Mock(
-                    return_value=np.random.randint(
-                        0, 4096, (2048, 2048), dtype=np.uint16
-                    )
-                )
+                # Mock methods render a synthetic SHG scene that follows the
+                # mock Elliptec angles and MaiTai wavelength
+                scene = default_scene(self.camera.sensor_size)
+
+                def read_out(frame):
+                    # What the sensor would read out with the programmed ROI
+                    if self._readout is None:
+                        return frame
+                    x, y, width, height, binning = self._readout
+                    frame = frame[y : y + height, x : x + width]
+                    if binning > 1:
+                        frame = frame.reshape(
+                            height // binning, binning, width // binning, binning
+                        ).sum(axis=(1, 3))
+                        frame = np.minimum(frame, 65535).astype(np.uint16)
+                    return frame
+
+                def get_frame(exp_time=None):
+                    return read_out(scene.render(exp_time)).ravel()
+
+                self.camera.get_frame = Mock(side_effect=get_frame)
                 self.camera.close = Mock()
 
+                def poll_frame(timeout_ms=None, oldestFrame=True, copyData=True):
+                    exposure = self.settings.child("camera_settings", "exposure")
+                    time.sleep(exposure.value() / 1000.0)
+                    frame = read_out(scene.render(exposure.value()))
+                    return {"pixel_data": frame}, 1000.0 / exposure.value(), 0
+
+                self.camera.poll_frame = Mock(side_effect=poll_frame)
+
                 # Set camera parameters in GUI
                 self.settings.child("camera_settings", "camera_name").setValue(
                     "pvcamUSB_0 (Mock)"
@@ -241,6 +494,7 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
                 # Generate mock axes
                 self.x_axis = Axis(label="x", units="pixels", data=np.arange(2048))
                 self.y_axis = Axis(label="y", units="pixels", data=np.arange(2048))
+                self._apply_readout()
 
                 self.status.update(msg="Mock camera initialized", busy=False)
                 self.initialized = True
@@ -275,6 +529,7 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
             self.update_camera_params()
             self.populate_advanced_params()
             self.populate_post_processing_params()
+            self._apply_readout()
 
             self.status.update(
                 msg=f"Camera {self.camera.name} Initialized.", busy=False
@@ -461,6 +716,7 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
 
     def close(self):
         """Closes the camera connection and uninitializes the PVCAM library."""
+        self._stop_continuous()
         try:
             if (
                 self.camera is not None
@@ -479,6 +735,19 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
 
     def commit_settings(self, param: Parameter):
         """Applies a changed setting to the camera hardware."""
+        if param.name() in ("rois", "roi_mask_file"):
+            self._roi_integrator = None  # Rebuilt on the next frame
+            return
+        if param.name() in ("dark_correction", "flat_correction", "calibration_dir"):
+            self._calibration = None  # Reloaded on the next frame
+            return
+        if param.name() in PREVIEW_PARAMS:
+            self._update_preview()
+            return
+        if param.name() != "roi_integration":
+            # PVCAM settings cannot change during an acquisition; the next
+            # grab restarts it with the new settings
+            self._stop_continuous()
         try:
             # Handle standard camera settings
             if param.name() == "exposure":
@@ -515,6 +784,12 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
                 self.camera.clear_mode = self.camera.clear_modes[param.value()]
             elif param.name() == "temperature_setpoint":
                 self.camera.temp_setpoint = param.value()
+            elif param.name() in READOUT_PARAMS:
+                self._apply_readout()
+            elif param.name() == "acquire_dark":
+                self._acquire_master(DARK)
+            elif param.name() == "acquire_flat":
+                self._acquire_master(FLAT)
 
             # Handle dynamically generated parameters
             value = param.value()
@@ -533,8 +808,55 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
                 )
             )
 
+    def _apply_readout(self):
+        """
+        Programs the sensor readout region and binning from the ROI settings,
+        so only that region is read out, and regenerates the axes to match.
+        """
+        roi_settings = self.settings.child("roi_settings")
+        width, height = self.camera.sensor_size  # (serial, parallel) pixels
+        binning = int(roi_settings.child("binning").value())
+        if roi_settings.child("sensor_roi").value():
+            x = min(roi_settings.child("roi_x").value(), width - 1)
+            y = min(roi_settings.child("roi_y").value(), height - 1)
+            w = min(roi_settings.child("roi_width").value(), width - x)
+            h = min(roi_settings.child("roi_height").value(), height - y)
+        else:
+            x, y, w, h = 0, 0, width, height
+        # Whole binned pixels only
+        w, h = w - w % binning, h - h % binning
+        if w == 0 or h == 0:
+            raise ValueError(f"ROI is smaller than the {binning}x{binning} binning")
+
+        self.camera.binning = (binning, binning)
+        self.camera.reset_rois()
+        if (x, y, w, h) != (0, 0, width, height):
+            self.camera.set_roi(x, y, w, h)
+        self._readout = (x, y, w, h, binning)
+        self.x_axis = self.get_xaxis()
+        self.y_axis = self.get_yaxis()
+
+    def _frame_shape(self):
+        """Shape of the frames read out with the current settings."""
+        if self._readout is not None:
+            _, _, width, height, binning = self._readout
+            return (height // binning, width // binning)
+        if hasattr(self.camera, "rois") and self.camera.rois:
+            return self.camera.rois[0].shape
+        # Fallback to sensor size
+        return self.camera.sensor_size
+
+    def _show_frame_rate(self, rate):
+        """Reports the achieved frame rate in the settings."""
+        self.settings.child("camera_settings", "frame_rate").setValue(round(rate, 1))
+
     def get_xaxis(self):
         """Get the x_axis from the camera sensor size."""
+        if self._readout is not None:
+            # Sensor column at the center of each (binned) pixel
+            x, _, width, _, binning = self._readout
+            data = x + binning * np.arange(width // binning) + (binning - 1) / 2
+            return Axis(label="x", units="pixels", data=data, index=1)
         if self.camera and self.camera.rois:
             roi = self.camera.rois[0]
             return Axis(data=np.arange(roi.shape[1]), label="Pixels")
@@ -542,6 +864,10 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
 
     def get_yaxis(self):
         """Get the y_axis from the camera sensor size."""
+        if self._readout is not None:
+            _, y, _, height, binning = self._readout
+            data = y + binning * np.arange(height // binning) + (binning - 1) / 2
+            return Axis(label="y", units="pixels", data=data, index=0)
         if self.camera and self.camera.rois:
             roi = self.camera.rois[0]
             return Axis(data=np.arange(roi.shape[0]), label="Pixels")
@@ -549,6 +875,10 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
 
     def get_roi_bounds(self):
         """Get ROI bounds for integration. Returns None if no ROI is set."""
+        if self._readout is not None:
+            # The frame holds exactly the region read out
+            height, width = self._frame_shape()
+            return (0, height, 0, width)
         if self.camera and self.camera.rois:
             roi = self.camera.rois[0]
             # ROI bounds: (start_row, height, start_col, width)
@@ -557,62 +887,371 @@ class DAQ_2DViewer_PrimeBSI(DAQ_Viewer_base):
 
     def grab_data(self, Naverage=1, **kwargs):
         """
-        Acquires a single frame from the camera and emits the data.
-        Performs ROI integration if enabled.
+        Acquires a frame (or the average of Naverage frames in continuous mode)
+        and emits the data. Performs ROI integration if enabled.
         """
         try:
             self.settings.child("camera_settings", "camera_name").setValue(
                 self.camera.name
             )
 
-            # Get frame from camera
-            raw_frame = self.camera.get_frame(
-                exp_time=self.settings.child("camera_settings", "exposure").value()
-            )
+            if self.settings.child("camera_settings", "continuous").value():
+                self._grab_continuous(Naverage)
+                if self._acquisition is not None and self._acquisition.fps:
+                    self._show_frame_rate(self._acquisition.fps)
+                return
 
-            # Reshape to proper 2D array
-            if hasattr(self.camera, "rois") and self.camera.rois:
-                frame = raw_frame.reshape(self.camera.rois[0].shape)
-            else:
-                # Fallback to sensor size
-                frame = raw_frame.reshape(self.camera.sensor_size)
-
-            # PyMoDAQ 5.0+ data structure - ensure frame is 2D numpy array
-            dwa_2d = DataWithAxes(
-                name="PrimeBSI",
-                source=DataSource.raw,
-                data=[frame],  # Must be a list containing 2D numpy arrays
-                axes=[self.y_axis, self.x_axis],
+            start = time.perf_counter()
+            frame = self._read_frame()
+            self._show_frame_rate(1.0 / max(time.perf_counter() - start, 1e-6))
+            self._emit_frame(frame)
+
+        except Exception as e:
+            self.emit_status(
+                ThreadCommand("Acquisition Error", [f"Failed to grab data: {str(e)}"])
             )
-            data_to_emit = [dwa_2d]
-
-            if self.settings.child("roi_settings", "roi_integration").value():
-                roi_bounds = self.get_roi_bounds()
-                if roi_bounds:
-                    y, h, x, w = roi_bounds
-                    roi_frame = frame[y : y + h, x : x + w]
-                    integrated_signal = np.sum(roi_frame, dtype=np.float64)
-                    # PyMoDAQ 5.0+ 0D data structure
-                    dwa_0d = DataWithAxes(
-                        name="SHG Signal",
+
+    def _read_frame(self):
+        """Acquires one frame with get_frame, as a 2D array."""
+        raw_frame = self.camera.get_frame(
+            exp_time=self.settings.child("camera_settings", "exposure").value()
+        )
+        # Reshape to proper 2D array
+        return raw_frame.reshape(self._frame_shape())
+
+    def _emit_frame(self, frame):
+        """
+        Emits a 2D frame, dark/flat corrected if enabled, plus its integrated
+        ROI signals if enabled.
+        """
+        frame = self._calibrate(frame)
+
+        # PyMoDAQ 5.0+ data structure - ensure frame is 2D numpy array
+        dwa_2d = DataWithAxes(
+            name="PrimeBSI",
+            source=DataSource.raw,
+            data=[frame],  # Must be a list containing 2D numpy arrays
+            axes=[self.y_axis, self.x_axis],
+        )
+        data_to_emit = [dwa_2d]
+
+        if self.settings.child("preview_settings", "preview").value():
+            # Viewers show the preview; full-resolution frames are only saved
+            dwa_2d.add_extra_attribute(do_plot=False)
+            data_to_emit.append(self._preview_data(frame))
+
+        if self.settings.child("roi_settings", "roi_integration").value():
+            roi_bounds = self.get_roi_bounds()
+            if roi_bounds:
+                y, h, x, w = roi_bounds
+                roi_frame = frame[y : y + h, x : x + w]
+                integrated_signal = np.sum(roi_frame, dtype=np.float64)
+                # PyMoDAQ 5.0+ 0D data structure
+                dwa_0d = DataWithAxes(
+                    name="SHG Signal",
+                    source=DataSource.calculated,
+                    data=[np.array([integrated_signal])],
+                )
+                data_to_emit.append(dwa_0d)
+
+            integrator = self._get_roi_integrator()
+            if len(integrator):
+                data_to_emit.append(
+                    DataWithAxes(
+                        name="ROI Signals",
                         source=DataSource.calculated,
-                        data=[np.array([integrated_signal])],
+                        data=[integrator.integrate(frame)],
+                        axes=[
+                            Axis(label="ROI", data=np.arange(len(integrator)), index=0)
+                        ],
                     )
-                    data_to_emit.append(dwa_0d)
+                )
 
-            # PyMoDAQ 5.0+ signal emission
-            dte = DataToExport(name="PrimeBSI_Data", data=data_to_emit)
-            self.dte_signal.emit(dte)
+        # PyMoDAQ 5.0+ signal emission
+        dte = DataToExport(name="PrimeBSI_Data", data=data_to_emit)
+        self.dte_signal.emit(dte)
+
+    def _update_preview(self):
+        """Applies the preview settings, starting or stopping its thread."""
+        preview_settings = self.settings.child("preview_settings")
+        self._preview.factor = preview_settings.child("preview_factor").value()
+        self._preview.mode = preview_settings.child("preview_mode").value()
+        self._preview.rate = preview_settings.child("preview_rate").value()
+        self._preview.latest = None  # Outdated by the new settings
+        if not preview_settings.child("preview").value():
+            self._preview.stop()
+        elif self._acquisition is not None and self._acquisition.is_running:
+            self._preview.start()
+
+    def _preview_data(self, frame):
+        """
+        Returns the display preview of a frame, excluded from saving.
 
-        except Exception as e:
-            self.emit_status(
-                ThreadCommand("Acquisition Error", [f"Failed to grab data: {str(e)}"])
+        While streaming, the frame is handed to the preview thread and the
+        newest preview is shown, so frames arriving faster than the preview
+        rate are never reduced; single grabs are reduced right away.
+        """
+        factor = self._preview.factor
+        shape = (frame.shape[0] // factor, frame.shape[1] // factor)
+        preview = None
+        if self._preview.is_running:
+            self._preview.submit(frame)
+            preview = self._preview.latest
+        if preview is None or preview.shape != shape:
+            preview = self._preview.reduce(frame)
+            self._preview.latest = preview
+        return DataWithAxes(
+            name="PrimeBSI Preview",
+            source=DataSource.calculated,
+            data=[preview],
+            axes=[
+                self._preview_axis(self.y_axis, "y", shape[0], 0),
+                self._preview_axis(self.x_axis, "x", shape[1], 1),
+            ],
+            do_save=False,
+        )
+
+    def _preview_axis(self, axis, label, size, index):
+        """Frame axis reduced like the preview: block centers or kept pixels."""
+        factor = self._preview.factor
+        data = axis.get_data() if axis is not None else None
+        if data is None or len(data) < size * factor:
+            data = np.arange(size * factor, dtype=float)
+        blocks = np.asarray(data[: size * factor], dtype=float).reshape(size, factor)
+        data = blocks[:, 0] if self._preview.mode == "decimate" else blocks.mean(1)
+        return Axis(label=label, units="pixels", data=data, index=index)
+
+    def _calibration_settings(self, shape):
+        """Camera settings a master dark or flat frame is keyed by."""
+        camera_settings = self.settings.child("camera_settings")
+        return {
+            "camera": self.camera.name,
+            "exposure": camera_settings.child("exposure").value(),
+            "readout_port": camera_settings.child("readout_port").value(),
+            "speed": camera_settings.child("speed_index").value(),
+            "gain": camera_settings.child("gain").value(),
+            "roi": self._readout or self.get_roi_bounds(),
+            "shape": list(shape),
+        }
+
+    def _get_calibration_store(self):
+        """Returns the master frame store of the configured directory."""
+        directory = self.settings.child("calibration", "calibration_dir").value()
+        directory = Path(directory) if directory else default_calibration_dir()
+        if (
+            self._calibration_store is None
+            or self._calibration_store.directory != directory
+        ):
+            self._calibration_store = CalibrationStore(directory)
+        return self._calibration_store
+
+    def _get_calibration(self, shape):
+        """
+        Returns the FrameCalibration for the current settings, or None.
+
+        Masters are looked up again only when a setting they depend on
+        changes; switching back to earlier settings reuses the masters the
+        store keeps in memory.
+        """
+        calibration = self.settings.child("calibration")
+        use_dark = calibration.child("dark_correction").value()
+        use_flat = calibration.child("flat_correction").value()
+        if not (use_dark or use_flat):
+            return None
+
+        key = (use_dark, use_flat, self._calibration_settings(shape))
+        if self._calibration is None or self._calibration[0] != key:
+            settings = key[2]
+            store = self._get_calibration_store()
+            dark = store.get(DARK, settings) if use_dark else None
+            flat = store.get(FLAT, settings) if use_flat else None
+            missing = [
+                kind
+                for kind, used, master in (
+                    (DARK, use_dark, dark),
+                    (FLAT, use_flat, flat),
+                )
+                if used and master is None
+            ]
+            if missing:
+                self.emit_status(
+                    ThreadCommand(
+                        "Update_Status",
+                        [f"No master {' or '.join(missing)} for the current settings"],
+                    )
+                )
+            corrector = None
+            if dark is not None or flat is not None:
+                try:
+                    corrector = FrameCalibration(dark, flat)
+                except ValueError as e:
+                    self.emit_status(
+                        ThreadCommand("Update_Status", [f"Invalid calibration: {e}"])
+                    )
+            self._calibration = (key, corrector)
+        return self._calibration[1]
+
+    def _calibrate(self, frame):
+        """
+        Applies the dark/flat correction: in place for float frames (averages),
+        into a pooled float32 frame otherwise.
+        """
+        calibration = self._get_calibration(frame.shape)
+        if calibration is None:
+            return frame
+        if np.issubdtype(frame.dtype, np.floating):
+            return calibration.apply(frame, out=frame)
+        return calibration.apply(frame, out=self._pooled_frame(frame.shape, np.float32))
+
+    def _acquire_master(self, kind):
+        """Averages calibration frames into a master dark or flat and stores it."""
+        count = self.settings.child("calibration", "calibration_frames").value()
+        self.emit_status(
+            ThreadCommand(
+                "Update_Status", [f"Acquiring master {kind} ({count} frames)..."]
+            )
+        )
+        accumulator = FrameAccumulator()
+        for _ in range(count):
+            accumulator.add(self._read_frame())
+        master = accumulator.mean()
+
+        settings = self._calibration_settings(master.shape)
+        store = self._get_calibration_store()
+        if kind == FLAT:
+            # Flats are stored dark subtracted
+            dark = store.get(DARK, settings)
+            if dark is not None:
+                master -= dark
+        store.put(kind, settings, master)
+        self._calibration = None
+        self.emit_status(
+            ThreadCommand(
+                "Update_Status", [f"Master {kind} stored in {store.directory}"]
             )
+        )
+
+    def _get_roi_integrator(self):
+        """Returns the multi-ROI integrator, built from the ROI settings."""
+        if self._roi_integrator is None:
+            roi_settings = self.settings.child("roi_settings")
+            try:
+                rectangles = parse_rectangles(roi_settings.child("rois").value())
+                mask_file = roi_settings.child("roi_mask_file").value()
+                masks = np.load(mask_file) if mask_file else None
+                self._roi_integrator = RoiIntegrator(rectangles, masks)
+            except (OSError, ValueError) as e:
+                self.emit_status(
+                    ThreadCommand("Update_Status", [f"Invalid ROIs: {str(e)}"])
+                )
+                self._roi_integrator = RoiIntegrator()
+        return self._roi_integrator
+
+    def _grab_continuous(self, Naverage):
+        """Queues a grab for the consumer thread, starting the stream if needed."""
+        if self._acquisition is None or not self._acquisition.is_running:
+            self._start_continuous()
+        self._grab_requests.put(max(int(Naverage), 1))
+
+    def _start_continuous(self):
+        """Starts the continuous acquisition and its consumer thread."""
+        self._stop_continuous()
+        camera_settings = self.settings.child("camera_settings")
+        self._acquisition = ContinuousAcquisition(
+            self.camera,
+            exposure=camera_settings.child("exposure").value(),
+            buffer_frames=camera_settings.child("buffer_frames").value(),
+        )
+        self._acquisition.start()
+        if self.settings.child("preview_settings", "preview").value():
+            self._preview.start()
+        self._consumer = threading.Thread(
+            target=self._consume_frames,
+            args=(self._acquisition,),
+            name="PrimeBSIConsumer",
+            daemon=True,
+        )
+        self._consumer.start()
+
+    def _stop_continuous(self):
+        """Stops the continuous acquisition and its consumer thread."""
+        if self._acquisition is not None:
+            # Also wakes up the consumer if it waits for frames
+            self._acquisition.stop()
+            self._acquisition = None
+        if self._consumer is not None:
+            self._grab_requests.put(None)
+            self._consumer.join(timeout=5.0)
+            self._consumer = None
+        self._preview.stop()
+        # Drop grabs that were never served
+        while not self._grab_requests.empty():
+            self._grab_requests.get_nowait()
+
+    def _consume_frames(self, acquisition):
+        """Serves grab requests with fresh frames from the ring buffer."""
+        buffer = acquisition.buffer
+        accumulator = FrameAccumulator()
+        while True:
+            naverage = self._grab_requests.get()
+            if naverage is None:
+                return
+            # Only frames exposed after the grab was requested count
+            first = buffer.count
+            timeout = acquisition.frame_timeout(naverage)
+            frame = None
+            if naverage == 1:
+                if buffer.wait(first, timeout) >= 0:
+                    frame = buffer.average(
+                        first,
+                        1,
+                        timeout,
+                        out=self._pooled_frame(
+                            buffer.frames.shape[1:], buffer.frames.dtype
+                        ),
+                    )
+            else:
+                # Fold frames in as they arrive, summed exactly in integers
+                accumulator.reset()
+                if accumulator.accumulate(buffer, first, naverage, timeout) == naverage:
+                    frame = accumulator.mean(
+                        out=self._pooled_frame(accumulator.shape, np.float64)
+                    )
+            if frame is None:
+                if buffer.closed:
+                    continue  # Stopped
+                error = acquisition.error or "no frame received"
+                self.emit_status(
+                    ThreadCommand(
+                        "Acquisition Error", [f"Failed to grab data: {error}"]
+                    )
+                )
+                continue
+            try:
+                self._emit_frame(frame)
+            except Exception as e:
+                self.emit_status(
+                    ThreadCommand(
+                        "Acquisition Error", [f"Failed to grab data: {str(e)}"]
+                    )
+                )
+
+    def _pooled_frame(self, shape, dtype):
+        """
+        Returns a recycled frame buffer of the given shape and dtype.
+
+        The buffer returns to its pool once the emitted data and every view of
+        it have been released downstream, so streaming allocates no frames.
+        """
+        pool = self._frame_pools.get(np.dtype(dtype))
+        if pool is None or not pool.matches(shape, dtype):
+            pool = self._frame_pools[np.dtype(dtype)] = FramePool(shape, dtype)
+        return pool.acquire()
 
     def stop(self):
         """Stops any ongoing acquisition."""
         try:
-            pass
+            self._stop_continuous()
         except Exception as e:
             self.emit_status(
                 ThreadCommand("Stop Error", [f"Error stopping acquisition: {str(e)}"])
@@ -14,6 +14,8 @@ from typing import Dict, List, Optional, Tuple
 from pymodaq_utils.logger import get_module_name, set_logger
 from qtpy.QtCore import QObject, Signal
 
+from pymodaq_plugins_urashg.hardware.urashg.frame_stream import FrameAccumulator
+
 logger = set_logger(get_module_name(__file__))
 
 
@@ -563,14 +565,12 @@ class URASHGDeviceManager(QObject):
                 elliptec.move_abs(position_data)
                 logger.debug(f"Coordinated movement initiated: {position_list}")
 
-                # Wait for completion with timeout
-                start_time = time.time()
-                while time.time() - start_time < timeout:
-                    # For now, assume movement completes after reasonable time
-                    # Real implementation would check device status
-                    time.sleep(0.1)
-                    if time.time() - start_time > 3.0:  # Minimum movement time
-                        break
+                # Wait until the mounts report the move complete
+                controller = getattr(elliptec, "controller", None)
+                if controller is not None and hasattr(controller, "wait_until_settled"):
+                    if not controller.wait_until_settled(timeout=timeout):
+                        logger.error("Polarization elements did not settle in time")
+                        return False
 
                 logger.info("Coordinated polarization movement completed")
                 return True
@@ -603,8 +603,9 @@ class URASHGDeviceManager(QObject):
                 logger.error("Camera not available for synchronized acquisition")
                 return None
 
-            # Acquire multiple images for averaging
-            images = []
+            # Fold images into a running sum instead of keeping them all
+            accumulator = FrameAccumulator()
+            image = None
             power_readings = []
 
             for avg in range(averages):
@@ -613,7 +614,8 @@ class URASHGDeviceManager(QObject):
                 if camera_data and len(camera_data) > 0:
                     data_item = camera_data[0]
                     if hasattr(data_item, "data") and len(data_item.data) > 0:
-                        images.append(data_item.data[0])
+                        image = data_item.data[0]
+                        accumulator.add(image)
 
                 # Acquire power reading if available
                 if power_meter:
@@ -634,14 +636,14 @@ class URASHGDeviceManager(QObject):
                 if avg < averages - 1:
                     time.sleep(0.01)
 
-            if not images:
+            if accumulator.count == 0:
                 logger.error("No camera images acquired")
                 return None
 
             # Average the data
             import numpy as np
 
-            averaged_image = np.mean(images, axis=0) if len(images) > 1 else images[0]
+            averaged_image = accumulator.mean() if accumulator.count > 1 else image
             averaged_power = np.mean(power_readings) if power_readings else None
 
             # Calculate total intensity
@@ -651,7 +653,7 @@ class URASHGDeviceManager(QObject):
                 "image": averaged_image,
                 "intensity": total_intensity,
                 "power": averaged_power,
-                "n_averages": len(images),
+                "n_averages": accumulator.count,
                 "n_power_readings": len(power_readings),
             }
 
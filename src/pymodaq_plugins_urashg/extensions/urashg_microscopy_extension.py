@@ -123,18 +123,25 @@ class MeasurementWorker(QThread):
 
         # Polarization sweep
         angles = np.linspace(0, 180, pol_steps)
+        trajectory = self._compile_polarization_sweep(elliptec, angles)
 
         for i, angle in enumerate(angles):
             if not self.measurement_active:
                 break
 
             # Move HWP incident polarizer (axis 0)
-            hwp_positions = [angle, 0, 0]  # Only move first axis
-            position_data = DataActuator(data=[np.array(hwp_positions)])
-            elliptec.move_abs(position_data)
-
-            # Wait for movement completion
-            time.sleep(0.5)
+            if trajectory is not None:
+                elliptec.controller.run_trajectory_step(trajectory, i, wait=False)
+            else:
+                hwp_positions = [angle, 0, 0]  # Only move first axis
+                position_data = DataActuator(data=[np.array(hwp_positions)])
+                elliptec.move_abs(position_data)
+
+            # Wait until the mounts report the move complete
+            if not self._wait_for_polarization(elliptec):
+                self.status_message.emit(
+                    f"Rotation mounts did not settle at {angle:.1f}°", "warning"
+                )
 
             # Set camera exposure
             if hasattr(camera, "settings"):
@@ -157,6 +164,53 @@ class MeasurementWorker(QThread):
 
         self.status_message.emit("Basic RASHG measurement completed", "info")
 
+    def _compile_polarization_sweep(self, elliptec, angles):
+        """
+        Precompile the HWP sweep for replay on the Elliptec controller.
+
+        Returns None when the actuator does not expose a controller that
+        supports trajectories; the sweep then goes through ``move_abs``.
+        """
+        controller = getattr(elliptec, "controller", None)
+        if not hasattr(controller, "compile_trajectory"):
+            return None
+
+        if hasattr(elliptec, "check_bound"):
+            angles = np.array([elliptec.check_bound(angle) for angle in angles])
+        steps = np.zeros((len(angles), len(controller.mount_addresses)))
+        steps[:, 0] = angles  # Only move first axis
+        return controller.compile_trajectory(steps)
+
+    def _wait_for_polarization(self, elliptec) -> bool:
+        """Wait for the Elliptec mounts to finish moving."""
+        controller = getattr(elliptec, "controller", None)
+        if controller is None or not hasattr(controller, "wait_until_settled"):
+            return True
+        timeout = self.measurement_params.get("movement_timeout", 10.0)
+        return controller.wait_until_settled(timeout=timeout)
+
+    def _tune_laser(self, laser, wavelength):
+        """
+        Tune the laser and wait until the wavelength has settled.
+
+        Returns the settle time in seconds, or None if the laser did not
+        settle. Falls back to ``move_abs`` and a fixed wait when the
+        controller cannot report settling.
+        """
+        controller = getattr(laser, "controller", None)
+        if not hasattr(controller, "tune_and_wait"):
+            laser.move_abs(DataActuator(data=[wavelength]))
+            time.sleep(2.0)
+            return 2.0
+
+        if hasattr(laser, "check_bound"):
+            wavelength = laser.check_bound(wavelength)
+        return controller.tune_and_wait(
+            float(wavelength),
+            tolerance=self.measurement_params.get("wavelength_tolerance", 0.5),
+            timeout=self.measurement_params.get("wavelength_timeout", 30.0),
+        )
+
     def _run_multiwavelength_rashg(self):
         """Execute multi-wavelength RASHG scan."""
         wavelength_start = self.measurement_params.get("wavelength_start", 780)
@@ -176,12 +230,12 @@ class MeasurementWorker(QThread):
             if not self.measurement_active:
                 break
 
-            # Set laser wavelength
-            wavelength_data = DataActuator(data=[wavelength])
-            laser.move_abs(wavelength_data)
-
-            # Wait for wavelength stabilization
-            time.sleep(2.0)
+            # Set laser wavelength and wait for it to stabilize
+            settle_time = self._tune_laser(laser, wavelength)
+            if settle_time is None:
+                self.status_message.emit(
+                    f"Laser did not settle at {wavelength} nm", "warning"
+                )
 
             # Run basic RASHG at this wavelength
             self._run_basic_rashg()
@@ -895,7 +949,9 @@ class URASHGMicroscopyExtension(gutils.CustomApp):
         """Create mock devices for GUI testing."""
         from unittest.mock import Mock
         import numpy as np
-        
+
+        from pymodaq_plugins_urashg.hardware.urashg.shg_scene import default_scene
+
         self.log_message("Creating mock Elliptec controller...", "info")
         mock_elliptec = Mock()
         mock_elliptec.move_home = Mock()
@@ -912,13 +968,8 @@ class URASHGMicroscopyExtension(gutils.CustomApp):
         self.log_message("Creating mock PrimeBSI camera...", "info")
         mock_camera = Mock()
         mock_camera.grab_data = Mock()
-        # Generate mock SHG camera data
-        x = np.linspace(-20, 20, 100)
-        y = np.linspace(-20, 20, 100)
-        X, Y = np.meshgrid(x, y)
-        # Simulated SHG pattern with some structure
-        mock_data = np.exp(-(X**2 + Y**2)/50) * (1 + 0.3 * np.sin(X/2) * np.cos(Y/2)) + 0.1 * np.random.random((100, 100))
-        mock_camera._mock_data = mock_data
+        # Synthetic SHG flakes at the current mock polarization and wavelength
+        mock_camera._mock_data = default_scene((100, 100)).render(100.0)
         self._detectors_2d["PrimeBSI_SHG_Camera"] = mock_camera
         
         self.log_message("Creating mock Newport power meter...", "info") 
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+Dark and flat-field calibration of camera frames.
+
+CalibrationStore keeps master dark and flat frames on disk, keyed by the
+camera settings they were taken with, and holds the most recently used ones
+in memory, so switching back to an earlier exposure reuses its master
+instead of requiring a new one. FrameCalibration applies them as
+
+    corrected = max((frame - dark) * mean(flat) / flat, 0)
+
+with the flat's gain and the scaled dark folded into one multiply and one
+add at load time, written into a preallocated buffer (or the frame itself,
+for float frames) so correcting a frame allocates nothing.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CALIBRATION_DIR = "urashg_calibration"
+
+# Master frame kinds; darks depend on the exposure, normalized flats do not
+DARK = "dark"
+FLAT = "flat"
+EXPOSURE_INDEPENDENT = {FLAT}
+
+
+def default_calibration_dir() -> Path:
+    """Calibration directory in the PyMoDAQ local directory."""
+    try:
+        from pymodaq_utils.config import get_set_local_dir
+
+        return Path(get_set_local_dir()) / CALIBRATION_DIR
+    except ImportError:
+        return Path.home() / ".pymodaq" / CALIBRATION_DIR
+
+
+def calibration_key(kind: str, settings: Dict[str, Any]) -> str:
+    """
+    Canonical key of a master frame: its kind and the camera settings it
+    depends on (the exposure is left out for flats).
+    """
+    if kind in EXPOSURE_INDEPENDENT:
+        settings = {k: v for k, v in settings.items() if k != "exposure"}
+    return json.dumps(
+        {"kind": kind, **settings}, sort_keys=True, separators=(",", ":"), default=str
+    )
+
+
+class CalibrationStore:
+    """
+    Master dark and flat frames, persisted as ``.npz`` files.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory holding the master files
+    max_cached : int
+        Masters kept in memory, least recently used dropped first
+    """
+
+    def __init__(self, directory: Union[str, Path], max_cached: int = 8):
+        self.directory = Path(directory)
+        self.max_cached = max_cached
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def _path(self, key: str) -> Path:
+        kind = json.loads(key)["kind"]
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        return self.directory / f"{kind}_{digest}.npz"
+
+    def _remember(self, key: str, master: np.ndarray):
+        self._cache[key] = master
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+
+    def get(self, kind: str, settings: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Master frame for these settings, or None if there is none."""
+        key = calibration_key(kind, settings)
+        master = self._cache.get(key)
+        if master is not None:
+            self._cache.move_to_end(key)
+            return master
+
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                if str(data["key"]) != key:
+                    logger.warning(f"Ignoring calibration {path}: key mismatch")
+                    return None
+                master = data["master"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable calibration {path}: {e}")
+            return None
+        self._remember(key, master)
+        return master
+
+    def put(self, kind: str, settings: Dict[str, Any], master: np.ndarray):
+        """Store a master frame (as float32) in memory and on disk."""
+        key = calibration_key(kind, settings)
+        master = np.ascontiguousarray(master, dtype=np.float32)
+        self._remember(key, master)
+
+        path = self._path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp.npz")
+            np.savez(tmp_path, key=np.array(key), master=master)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to save calibration {path}: {e}")
+
+
+class FrameCalibration:
+    """
+    Dark subtraction and flat-field correction of frames.
+
+    Parameters
+    ----------
+    dark : numpy.ndarray, optional
+        Master dark frame
+    flat : numpy.ndarray, optional
+        Master flat frame, dark subtracted; pixels that did not respond are
+        set to zero in corrected frames
+    clip : bool
+        Clip negative values to zero
+    """
+
+    def __init__(
+        self,
+        dark: Optional[np.ndarray] = None,
+        flat: Optional[np.ndarray] = None,
+        clip: bool = True,
+    ):
+        if dark is None and flat is None:
+            raise ValueError("Calibration needs a dark or a flat frame")
+        self.clip = clip
+        self.shape = (dark if dark is not None else flat).shape
+        self._scale: Optional[np.ndarray] = None
+        self._offset: Optional[np.ndarray] = None
+
+        if flat is not None:
+            if flat.shape != self.shape:
+                raise ValueError(
+                    f"Flat shape {flat.shape} does not match the dark {self.shape}"
+                )
+            flat = flat.astype(np.float32)
+            responsive = flat > 0
+            if not responsive.any():
+                raise ValueError("Flat frame has no responsive pixel")
+            # Gain normalized to the mean response
+            self._scale = np.zeros(self.shape, np.float32)
+            np.divide(flat[responsive].mean(), flat, out=self._scale, where=responsive)
+        if dark is not None:
+            # (frame - dark) * scale == frame * scale - dark * scale
+            self._offset = -np.asarray(dark, dtype=np.float32)
+            if self._scale is not None:
+                self._offset *= self._scale
+
+    def apply(self, frame: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Correct a frame.
+
+        Parameters
+        ----------
+        frame : numpy.ndarray
+            Raw frame
+        out : numpy.ndarray, optional
+            Float buffer for the result; float frames are corrected in place
+            when omitted, others into a new float32 frame
+
+        Returns
+        -------
+        numpy.ndarray
+            ``out``
+        """
+        if frame.shape != self.shape:
+            raise ValueError(
+                f"Frame shape {frame.shape} does not match the calibration "
+                f"{self.shape}"
+            )
+        if out is None:
+            out = (
+                frame
+                if np.issubdtype(frame.dtype, np.floating)
+                else np.empty(self.shape, np.float32)
+            )
+
+        if self._scale is not None:
+            np.multiply(frame, self._scale, out=out)
+            if self._offset is not None:
+                np.add(out, self._offset, out=out)
+        else:
+            np.add(frame, self._offset, out=out)
+        if self.clip:
+            np.maximum(out, 0, out=out)
+        return out
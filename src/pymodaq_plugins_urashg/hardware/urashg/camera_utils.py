@@ -10,6 +10,8 @@ from typing import Optional, Tuple
 
 import numpy as np
 
+from .shg_scene import default_scene
+
 
 class CameraError(Exception):
     """Camera specific exception"""
@@ -152,24 +154,9 @@ class CameraManager:
 
         try:
             if self.mock_mode:
-                # Generate mock image data
-                height, width = self.sensor_size
-
-                # Create realistic SHG-like image with some structure
-                x = np.linspace(-1, 1, width)
-                y = np.linspace(-1, 1, height)
-                X, Y = np.meshgrid(x, y)
-
-                # Gaussian beam profile with noise
-                beam_profile = 1000 * np.exp(-(X**2 + Y**2) / 0.3)
-                noise = np.random.poisson(
-                    beam_profile + 50
-                )  # Poisson noise + background
-
-                # Add some periodic structure (like interference fringes)
-                fringes = 100 * np.sin(10 * X) * np.exp(-(X**2 + Y**2) / 0.5)
-
-                image = (noise + fringes).astype(np.uint16)
+                # Synthetic SHG flakes following the mock polarization optics
+                # and laser wavelength
+                image = default_scene(self.sensor_size).render(exposure_ms)
 
                 # Simulate exposure time delay
                 time.sleep(exposure_ms / 1000.0)
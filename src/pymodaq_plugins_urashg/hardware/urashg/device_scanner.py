@@ -2,32 +2,126 @@
 Hardware Device Scanner for URASHG System
 
 Automatically detects and identifies connected hardware devices by testing
-communication patterns on available serial ports.
+communication patterns on available serial ports. Ports are probed in
+parallel, each starting with the device type it most likely hosts.
+
+USB adapters are remembered on disk by VID/PID/serial number together with
+the device, baud rate and command that identified them, so later scans only
+confirm them with a single query.
 """
 
+import json
 import logging
-import time
-from typing import Dict, List, Optional, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 
 import serial
 import serial.tools.list_ports
 
 logger = logging.getLogger(__name__)
 
+DEVICE_CACHE_FILE = "urashg_device_cache.json"
+
+
+def default_cache_path() -> Path:
+    """Device cache file in the PyMoDAQ local directory."""
+    try:
+        from pymodaq_utils.config import get_set_local_dir
+
+        return Path(get_set_local_dir()) / DEVICE_CACHE_FILE
+    except ImportError:
+        return Path.home() / ".pymodaq" / DEVICE_CACHE_FILE
+
+
+class DeviceIdentityCache:
+    """
+    On-disk map from USB adapter identity to the device behind it.
+
+    Entries hold the device type, the baud rate and the test command that
+    identified it, and the port it was last seen on.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path) as f:
+                return json.load(f).get("devices", {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable device cache {self.path}: {e}")
+            return {}
+
+    def get(self, identity: str) -> Optional[Dict]:
+        return self.entries.get(identity)
+
+    def update(
+        self, identity: str, device_type: str, baudrate: int, command: str, port: str
+    ):
+        entry = {
+            "device_type": device_type,
+            "baudrate": baudrate,
+            "command": command,
+            "port": port,
+        }
+        if self.entries.get(identity) != entry:
+            self.entries[identity] = entry
+            self._dirty = True
+
+    def save(self):
+        """Write the cache if it changed since it was loaded."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"version": 1, "devices": self.entries}, f, indent=2)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to save device cache {self.path}: {e}")
+
 
 class DeviceScanner:
     """
     Automatically scan and identify connected hardware devices.
 
     Tests each available serial port with device-specific communication
-    patterns to identify which device is connected where.
+    patterns to identify which device is connected where. Every port is
+    probed in its own worker thread and stops at the first device type that
+    answers, so a scan takes about as long as the slowest single port.
     """
 
+    # Serial ports probed when they exist, besides those listed by pyserial
+    PORT_PATHS = [
+        "/dev/ttyUSB0",
+        "/dev/ttyUSB1",
+        "/dev/ttyUSB2",
+        "/dev/ttyUSB3",
+        "/dev/ttyUSB4",
+        "/dev/ttyUSB5",
+        "/dev/ttyUSB6",
+        "/dev/ttyS0",
+        "/dev/ttyS1",
+    ]
+
+    # Upper bound on ports probed concurrently
+    max_workers = 16
+
     # Device identification patterns
     DEVICE_PATTERNS = {
         "maitai": {
             "test_commands": ["?", "*IDN?", "READ:POW?"],
             "response_patterns": ["MaiTai", "Spectra-Physics", "POWER"],
+            # USB descriptor fragments suggesting this device
+            "port_hints": ["Spectra", "MaiTai"],
             "baudrates": [
                 9600,
                 19200,
@@ -42,27 +136,49 @@ class DeviceScanner:
                 "8in",
                 "0in",
             ],  # Device info commands for different addresses
-            "response_patterns": ["ELL14", "ELL20", "Position"],
+            # "IN0E" is the ``in`` reply of an ELL14 (device type 0x0E)
+            "response_patterns": ["ELL14", "ELL20", "Position", "IN0E"],
+            "port_hints": ["Thorlabs", "Elliptec", "ELL"],
             "baudrates": [9600],  # Standard baudrate for Elliptec
             "timeout": 1.0,
         },
         "newport": {
             "test_commands": ["*IDN?", "PM:POWER?", "PM:LAMBDA?"],
             "response_patterns": ["Newport", "1830", "POWER"],
+            "port_hints": ["1830"],
             "baudrates": [9600],  # Standard baudrate for Newport power meters
             "timeout": 2.0,
         },
         "esp300": {
             "test_commands": ["*IDN?", "VE?", "ID?"],
             "response_patterns": ["ESP300", "Newport", "Version"],
+            "port_hints": ["ESP"],
             "baudrates": [19200, 9600, 57600],
             "timeout": 2.0,
         },
     }
 
-    def __init__(self):
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        cache_path: Optional[Union[str, Path]] = None,
+        use_cache: bool = True,
+    ):
+        """
+        Args:
+            timeout: Reply timeout in seconds overriding the per-device ones
+            cache_path: Device identity cache file (default: in the PyMoDAQ
+                local directory)
+            use_cache: Whether to use and update the device identity cache
+        """
+        self.timeout = timeout
         self.detected_devices = {}
         self.available_ports = []
+        self.cache = (
+            DeviceIdentityCache(cache_path or default_cache_path())
+            if use_cache
+            else None
+        )
 
     def scan_available_ports(self) -> List[Dict]:
         """
@@ -81,6 +197,7 @@ class DeviceScanner:
                 "vid": getattr(port_info, "vid", None),
                 "pid": getattr(port_info, "pid", None),
                 "serial_number": getattr(port_info, "serial_number", "Unknown"),
+                "location": getattr(port_info, "location", None),
             }
             ports.append(port_dict)
 
@@ -99,37 +216,56 @@ class DeviceScanner:
         Returns:
             True if device responds with expected pattern
         """
+        return self._probe(port, device_type) is not None
+
+    def _probe(
+        self,
+        port: str,
+        device_type: str,
+        baudrates: Optional[List[int]] = None,
+        commands: Optional[List[str]] = None,
+    ) -> Optional[Tuple[int, str]]:
+        """
+        Look for a device type on a port.
+
+        Args:
+            port: Serial port path
+            device_type: Device type key from DEVICE_PATTERNS
+            baudrates: Baud rates to try (default: those of the device type)
+            commands: Commands to try (default: those of the device type)
+
+        Returns:
+            The baud rate and command that got the expected reply, or None
+        """
         if device_type not in self.DEVICE_PATTERNS:
-            return False
+            return None
 
         pattern = self.DEVICE_PATTERNS[device_type]
+        timeout = self.timeout if self.timeout is not None else pattern["timeout"]
 
-        for baudrate in pattern["baudrates"]:
+        for baudrate in baudrates or pattern["baudrates"]:
             try:
                 with serial.Serial(
                     port,
                     baudrate=baudrate,
-                    timeout=pattern["timeout"],
+                    timeout=timeout,
                     bytesize=8,
                     parity="N",
                     stopbits=1,
                 ) as ser:
 
                     # Clear buffers
-                    ser.flushInput()
-                    ser.flushOutput()
-                    time.sleep(0.1)
+                    ser.reset_input_buffer()
+                    ser.reset_output_buffer()
 
                     # Test each command
-                    for cmd in pattern["test_commands"]:
+                    for cmd in commands or pattern["test_commands"]:
                         try:
-                            # Send command
-                            cmd_bytes = (cmd + "\r\n").encode("ascii")
-                            ser.write(cmd_bytes)
-                            time.sleep(0.5)
-
-                            # Read response
-                            response = ser.read(100).decode("ascii", errors="ignore")
+                            # Send command and read one reply line (or time out)
+                            ser.write((cmd + "\r\n").encode("ascii"))
+                            response = ser.read_until(b"\n", 100).decode(
+                                "ascii", errors="ignore"
+                            )
 
                             # Check for expected patterns
                             for expected in pattern["response_patterns"]:
@@ -138,7 +274,7 @@ class DeviceScanner:
                                         f"Device {device_type} detected on {port} (baudrate: {baudrate})"
                                     )
                                     logger.debug(f"Response: {response.strip()}")
-                                    return True
+                                    return baudrate, cmd
 
                         except Exception as e:
                             logger.debug(f"Command {cmd} failed on {port}: {e}")
@@ -148,7 +284,51 @@ class DeviceScanner:
                 logger.debug(f"Failed to open {port} at {baudrate}: {e}")
                 continue
 
-        return False
+        return None
+
+    def identify_port(
+        self, port: str, device_types: Optional[List[str]] = None
+    ) -> Optional[str]:
+        """
+        Identify the device on a port, trying device types in order.
+
+        Args:
+            port: Serial port path
+            device_types: Device types to try, most likely first
+                (default: all, in DEVICE_PATTERNS order)
+
+        Returns:
+            The first device type that responds, None if none does
+        """
+        match = self._identify(port, device_types or list(self.DEVICE_PATTERNS))
+        return match[0] if match else None
+
+    def _identify(
+        self, port: str, device_types: List[str]
+    ) -> Optional[Tuple[str, int, str]]:
+        """First device type answering on a port, with baud rate and command."""
+        for device_type in device_types:
+            match = self._probe(port, device_type)
+            if match:
+                return (device_type,) + match
+        return None
+
+    def _scan_port(
+        self, port: str, previous: Dict[str, str]
+    ) -> Optional[Tuple[str, int, str]]:
+        """Confirm the cached device of a port, or identify it by probing."""
+        identity = self.usb_identity(self._port_info(port))
+        entry = self.cache.get(identity) if self.cache and identity else None
+        if entry:
+            match = self._probe(
+                port, entry["device_type"], [entry["baudrate"]], [entry["command"]]
+            )
+            if match:
+                return (entry["device_type"],) + match
+            logger.info(
+                f"Cached {entry['device_type']} not answering on {port}, probing"
+            )
+        return self._identify(port, self._probe_order(port, previous, entry))
 
     def scan_all_devices(self) -> Dict[str, str]:
         """
@@ -157,50 +337,111 @@ class DeviceScanner:
         Returns:
             Dictionary mapping device_type -> port_path
         """
+        previous = dict(self.detected_devices)
         self.scan_available_ports()
         self.detected_devices = {}
 
         logger.info("Starting comprehensive device scan...")
 
-        # Get list of actual serial ports
-        port_paths = [
-            "/dev/ttyUSB0",
-            "/dev/ttyUSB1",
-            "/dev/ttyUSB2",
-            "/dev/ttyUSB3",
-            "/dev/ttyUSB4",
-            "/dev/ttyUSB5",
-            "/dev/ttyUSB6",
-            "/dev/ttyS0",
-            "/dev/ttyS1",
-        ]
-
-        # Filter to only existing ports
-        existing_ports = [p for p in port_paths if self._port_exists(p)]
-
+        existing_ports = self._candidate_ports()
         logger.info(f"Testing {len(existing_ports)} ports: {existing_ports}")
 
-        for device_type in self.DEVICE_PATTERNS.keys():
-            logger.info(f"Scanning for {device_type}...")
-
-            for port in existing_ports:
-                if self.test_device_on_port(port, device_type):
-                    self.detected_devices[device_type] = port
-                    logger.info(f"✓ {device_type} found on {port}")
-                    break
-            else:
+        if existing_ports:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(existing_ports)),
+                thread_name_prefix="DeviceScanner",
+            ) as pool:
+                futures = {
+                    port: pool.submit(self._scan_port, port, previous)
+                    for port in existing_ports
+                }
+                # Collect in port order so duplicates resolve deterministically
+                for port, future in futures.items():
+                    match = future.result()
+                    if match is None:
+                        continue
+                    device_type, baudrate, command = match
+                    identity = self.usb_identity(self._port_info(port))
+                    if self.cache and identity:
+                        self.cache.update(
+                            identity, device_type, baudrate, command, port
+                        )
+                    if device_type not in self.detected_devices:
+                        self.detected_devices[device_type] = port
+                        logger.info(f"✓ {device_type} found on {port}")
+
+        if self.cache:
+            self.cache.save()
+
+        for device_type in self.DEVICE_PATTERNS:
+            if device_type not in self.detected_devices:
                 logger.warning(f"✗ {device_type} not found on any port")
 
         return self.detected_devices
 
+    def _candidate_ports(self) -> List[str]:
+        """Existing serial ports: the usual paths plus those pyserial lists."""
+        listed = [info["device"] for info in self.available_ports]
+        ports = [p for p in self.PORT_PATHS if self._port_exists(p)]
+        return ports + [p for p in listed if p not in ports]
+
+    def _port_info(self, port: str) -> Dict:
+        """USB information of a port listed by pyserial (empty if unlisted)."""
+        return next((p for p in self.available_ports if p["device"] == port), {})
+
+    @staticmethod
+    def usb_identity(port_info: Dict) -> Optional[str]:
+        """
+        Stable identity of a USB serial adapter, None if it has none.
+
+        Adapters are told apart by serial number, or by their USB bus
+        location when they do not report one.
+        """
+        vid, pid = port_info.get("vid"), port_info.get("pid")
+        if vid is None or pid is None:
+            return None
+        serial_number = port_info.get("serial_number")
+        if serial_number and serial_number != "Unknown":
+            return f"{vid:04X}:{pid:04X}:{serial_number}"
+        if port_info.get("location"):
+            return f"{vid:04X}:{pid:04X}@{port_info['location']}"
+        return None
+
+    def _probe_order(
+        self,
+        port: str,
+        previous: Optional[Dict[str, str]] = None,
+        cached: Optional[Dict] = None,
+    ) -> List[str]:
+        """
+        Device types to try on a port, most likely first.
+
+        The device cached for the adapter or found on the port by the previous
+        scan comes first, then those whose ``port_hints`` match the port's
+        USB descriptors.
+        """
+        info = self._port_info(port)
+        descriptor = " ".join(
+            str(info.get(key) or "")
+            for key in ("description", "manufacturer", "product")
+        ).lower()
+
+        def rank(device_type: str) -> int:
+            if (previous or {}).get(device_type) == port:
+                return 0
+            if cached and cached["device_type"] == device_type:
+                return 0
+            hints = self.DEVICE_PATTERNS[device_type].get("port_hints", [])
+            if any(hint.lower() in descriptor for hint in hints):
+                return 1
+            return 2
+
+        # sorted() is stable, so ties keep the DEVICE_PATTERNS order
+        return sorted(self.DEVICE_PATTERNS, key=rank)
+
     def _port_exists(self, port_path: str) -> bool:
-        """Check if a port exists and is accessible."""
-        try:
-            with serial.Serial(port_path, timeout=0.1):
-                pass
-            return True
-        except:
-            return False
+        """Check if a port exists (without opening it)."""
+        return os.path.exists(port_path)
 
     def get_device_port(self, device_type: str) -> Optional[str]:
         """
@@ -8,7 +8,14 @@ with realistic mock behavior that matches actual hardware responses.
 import logging
 import random
 import time
-from threading import Lock
+from dataclasses import dataclass
+from threading import Condition, Lock
+from typing import Dict, Optional
+
+import numpy as np
+
+from .serial_transport import SerialTransport
+from .shg_scene import SCENE_STATE
 
 
 class ElliptecError(Exception):
@@ -17,6 +24,130 @@ class ElliptecError(Exception):
     pass
 
 
+@dataclass
+class ElliptecReply:
+    """
+    Parsed ELLx reply frame.
+
+    Replies have the form ``<address><HEADER><data>`` followed by CR LF,
+    e.g. ``2PO00001F40`` or ``3GS00``. The header is always upper case.
+    """
+
+    address: str
+    header: str
+    data: str
+    raw: bytes
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> Optional["ElliptecReply"]:
+        """Parse a single reply frame, returning None if it is not ELLx-shaped."""
+        try:
+            text = raw.decode("ascii").strip()
+        except UnicodeDecodeError:
+            return None
+        if len(text) < 3 or not text[1:3].isalpha() or not text[1:3].isupper():
+            return None
+        return cls(address=text[0], header=text[1:3], data=text[3:], raw=raw)
+
+    @property
+    def is_busy(self) -> bool:
+        """True for a ``GS`` status reply reporting the mount is still moving."""
+        return self.header == "GS" and self.data[:2] == "09"
+
+    @property
+    def is_error(self) -> bool:
+        """True for a ``GS`` status reply carrying a non-zero error code."""
+        return self.header == "GS" and self.data[:2] not in ("", "00", "09")
+
+    @property
+    def position_pulses(self) -> Optional[int]:
+        """Signed pulse count carried by a ``PO`` reply, None for other headers."""
+        if self.header != "PO" or len(self.data) < 8:
+            return None
+        try:
+            pulses = int(self.data[:8], 16)
+        except ValueError:
+            return None
+        if pulses > 0x7FFFFFFF:  # Handle negative values
+            pulses -= 0x100000000
+        return pulses
+
+
+class ElliptecTrajectory:
+    """
+    Precompiled sequence of coordinated ELL14 moves.
+
+    Converts an ``(n_steps, n_mounts)`` array of angles into pulse counts and
+    wire-ready ``ma`` commands in one vectorized pass, so replaying a step
+    is a single serial write of a prebuilt buffer.
+    """
+
+    _HEX_DIGITS = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+    _NIBBLE_SHIFTS = np.arange(28, -1, -4, dtype=np.int64)
+    _FRAME_LENGTH = 12  # address + "ma" + 8 hex digits + CR
+
+    def __init__(self, angles, mount_addresses, pulses_per_rev: int = 23000):
+        """
+        Parameters
+        ----------
+        angles : array_like
+            Target angles in degrees, one row per step and one column per mount
+        mount_addresses : list of str
+            Mount address for each column of ``angles``
+        pulses_per_rev : int
+            Encoder pulses per revolution (23000 for ELL14)
+        """
+        angles = np.asarray(angles, dtype=np.float64)
+        if angles.ndim == 1:
+            angles = angles[:, np.newaxis]
+        self.mount_addresses = [str(addr) for addr in mount_addresses]
+        if angles.ndim != 2 or angles.shape[1] != len(self.mount_addresses):
+            raise ElliptecError(
+                f"Trajectory shape {angles.shape} does not match "
+                f"{len(self.mount_addresses)} mounts"
+            )
+
+        self.angles = angles
+        self.pulses_per_rev = pulses_per_rev
+
+        # Same truncation as single moves, so both paths hit identical pulses
+        self.pulses = np.trunc(angles / 360.0 * pulses_per_rev).astype(np.int64)
+        self.target_degrees = self.pulses * (360.0 / pulses_per_rev)
+        self.command_bytes = self._encode(self.pulses)
+
+    def _encode(self, pulses: np.ndarray) -> np.ndarray:
+        """Build the ``(n_steps, n_mounts * 12)`` uint8 command buffer."""
+        n_steps, n_mounts = pulses.shape
+        words = pulses & 0xFFFFFFFF  # Two's complement for negative moves
+        nibbles = (words[..., np.newaxis] >> self._NIBBLE_SHIFTS) & 0xF
+
+        frames = np.empty((n_steps, n_mounts, self._FRAME_LENGTH), dtype=np.uint8)
+        frames[..., 0] = np.frombuffer("".join(self.mount_addresses).encode(), np.uint8)
+        frames[..., 1] = ord("m")
+        frames[..., 2] = ord("a")
+        frames[..., 3:11] = self._HEX_DIGITS[nibbles]
+        frames[..., 11] = ord("\r")
+        return frames.reshape(n_steps, n_mounts * self._FRAME_LENGTH)
+
+    def __len__(self) -> int:
+        return self.angles.shape[0]
+
+    def step_bytes(self, step: int) -> bytes:
+        """Wire-ready commands for all mounts of one step."""
+        return self.command_bytes[step].tobytes()
+
+    def targets(self, step: int) -> Dict[str, float]:
+        """Quantized target angle of each mount for one step."""
+        return dict(zip(self.mount_addresses, self.target_degrees[step].tolist()))
+
+    def arrival_error(self, step: int, positions: Dict[str, float]) -> np.ndarray:
+        """Angular error of reported positions against the step targets."""
+        reported = np.array(
+            [positions.get(addr, np.nan) for addr in self.mount_addresses]
+        )
+        return reported - self.target_degrees[step]
+
+
 class ElliptecController:
     """
     Hardware controller for Thorlabs Elliptec rotation mounts.
@@ -28,6 +159,33 @@ class ElliptecController:
     # Device specifications
     units = "degrees"
 
+    # ELLx replies are terminated by CR LF
+    _reply_terminator = b"\r\n"
+
+    # Reply deadlines (s) for instructions that only answer once motion ends;
+    # every other instruction uses the controller timeout.
+    _motion_reply_timeouts = {"ma": 5.0, "mr": 5.0, "ho": 8.0}
+
+    # Reply header expected for each instruction. A mount answers an error
+    # with a ``GS`` status instead, so that is accepted for any instruction;
+    # other frames (e.g. the ``PO`` a moving mount sends when it stops) go to
+    # ``_on_frame``. Instructions not listed match on the address alone.
+    _reply_headers = {
+        "gs": "GS",
+        "gp": "PO",
+        "ma": "PO",
+        "mr": "PO",
+        "ho": "PO",
+        "in": "IN",
+        "gv": "GV",
+    }
+
+    # Silence (s) after which moving mounts are polled with ``gs``
+    _status_poll_interval = 0.1
+
+    # Resends of a query (never of a motion command) after a reply timeout
+    _query_retries = 1
+
     def __init__(
         self,
         port: str = "",
@@ -35,6 +193,7 @@ class ElliptecController:
         timeout: float = 2.0,
         mount_addresses: str = "2,3,8",
         mock_mode: bool = False,
+        position_cache_ttl: float = 0.5,
     ):
         """
         Initialize Elliptec controller.
@@ -51,14 +210,27 @@ class ElliptecController:
             Comma-separated mount addresses (e.g., '2,3,8')
         mock_mode : bool
             Enable mock mode for testing without hardware
+        position_cache_ttl : float
+            Age in seconds below which a cached position is returned without
+            querying the mount (0 disables the cache)
         """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.mock_mode = mock_mode
+        self.position_cache_ttl = position_cache_ttl
         self._connection = None
         self._connected = False
         self._lock = Lock()
+        self._transport: Optional[SerialTransport] = None
+
+        # Motion tracking: mounts with a move in flight (address -> start
+        # time) and the error codes of moves that ended badly. Updated from
+        # the transport thread; waiters are woken through the condition.
+        self._moving: Dict[str, float] = {}
+        self._motion_errors: Dict[str, str] = {}
+        self._motion_state = Condition()
+        self._frames_received = 0
 
         # Parse mount addresses - handle string, list, and string representation of list
         if isinstance(mount_addresses, str):
@@ -82,8 +254,9 @@ class ElliptecController:
             )
         self.axes = [f"Mount_{addr}" for addr in self.mount_addresses]
 
-        # Current positions (degrees)
+        # Current positions (degrees) and when each was last confirmed
         self._positions = {addr: 0.0 for addr in self.mount_addresses}
+        self._position_stamps: Dict[str, float] = {}
 
         # Device parameters from working hardware tests
         self._pulses_per_rev = 23000  # ELL14 specification
@@ -142,6 +315,9 @@ class ElliptecController:
 
         try:
             with self._lock:
+                if self._transport is not None:
+                    self._transport.close()
+                    self._transport = None
                 if self._connection and self._connection.is_open:
                     self._connection.close()
                     self._connection = None
@@ -311,126 +487,154 @@ class ElliptecController:
                 )
                 return b"ER10"  # Unknown command
 
-        # Real hardware communication (unchanged)
-        if not self._connection or not self._connection.is_open:
+        # Real hardware communication
+        transport = self._get_transport()
+        if transport is None:
             self.logger.error("Device not connected")
             return None
 
         try:
-            with self._lock:
-                # Debug: Log the exact command being sent
-                self.logger.debug(
-                    f"Sending command: '{command}' (type: {type(command)}, length: {len(command)})"
-                )
-                self.logger.debug(f"Command bytes: {repr(command)}")
+            self.logger.debug(f"Sending command: {command!r}")
+            address = command[:1]
+            instruction = command[1:3].lower()
+            frame = transport.query(
+                command,
+                timeout=self._reply_timeout(command),
+                retries=(
+                    0
+                    if instruction in self._motion_reply_timeouts
+                    else self._query_retries
+                ),
+                match=self._reply_matcher(command),
+            )
 
-                # Clear buffers
-                self._connection.flushInput()
-                self._connection.flushOutput()
+            if frame is not None:
+                reply = ElliptecReply.from_bytes(frame)
+                if reply is not None:
+                    with self._motion_state:
+                        self._track_reply(reply)
+                self.logger.debug(f"Command '{command}' response: {frame}")
+                return frame
+            else:
+                self.logger.warning(f"No response to command '{command}'")
+                return None
 
-                # Send command with proper termination
-                cmd_bytes = (command + "\r").encode("ascii")
-                self.logger.debug(f"Command bytes to send: {cmd_bytes}")
-                self._connection.write(cmd_bytes)
-                time.sleep(0.3)  # Device processing time
+        except Exception as e:
+            self.logger.error(f"Communication error for command '{command}': {e}")
+            return None
 
-                # Read response
-                response = self._connection.read(100)
+    def _get_transport(self) -> Optional[SerialTransport]:
+        """Return the transport of the open connection, or None."""
+        self._transport = SerialTransport.for_connection(
+            self._transport,
+            self._connection,
+            terminator=self._reply_terminator,
+            write_terminator=b"\r",
+            timeout=self.timeout,
+            on_unsolicited=self._on_frame,
+            name="Elliptec",
+            # Instruction without the (possibly hex letter) bus address
+            key=lambda command: command[1:3].lower(),
+        )
+        return self._transport
 
-                if response:
-                    self.logger.debug(f"Command '{command}' response: {response}")
-                    return response
-                else:
-                    self.logger.warning(f"No response to command '{command}'")
-                    return None
+    def _reply_matcher(self, command: str):
+        """Return a predicate selecting the reply to a command among frames."""
+        address = command[:1]
+        header = self._reply_headers.get(command[1:3].lower())
 
-        except Exception as e:
-            self.logger.error(f"Communication error for command '{command}': {e}")
+        def match(frame: bytes) -> bool:
+            frame_header = frame[1:3].decode("latin-1")
+            if frame[:1].decode("latin-1") != address:
+                return False
+            return header is None or frame_header in (header, "GS")
+
+        return match
+
+    def _reply_timeout(self, command: str) -> float:
+        """Return the reply deadline in seconds for a command."""
+        instruction = command[1:3].lower()
+        return max(self.timeout, self._motion_reply_timeouts.get(instruction, 0.0))
+
+    def _on_frame(self, frame: bytes):
+        """
+        Handle a frame that answers no pending query.
+
+        Called from the transport thread for completion replies of moves,
+        answers to ``gs`` polls and late replies.
+        """
+        reply = ElliptecReply.from_bytes(frame)
+        if reply is None:
+            self.logger.debug(f"Discarding malformed frame: {frame!r}")
+            return
+        with self._motion_state:
+            self._track_reply(reply)
+            self._frames_received += 1
+            self._motion_state.notify_all()
+
+    def _query(self, command: str) -> Optional[ElliptecReply]:
+        """Send a command and return the parsed reply, or None."""
+        response = self._send_command(command)
+        if not response:
             return None
+        return ElliptecReply.from_bytes(response)
 
-    def get_position(self, mount_address: str):
-        """Get current position of specified mount in degrees."""
-        response = self._send_command(f"{mount_address}gp")
+    def _store_position(self, mount_address: str, degrees: float):
+        """Record a confirmed mount position and restart its cache window."""
+        self._positions[mount_address] = degrees
+        self._position_stamps[mount_address] = time.monotonic()
+        if self.mock_mode:
+            # Drives the mock cameras' synthetic scene
+            SCENE_STATE.set_mount(mount_address, degrees)
 
-        if response:
-            try:
-                # Handle binary response with error-tolerant decoding
-                if isinstance(response, bytes):
-                    # Try ASCII first, then fall back to error-tolerant decoding
-                    try:
-                        response_str = response.decode("ascii").strip()
-                    except UnicodeDecodeError:
-                        # Handle binary data - try latin-1 (preserves all byte values)
-                        response_str = response.decode(
-                            "latin-1", errors="ignore"
-                        ).strip()
-                        self.logger.debug(
-                            f"Binary response from mount {mount_address}: {response.hex()}"
-                        )
+    def _cached_position(self, mount_address: str) -> Optional[float]:
+        """
+        Return the cached position if it can be trusted, else None.
 
-                        # For binary responses, try multiple parsing methods
-                        if len(response) >= 4:
-                            # Try different binary formats
-                            import struct
-
-                            parsing_methods = [
-                                ("<i", "little-endian 32-bit signed"),
-                                (">i", "big-endian 32-bit signed"),
-                                ("<I", "little-endian 32-bit unsigned"),
-                                (">I", "big-endian 32-bit unsigned"),
-                            ]
-
-                            for fmt, desc in parsing_methods:
-                                try:
-                                    pulses = struct.unpack(fmt, response[:4])[0]
-                                    if pulses > 0x7FFFFFFF:  # Handle unsigned as signed
-                                        pulses -= 0x100000000
-                                    degrees = (pulses / self._pulses_per_rev) * 360.0
-
-                                    # Sanity check: degrees should be reasonable
-                                    if -720 <= degrees <= 720:  # Allow 2 full rotations
-                                        self._positions[mount_address] = degrees
-                                        self.logger.debug(
-                                            f"Mount {mount_address} binary position: {degrees:.2f}° ({desc})"
-                                        )
-                                        return degrees
-                                except (struct.error, ValueError, OverflowError):
-                                    continue
-
-                        # If all binary parsing fails, log and return cached position
-                        self.logger.debug(
-                            f"Binary response from mount {mount_address} (length {len(response)}): {response.hex()}"
-                        )
-                        # Return cached position but don't warn every time
-                        return self._positions.get(mount_address, 0.0)
-                else:
-                    response_str = str(response).strip()
+        A cached value is valid while the mount is not moving and the value
+        is younger than ``position_cache_ttl``.
+        """
+        if mount_address in self._moving:
+            return None
+        stamp = self._position_stamps.get(mount_address)
+        if stamp is None or time.monotonic() - stamp >= self.position_cache_ttl:
+            return None
+        return self._positions.get(mount_address)
 
-                # Parse standard ASCII response (format: "XPOnnnnnnnn")
-                if "PO" in response_str:
-                    # Extract hex position value
-                    hex_pos = response_str.split("PO")[1][:8]
-                    # Convert to signed integer (pulses)
-                    pulses = int(hex_pos, 16)
-                    if pulses > 0x7FFFFFFF:  # Handle negative values
-                        pulses -= 0x100000000
+    def get_position(self, mount_address: str):
+        """
+        Get current position of specified mount in degrees.
 
-                    # Convert pulses to degrees
-                    degrees = (pulses / self._pulses_per_rev) * 360.0
+        Served from the position cache when it is fresh (see
+        ``position_cache_ttl``); otherwise the mount is queried with ``gp``.
+        """
+        mount_address = str(mount_address)
+        cached = self._cached_position(mount_address)
+        if cached is not None:
+            return cached
 
-                    # Update cached position
-                    self._positions[mount_address] = degrees
+        try:
+            reply = self._query(f"{mount_address}gp")
+            pulses = reply.position_pulses if reply is not None else None
+            if pulses is not None:
+                degrees = (pulses / self._pulses_per_rev) * 360.0
 
-                    self.logger.debug(
-                        f"Mount {mount_address} position: {degrees:.2f} degrees"
-                    )
-                    return degrees
+                # Update cached position
+                self._store_position(mount_address, degrees)
 
-            except Exception as e:
-                self.logger.error(
-                    f"Error parsing position for mount {mount_address}: {e}"
+                self.logger.debug(
+                    f"Mount {mount_address} position: {degrees:.2f} degrees"
+                )
+                return degrees
+
+            if reply is not None:
+                self.logger.debug(
+                    f"Unexpected position reply from mount {mount_address}: {reply.raw!r}"
                 )
 
+        except Exception as e:
+            self.logger.error(f"Error parsing position for mount {mount_address}: {e}")
+
         # Return cached position if communication failed
         return self._positions.get(mount_address, 0.0)
 
@@ -443,34 +647,215 @@ class ElliptecController:
                 positions[addr] = pos
         return positions
 
+    def _degrees_to_hex(self, position_degrees: float) -> str:
+        """Encode an angle as the 8-digit two's complement pulse count."""
+        pulses = int((position_degrees / 360.0) * self._pulses_per_rev)
+        if pulses < 0:
+            pulses += 0x100000000
+        return f"{pulses:08X}"
+
     def move_absolute(self, mount_address: str, position_degrees: float) -> bool:
         """Move mount to absolute position in degrees."""
+        results = self.move_absolute_multiple({mount_address: position_degrees})
+        return all(results.values())
+
+    def move_absolute_multiple(
+        self, positions: Dict[str, float], wait: bool = True
+    ) -> Dict[str, bool]:
+        """
+        Move several mounts to absolute positions at the same time.
+
+        All ``ma`` commands are written back-to-back so the mounts rotate in
+        parallel; completion is then tracked with ``wait_until_settled``.
+
+        Parameters
+        ----------
+        positions : dict
+            Mapping of mount address to target position in degrees
+        wait : bool
+            Block until every mount has settled
+
+        Returns
+        -------
+        dict
+            Mapping of mount address to True if its move was started (and,
+            with ``wait``, completed)
+        """
         try:
-            # Convert degrees to pulses
-            pulses = int((position_degrees / 360.0) * self._pulses_per_rev)
+            commands = {
+                str(addr): f"{addr}ma{self._degrees_to_hex(pos)}"
+                for addr, pos in positions.items()
+            }
+
+            if self.mock_mode:
+                failed = [
+                    addr
+                    for addr, cmd in commands.items()
+                    if not self._mock_move_accepted(addr, self._send_command(cmd))
+                ]
+            else:
+                failed = [] if self._start_motion(commands) else list(commands)
+                if not failed and wait:
+                    self.wait_until_settled(list(commands))
+                    failed = [
+                        addr
+                        for addr in commands
+                        if addr in self._moving or addr in self._motion_errors
+                    ]
+
+            # Real mounts report their final position in the PO reply
+            if self.mock_mode:
+                for addr, pos in positions.items():
+                    if str(addr) not in failed:
+                        self._store_position(str(addr), pos)
 
-            # Format as 8-digit hex
-            if pulses < 0:
-                pulses += 0x100000000
-            hex_pos = f"{pulses:08X}"
+            if failed:
+                self.logger.error(f"Failed to move mounts {failed}")
+            else:
+                self.logger.info(f"Mounts moved to {positions}")
+            return {addr: addr not in failed for addr in commands}
 
-            # Send move command
-            response = self._send_command(f"{mount_address}ma{hex_pos}")
+        except Exception as e:
+            self.logger.error(f"Error in coordinated move {positions}: {e}")
+            return {str(addr): False for addr in positions}
 
-            if response is not None:  # Empty response is success for move commands
-                # Update cached position
-                self._positions[mount_address] = position_degrees
-                self.logger.info(
-                    f"Mount {mount_address} moved to {position_degrees:.2f}degrees"
+    def _mock_move_accepted(self, addr: str, response: Optional[bytes]) -> bool:
+        """
+        Check the simulated reply to a motion command.
+
+        An empty reply means the move was accepted; ``ER`` codes and error
+        statuses fail the mount and are recorded like real motion errors.
+        """
+        if response is None:
+            return False
+        reply = ElliptecReply.from_bytes(response)
+        if not response.strip() or (reply is not None and not reply.is_error):
+            with self._motion_state:
+                self._motion_errors.pop(addr, None)
+            return True
+
+        if reply is not None:
+            code = reply.data[:2]
+        else:
+            code = response.decode("ascii", "replace").strip()
+        with self._motion_state:
+            self._motion_errors[addr] = code
+        self.logger.error(f"Mount {addr} motion failed with status {code}")
+        return False
+
+    def _start_motion(self, commands: Dict[str, str]) -> bool:
+        """
+        Write motion commands back-to-back and mark the mounts as moving.
+
+        Parameters
+        ----------
+        commands : dict
+            Mapping of mount address to motion command string
+
+        Returns
+        -------
+        bool
+            True if all commands were written
+        """
+        transport = self._get_transport()
+        if transport is None:
+            self.logger.error("Device not connected")
+            return False
+
+        for addr, command in commands.items():
+            self.logger.debug(f"Sending command: {command!r}")
+            with self._motion_state:
+                self._moving[addr] = time.monotonic()
+                self._motion_errors.pop(addr, None)
+            transport.write(command)
+        return True
+
+    def _track_reply(self, reply: ElliptecReply):
+        """
+        Update motion state from a reply, solicited or not.
+
+        A mount stops being tracked as moving once it sends a ``PO`` reply
+        (sent unprompted at the end of every move) or reports an idle or
+        error status. Must be called with ``_motion_state`` held.
+        """
+        pulses = reply.position_pulses
+        if pulses is not None:
+            self._store_position(reply.address, (pulses / self._pulses_per_rev) * 360.0)
+
+        if reply.address not in self._moving or reply.is_busy:
+            return
+        if reply.header == "PO" or reply.header == "GS":
+            started = self._moving.pop(reply.address)
+            if reply.is_error:
+                self._motion_errors[reply.address] = reply.data[:2]
+                self.logger.error(
+                    f"Mount {reply.address} motion failed with status {reply.data[:2]}"
                 )
-                return True
             else:
-                self.logger.error(f"Failed to move mount {mount_address}")
-                return False
+                self.logger.debug(
+                    f"Mount {reply.address} settled after "
+                    f"{time.monotonic() - started:.3f}s"
+                )
 
-        except Exception as e:
-            self.logger.error(f"Error moving mount {mount_address}: {e}")
+    def is_moving(self, mount_address: str = None) -> bool:
+        """Check if a mount (or any mount) still has a move in flight."""
+        if mount_address is None:
+            return bool(self._moving)
+        return str(mount_address) in self._moving
+
+    def wait_until_settled(self, addresses=None, timeout: float = None) -> bool:
+        """
+        Block until the given mounts have finished moving.
+
+        Completion is taken from the ``PO`` reply each mount sends at the end
+        of a move. Mounts that stay silent for ``_status_poll_interval`` are
+        polled with ``gs`` so a lost reply cannot stall the wait.
+
+        Parameters
+        ----------
+        addresses : list of str, optional
+            Mounts to wait for (default: all configured mounts)
+        timeout : float, optional
+            Maximum wait in seconds (default: the homing reply deadline)
+
+        Returns
+        -------
+        bool
+            True if every mount settled without error before the timeout
+        """
+        addresses = [str(addr) for addr in (addresses or self.mount_addresses)]
+        if self.mock_mode:
+            for addr in addresses:
+                self._moving.pop(addr, None)
+            return True
+
+        if timeout is None:
+            timeout = max(self._motion_reply_timeouts.values())
+        deadline = time.monotonic() + timeout
+
+        transport = self._get_transport()
+        with self._motion_state:
+            pending = [addr for addr in addresses if addr in self._moving]
+            while pending and transport is not None:
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+
+                received = self._frames_received
+                self._motion_state.wait(
+                    min(deadline, now + self._status_poll_interval) - now
+                )
+                if self._frames_received == received:
+                    # No completion reply yet - ask the mounts directly
+                    for addr in pending:
+                        transport.write(f"{addr}gs")
+
+                pending = [addr for addr in pending if addr in self._moving]
+
+        if pending:
+            self.logger.warning(f"Timeout waiting for mounts {pending} to settle")
             return False
+        return not any(addr in self._motion_errors for addr in addresses)
 
     def move_relative(self, mount_address: str, offset_degrees: float) -> bool:
         """Move mount by relative offset in degrees."""
@@ -480,63 +865,112 @@ class ElliptecController:
             return self.move_absolute(mount_address, target_pos)
         return False
 
+    def compile_trajectory(self, angles, mount_addresses=None) -> ElliptecTrajectory:
+        """
+        Precompile a scan trajectory for replay with ``run_trajectory_step``.
+
+        Parameters
+        ----------
+        angles : array_like
+            Angles in degrees, shape ``(n_steps, n_mounts)``
+        mount_addresses : list of str, optional
+            Mount for each column (default: all configured mounts)
+        """
+        return ElliptecTrajectory(
+            angles, mount_addresses or self.mount_addresses, self._pulses_per_rev
+        )
+
+    def run_trajectory_step(
+        self,
+        trajectory: ElliptecTrajectory,
+        step: int,
+        wait: bool = True,
+        tolerance: float = 0.1,
+    ) -> bool:
+        """
+        Replay one precompiled trajectory step.
+
+        Parameters
+        ----------
+        trajectory : ElliptecTrajectory
+            Trajectory from ``compile_trajectory``
+        step : int
+            Index of the step to execute
+        wait : bool
+            Block until every mount has settled
+        tolerance : float
+            Allowed arrival error in degrees before a warning is logged
+
+        Returns
+        -------
+        bool
+            True if the step was started (and, with ``wait``, completed)
+        """
+        if self.mock_mode:
+            results = self.move_absolute_multiple(trajectory.targets(step), wait=wait)
+            return all(results.values())
+
+        transport = self._get_transport()
+        if transport is None:
+            self.logger.error("Device not connected")
+            return False
+
+        addresses = trajectory.mount_addresses
+        with self._motion_state:
+            now = time.monotonic()
+            for addr in addresses:
+                self._moving[addr] = now
+                self._motion_errors.pop(addr, None)
+        transport.write(trajectory.step_bytes(step))
+
+        if not wait:
+            return True
+
+        if not self.wait_until_settled(addresses):
+            return False
+
+        error = trajectory.arrival_error(step, self._positions)
+        if np.any(np.abs(error) > tolerance):
+            self.logger.warning(
+                f"Trajectory step {step} arrival error {error.round(3).tolist()} deg"
+            )
+        return True
+
     def home(self, mount_address: str) -> bool:
         """Home specified mount."""
-        # Send homing command (note: ho command doesn't return a response)
+        return self._home_mounts([mount_address])
+
+    def home_all(self) -> bool:
+        """Home all configured mounts together."""
+        return self._home_mounts(self.mount_addresses)
+
+    def _home_mounts(self, addresses) -> bool:
+        """Start homing on all given mounts, then wait for them jointly."""
+        addresses = [str(addr) for addr in addresses]
         try:
             if self.mock_mode:
                 # Mock mode - simulate successful homing
-                time.sleep(0.5)
-                self._positions[mount_address] = 0.0
-                self.logger.info(f"Mock: Mount {mount_address} homed")
+                for addr in addresses:
+                    time.sleep(0.5)
+                    self._store_position(addr, 0.0)
+                    self.logger.info(f"Mock: Mount {addr} homed")
                 return True
 
-            if not self._connection or not self._connection.is_open:
-                self.logger.error("Device not connected")
+            if not self._start_motion({addr: f"{addr}ho" for addr in addresses}):
                 return False
 
-            with self._lock:
-                # Clear buffers
-                self._connection.flushInput()
-                self._connection.flushOutput()
-
-                # Send homing command (no response expected)
-                cmd_bytes = f"{mount_address}ho\r".encode("ascii")
-                self._connection.write(cmd_bytes)
-                self.logger.debug(f"Sent homing command: {mount_address}ho")
-
-                # Wait for homing to complete (homing can take a few seconds)
-                time.sleep(2.0)
-
-                # Verify device is still responsive by getting device info
-                self._connection.flushInput()
-                info_cmd = f"{mount_address}in\r".encode("ascii")
-                self._connection.write(info_cmd)
-                time.sleep(0.5)
-                response = self._connection.read(1000)
-
-                if response and len(response) > 0:
-                    # Reset cached position to 0 (home position)
-                    self._positions[mount_address] = 0.0
-                    self.logger.info(f"Mount {mount_address} homed successfully")
-                    return True
-                else:
-                    self.logger.error(
-                        f"Mount {mount_address} not responding after home command"
-                    )
-                    return False
+            if self.wait_until_settled(
+                addresses, timeout=self._motion_reply_timeouts["ho"]
+            ):
+                self.logger.info(f"Mounts {addresses} homed successfully")
+                return True
 
-        except Exception as e:
-            self.logger.error(f"Error homing mount {mount_address}: {e}")
+            self.logger.error(f"Homing failed for mounts {addresses}")
             return False
 
-    def home_all(self) -> bool:
-        """Home all configured mounts."""
-        success = True
-        for addr in self.mount_addresses:
-            if not self.home(addr):
-                success = False
-        return success
+        except Exception as e:
+            self.logger.error(f"Error homing mounts {addresses}: {e}")
+            return False
 
     def get_device_info(self, mount_address: str = None):
         """Get device information for specified mount or all mounts."""
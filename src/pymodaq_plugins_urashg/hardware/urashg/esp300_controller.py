@@ -11,10 +11,13 @@ Based on PyMeasure ESP300 implementation with URASHG-specific adaptations.
 import logging
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
+import numpy as np
 import serial
 
+from .serial_transport import SerialTransport
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +33,100 @@ class AxisConfig:
     right_limit: Optional[float] = None
 
 
+@dataclass
+class ESP300Status:
+    """Snapshot of all axes read in a single round trip."""
+
+    positions: Dict[int, float]
+    motion_done: Dict[int, bool]
+    error_code: int = 0
+
+    @property
+    def all_done(self) -> bool:
+        """True when every queried axis reports motion done."""
+        return all(self.motion_done.values())
+
+
+class ESP300Trajectory:
+    """
+    Point list executed from the ESP300 stored-program memory.
+
+    Each point becomes a program line that moves all axes together
+    (``PA``), waits for every axis to stop (``WS``) and optionally dwells
+    (``WT``). The list is split into one stored program per segment, ending
+    at each synchronization point, so the host only has to talk to the
+    controller when a segment finishes.
+    """
+
+    def __init__(
+        self,
+        points,
+        axis_numbers: Sequence[int],
+        dwell: float = 0.0,
+        sync_points: Optional[Sequence[int]] = None,
+    ):
+        """
+        Args:
+            points: Target positions, shape (n_points, n_axes)
+            axis_numbers: Axis for each column of points
+            dwell: Time to stay at each point in seconds
+            sync_points: Indices of points after which execution pauses
+                until the host starts the next segment (the last point is
+                always one)
+        """
+        points = np.asarray(points, dtype=float)
+        if points.ndim == 1:
+            points = points[:, np.newaxis]
+        self.axis_numbers = [int(num) for num in axis_numbers]
+        if points.ndim != 2 or points.shape[1] != len(self.axis_numbers):
+            raise ValueError(
+                f"Trajectory shape {points.shape} does not match "
+                f"{len(self.axis_numbers)} axes"
+            )
+        self.points = points
+        self.dwell = dwell
+
+        ends = {len(points) - 1} | {int(i) for i in (sync_points or [])}
+        self.sync_points = sorted(i for i in ends if 0 <= i < len(points))
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def segments(self) -> List[range]:
+        """Point indices of each segment, in execution order."""
+        starts = [0] + [end + 1 for end in self.sync_points[:-1]]
+        return [range(start, end + 1) for start, end in zip(starts, self.sync_points)]
+
+    def program_lines(self, segment: range) -> List[str]:
+        """Controller commands storing one segment as a program."""
+        wait = ";".join(f"{num}WS" for num in self.axis_numbers)
+        lines = []
+        for index in segment:
+            lines.append(
+                ";".join(
+                    f"{num}PA{pos:.6f}"
+                    for num, pos in zip(self.axis_numbers, self.points[index])
+                )
+            )
+            lines.append(wait)
+            if self.dwell > 0:
+                lines.append(f"WT{self.dwell * 1000:.0f}")
+        return lines
+
+    def locate(
+        self, positions: Dict[int, float], start: int = 0, tolerance: float = 1e-3
+    ) -> Optional[int]:
+        """
+        Index of the first point at or after start matching the positions.
+
+        Returns None if the stage is between points.
+        """
+        current = np.array([positions.get(num, np.nan) for num in self.axis_numbers])
+        close = np.all(np.abs(self.points[start:] - current) <= tolerance, axis=1)
+        hits = np.flatnonzero(close)
+        return int(start + hits[0]) if hits.size else None
+
+
 class ESP300AxisError(Exception):
     """Raised when a particular axis causes an error for the Newport ESP300."""
 
@@ -309,15 +406,22 @@ class ESP300Axis:
             logger.error(f"Error setting units for axis {self.axis_number}: {e}")
             return False
 
+    @classmethod
+    def units_name(cls, units_code: int) -> Optional[str]:
+        """Return the units name for an ``SN`` code, or None if unknown."""
+        for units, code in cls.UNITS_MAP.items():
+            if code == units_code:
+                return units
+        return None
+
     def get_units(self) -> str:
         """Get axis units."""
         try:
             response = self._send_command("SN?")
             if response:
-                units_code = int(response.strip())
-                for units, code in self.UNITS_MAP.items():
-                    if code == units_code:
-                        return units
+                units = self.units_name(int(response.strip()))
+                if units is not None:
+                    return units
             return self.config.units
         except (ValueError, TypeError):
             logger.error(
@@ -353,6 +457,18 @@ class ESP300Controller:
     comprehensive error handling and axis management.
     """
 
+    # Poll interval bounds (s) for wait_for_motion: polls are fast when an
+    # axis is about to arrive and back off towards the maximum during travel
+    min_poll_interval = 0.01
+    max_poll_interval = 0.25
+
+    # Stored program numbers available on the controller
+    max_programs = 100
+
+    # Resends of a query after a reply timeout. Reading the error buffer
+    # (TE?) pops it, so commands containing it are never resent.
+    query_retries = 1
+
     def __init__(
         self,
         port: str = "",
@@ -374,6 +490,7 @@ class ESP300Controller:
         self.timeout = timeout
 
         self._serial: Optional[serial.Serial] = None
+        self._transport: Optional[SerialTransport] = None
         self._connected = False
 
         # Default axes configuration (can be overridden)
@@ -387,6 +504,13 @@ class ESP300Controller:
         self.axes_config = {cfg.number: cfg for cfg in axes_config}
         self.axes: Dict[int, ESP300Axis] = {}
 
+        # Index of the last trajectory point reached by run_trajectory
+        self.trajectory_progress = -1
+
+        # Last error code popped off the error buffer by a status poll
+        # (TE? in get_status); 0 when none was seen
+        self.last_error = 0
+
         logger.info(
             f"ESP300 controller initialized for {port}, {len(axes_config)} axes"
         )
@@ -455,6 +579,9 @@ class ESP300Controller:
     def _cleanup_connection(self):
         """Clean up serial connection."""
         try:
+            if self._transport is not None:
+                self._transport.close()
+                self._transport = None
             if self._serial and self._serial.is_open:
                 self._serial.close()
             self._serial = None
@@ -477,40 +604,45 @@ class ESP300Controller:
             str or None: Response from device, or None on error
         """
         try:
-            if not self._serial or not self._serial.is_open:
+            transport = self._get_transport()
+            if transport is None:
                 logger.error("Serial connection not available")
                 return None
 
-            # Clear buffers
-            self._serial.reset_input_buffer()
-            self._serial.reset_output_buffer()
-
-            # Send command (ESP300 uses CR+LF termination)
-            cmd_bytes = (command + "\r\n").encode("ascii")
-            self._serial.write(cmd_bytes)
-            self._serial.flush()
-
-            if expect_response:
-                time.sleep(0.1)  # Give controller time to respond
+            retries = 0
+            if expect_response and "TE?" not in command.upper():
+                retries = self.query_retries
+            reply = transport.query(command, response=expect_response, retries=retries)
+            if reply is None:
+                return None
+            if not expect_response:
+                return ""
 
-                # Read response (ESP300 typically responds quickly)
-                response_bytes = self._serial.readline()
-                response = response_bytes.decode("ascii", errors="ignore").strip()
+            response = reply.decode("ascii", errors="ignore").strip()
 
-                # Check for error responses
-                if response.startswith("ERROR"):
-                    logger.error(f"ESP300 command error: {response}")
-                    return None
+            # Check for error responses
+            if response.startswith("ERROR"):
+                logger.error(f"ESP300 command error: {response}")
+                return None
 
-                return response if response else None
-            else:
-                time.sleep(0.05)  # Brief delay for command processing
-                return ""
+            return response if response else None
 
         except Exception as e:
             logger.error(f"Communication error: {e}")
             return None
 
+    def _get_transport(self) -> Optional[SerialTransport]:
+        """Return the transport of the open connection, or None."""
+        self._transport = SerialTransport.for_connection(
+            self._transport,
+            self._serial,
+            terminator=b"\n",
+            write_terminator=b"\r\n",
+            timeout=self.timeout,
+            name="ESP300",
+        )
+        return self._transport
+
     def is_connected(self) -> bool:
         """Check if ESP300 is connected."""
         return self._connected
@@ -526,20 +658,22 @@ class ESP300Controller:
             logger.error(f"Invalid error response: {response}")
             return -1
 
+    @staticmethod
+    def describe_error(error_code: int) -> str:
+        """Readable description of an ESP300 error code."""
+        if error_code > 100:
+            # Axis error
+            return str(ESP300AxisError(error_code))
+        # General error
+        return str(ESP300GeneralError(error_code))
+
     def clear_errors(self) -> List[str]:
         """Clear all error messages and return list of errors found."""
         errors = []
         try:
             error_code = self.get_error()
             while error_code != 0 and error_code != -1:
-                if error_code > 100:
-                    # Axis error
-                    error = ESP300AxisError(error_code)
-                    errors.append(str(error))
-                else:
-                    # General error
-                    error = ESP300GeneralError(error_code)
-                    errors.append(str(error))
+                errors.append(self.describe_error(error_code))
 
                 # Get next error
                 error_code = self.get_error()
@@ -590,17 +724,217 @@ class ESP300Controller:
                 logger.error(f"Failed to stop axis {axis.axis_number}")
         return success
 
+    def query_axes(
+        self, queries: List[str], axis_numbers: Optional[List[int]] = None
+    ) -> Optional[List[str]]:
+        """
+        Run axis queries for several axes in one semicolon-chained command.
+
+        The ESP300 answers chained queries on a single line with the replies
+        separated by commas, in command order.
+
+        Args:
+            queries: Axis query mnemonics, e.g. ["TP", "MD?"]
+            axis_numbers: Axes to query (default: all configured axes)
+
+        Returns:
+            Replies in order (axis-major), or None if the reply was missing
+            or did not contain one field per query
+        """
+        if axis_numbers is None:
+            axis_numbers = list(self.axes)
+        commands = [f"{num}{query}" for num in axis_numbers for query in queries]
+        if not commands:
+            return []
+
+        response = self._send_command(";".join(commands))
+        if response is None:
+            return None
+
+        fields = [field.strip() for field in response.split(",")]
+        if len(fields) != len(commands):
+            logger.error(
+                f"Batched query {commands} returned {len(fields)} fields: {response}"
+            )
+            return None
+        return fields
+
+    def get_status(
+        self, axis_numbers: Optional[List[int]] = None
+    ) -> Optional[ESP300Status]:
+        """
+        Read position and motion-done state of all axes plus the error code.
+
+        Args:
+            axis_numbers: Axes to query (default: all configured axes)
+
+        Returns:
+            ESP300Status, or None on communication failure
+        """
+        if axis_numbers is None:
+            axis_numbers = list(self.axes)
+
+        # TE? is a controller query; chain it after the axis queries
+        commands = [f"{num}{query}" for num in axis_numbers for query in ("TP", "MD?")]
+        response = self._send_command(";".join(commands + ["TE?"]))
+        if response is None:
+            return None
+
+        try:
+            fields = [field.strip() for field in response.split(",")]
+            if len(fields) != len(commands) + 1:
+                raise ValueError(f"expected {len(commands) + 1} fields")
+            return ESP300Status(
+                positions={
+                    num: float(fields[2 * i]) for i, num in enumerate(axis_numbers)
+                },
+                motion_done={
+                    num: bool(int(fields[2 * i + 1]))
+                    for i, num in enumerate(axis_numbers)
+                },
+                error_code=int(fields[-1]),
+            )
+        except (ValueError, TypeError) as e:
+            logger.error(f"Invalid status response {response!r}: {e}")
+            return None
+
     def get_all_positions(self) -> Dict[int, float]:
-        """Get positions of all axes."""
+        """Get positions of all axes in a single round trip."""
+        axis_numbers = list(self.axes)
+        fields = self.query_axes(["TP"], axis_numbers)
+        if fields is None:
+            # Fall back to per-axis queries so one bad axis does not hide the rest
+            positions = {}
+            for axis_num, axis in self.axes.items():
+                pos = axis.get_position()
+                if pos is not None:
+                    positions[axis_num] = pos
+            return positions
+
         positions = {}
-        for axis_num, axis in self.axes.items():
-            pos = axis.get_position()
-            if pos is not None:
-                positions[axis_num] = pos
+        for axis_num, field in zip(axis_numbers, fields):
+            try:
+                positions[axis_num] = float(field)
+            except ValueError:
+                logger.error(f"Invalid position response for axis {axis_num}: {field}")
         return positions
 
+    def get_motion_done(
+        self, axis_numbers: Optional[List[int]] = None
+    ) -> Dict[int, bool]:
+        """
+        Get motion-done flags of several axes in a single round trip.
+
+        Axes whose state cannot be read are reported as not done.
+        """
+        if axis_numbers is None:
+            axis_numbers = list(self.axes)
+        fields = self.query_axes(["MD?"], axis_numbers)
+        if fields is None:
+            return {num: False for num in axis_numbers}
+
+        done = {}
+        for axis_num, field in zip(axis_numbers, fields):
+            try:
+                done[axis_num] = bool(int(field))
+            except ValueError:
+                logger.error(
+                    f"Invalid motion done response for axis {axis_num}: {field}"
+                )
+                done[axis_num] = False
+        return done
+
+    def wait_for_motion(
+        self,
+        axis_numbers: Optional[List[int]] = None,
+        targets: Optional[Dict[int, float]] = None,
+        timeout: float = 30.0,
+    ) -> Dict[int, Optional[float]]:
+        """
+        Wait for several axes to stop, polling them all in one query.
+
+        When target positions are given, the remaining travel and the axis
+        velocities (read once with VA?) estimate the time to arrival, and the
+        poll interval is half of the shortest estimate, clamped to
+        [min_poll_interval, max_poll_interval].
+
+        Args:
+            axis_numbers: Axes to wait for (default: the keys of targets, or
+                all configured axes)
+            targets: Target position of each moving axis
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            Dict mapping axis number to the time (s) at which it was first
+            seen stopped, or None if it was still moving at the timeout.
+            An error reported while waiting is kept in ``last_error``.
+        """
+        if axis_numbers is None:
+            axis_numbers = list(targets) if targets else list(self.axes)
+        axis_numbers = list(axis_numbers)
+        completion: Dict[int, Optional[float]] = {num: None for num in axis_numbers}
+
+        velocities = self._read_velocities(axis_numbers) if targets else {}
+
+        start = time.monotonic()
+        pending = list(axis_numbers)
+        while pending:
+            elapsed = time.monotonic() - start
+            status = self.get_status(pending)
+            if status is not None:
+                if status.error_code:
+                    self.last_error = status.error_code
+                    logger.warning(self.describe_error(status.error_code))
+                for num in pending:
+                    if status.motion_done.get(num):
+                        completion[num] = elapsed
+                pending = [num for num in pending if completion[num] is None]
+            if not pending:
+                break
+
+            if elapsed >= timeout:
+                logger.warning(f"Timeout waiting for axes {pending} to stop")
+                break
+
+            interval = self._poll_interval(status, pending, targets, velocities)
+            time.sleep(min(interval, max(0.0, timeout - elapsed)))
+
+        return completion
+
+    def _read_velocities(self, axis_numbers: List[int]) -> Dict[int, float]:
+        """Read the velocity of several axes with one VA? query."""
+        velocities = {}
+        fields = self.query_axes(["VA?"], axis_numbers)
+        for num, field in zip(axis_numbers, fields or []):
+            try:
+                velocities[num] = abs(float(field))
+            except ValueError:
+                pass
+        return velocities
+
+    def _poll_interval(
+        self,
+        status: Optional[ESP300Status],
+        axis_numbers: List[int],
+        targets: Optional[Dict[int, float]],
+        velocities: Dict[int, float],
+    ) -> float:
+        """
+        Half the shortest estimated time to arrival of the moving axes,
+        clamped to [min_poll_interval, max_poll_interval].
+        """
+        interval = self.max_poll_interval
+        if status is not None and targets:
+            for num in axis_numbers:
+                position = status.positions.get(num)
+                if position is None or not velocities.get(num) or num not in targets:
+                    continue
+                remaining = abs(targets[num] - position)
+                interval = min(interval, remaining / velocities[num] / 2)
+        return max(interval, self.min_poll_interval)
+
     def move_multiple_axes(
-        self, positions: Dict[int, float], wait: bool = True
+        self, positions: Dict[int, float], wait: bool = True, timeout: float = 30.0
     ) -> bool:
         """
         Move multiple axes simultaneously.
@@ -608,10 +942,14 @@ class ESP300Controller:
         Args:
             positions: Dict mapping axis number to target position
             wait: Whether to wait for all motions to complete
+            timeout: Maximum wait time in seconds
 
         Returns:
-            True if all moves initiated successfully
+            True if all moves initiated successfully (and, with ``wait``,
+            completed without the controller reporting an error)
         """
+        self.last_error = 0
+
         # Start all moves
         success = True
         for axis_num, position in positions.items():
@@ -626,16 +964,20 @@ class ESP300Controller:
 
         # Wait for completion if requested
         if wait and success:
-            for axis_num in positions.keys():
-                axis = self.axes.get(axis_num)
-                if axis and not axis.wait_for_stop():
+            completion = self.wait_for_motion(targets=positions, timeout=timeout)
+            for axis_num, done_at in completion.items():
+                if done_at is None:
                     success = False
                     logger.error(f"Timeout waiting for axis {axis_num}")
+            if self.last_error:
+                success = False
+                logger.error(f"Move failed: {self.describe_error(self.last_error)}")
 
         return success
 
     def home_all_axes(self, home_type: int = 1, wait: bool = True) -> bool:
         """Home all configured axes."""
+        self.last_error = 0
         success = True
 
         # Start homing on all axes
@@ -646,13 +988,194 @@ class ESP300Controller:
 
         # Wait for completion if requested
         if wait and success:
-            for axis in self.axes.values():
-                if not axis.wait_for_stop(timeout=60.0):  # Longer timeout for homing
+            # Longer timeout for homing
+            completion = self.wait_for_motion(list(self.axes), timeout=60.0)
+            for axis_num, done_at in completion.items():
+                if done_at is None:
                     success = False
-                    logger.error(f"Timeout homing axis {axis.axis_number}")
+                    logger.error(f"Timeout homing axis {axis_num}")
+            if self.last_error:
+                success = False
+                logger.error(f"Homing failed: {self.describe_error(self.last_error)}")
 
         return success
 
+    def upload_program(self, program_number: int, lines: List[str]) -> bool:
+        """
+        Store a program in the controller memory, replacing any previous one.
+
+        Args:
+            program_number: Program slot (1-100)
+            lines: Commands to store, one program line each
+
+        Returns:
+            True if the controller accepted the program without error
+        """
+        if not 1 <= program_number <= self.max_programs:
+            logger.error(f"Invalid program number {program_number}")
+            return False
+        transport = self._get_transport()
+        if transport is None:
+            logger.error("Serial connection not available")
+            return False
+
+        try:
+            self.clear_errors()
+            # Erasing a missing program raises an error on the controller;
+            # drain it so it is not mistaken for an upload failure
+            self._send_command(f"{program_number}XX", expect_response=False)
+            self.clear_errors()
+
+            # The controller does not answer while in program mode, so the
+            # lines are queued back-to-back; the error query's reply only
+            # arrives once every program line has been processed
+            transport.write(f"{program_number}EP")
+            for line in lines:
+                transport.write(line)
+            transport.write("QP")
+            reply = transport.query("TE?")
+            reply = reply.decode("ascii", errors="ignore").strip() if reply else ""
+        except Exception as e:
+            logger.error(f"Error uploading program {program_number}: {e}")
+            return False
+
+        if reply != "0":
+            errors = [reply or "no reply"] + self.clear_errors()
+            logger.error(f"Program {program_number} upload failed: {errors}")
+            return False
+        logger.debug(f"Uploaded program {program_number} ({len(lines)} lines)")
+        return True
+
+    def run_program(self, program_number: int) -> bool:
+        """Start executing a stored program."""
+        return self._send_command(f"{program_number}EX", expect_response=False) == ""
+
+    def upload_trajectory(
+        self, trajectory: ESP300Trajectory, first_program: int = 1
+    ) -> Optional[List[int]]:
+        """
+        Store every segment of a trajectory as its own program.
+
+        Args:
+            trajectory: Trajectory to store
+            first_program: Program number of the first segment
+
+        Returns:
+            Program numbers in segment order, or None on failure
+        """
+        segments = trajectory.segments()
+        programs = list(range(first_program, first_program + len(segments)))
+        if programs and programs[-1] > self.max_programs:
+            logger.error(
+                f"Trajectory needs {len(segments)} programs, only "
+                f"{self.max_programs - first_program + 1} available"
+            )
+            return None
+
+        for program, segment in zip(programs, segments):
+            if not self.upload_program(program, trajectory.program_lines(segment)):
+                return None
+        return programs
+
+    def run_trajectory(
+        self,
+        trajectory: ESP300Trajectory,
+        programs: Optional[List[int]] = None,
+        on_sync: Optional[Callable[[int], Any]] = None,
+        timeout: float = 60.0,
+        tolerance: float = 1e-3,
+    ) -> bool:
+        """
+        Execute a stored trajectory, pausing at each synchronization point.
+
+        Args:
+            trajectory: Trajectory to execute
+            programs: Program numbers from upload_trajectory (uploaded here
+                if not given)
+            on_sync: Called with the point index at each synchronization
+                point, before the next segment starts; returning False
+                aborts the trajectory
+            timeout: Maximum duration of one segment in seconds
+            tolerance: Position match tolerance used to track progress
+
+        Returns:
+            True if every segment completed
+        """
+        if programs is None:
+            programs = self.upload_trajectory(trajectory)
+            if programs is None:
+                return False
+
+        self.trajectory_progress = -1
+        self.last_error = 0
+        velocities = self._read_velocities(trajectory.axis_numbers)
+        for program, segment in zip(programs, trajectory.segments()):
+            if not self.run_program(program):
+                logger.error(f"Failed to start program {program}")
+                return False
+            if not self._track_segment(
+                trajectory, segment, velocities, timeout, tolerance
+            ):
+                self.stop_all_axes()
+                return False
+            if on_sync is not None and on_sync(segment[-1]) is False:
+                logger.info(f"Trajectory aborted at point {segment[-1]}")
+                return False
+        return True
+
+    def _track_segment(
+        self,
+        trajectory: ESP300Trajectory,
+        segment: range,
+        velocities: Dict[int, float],
+        timeout: float,
+        tolerance: float,
+    ) -> bool:
+        """
+        Follow a running segment until its program has finished.
+
+        The program ends with the dwell at the last point, so the segment
+        only counts as done once the axes have stopped there and the dwell
+        has elapsed. Polls adapt to the travel left to the next point like
+        ``wait_for_motion``.
+        """
+        deadline = time.monotonic() + timeout
+        last = segment[-1]
+        axis_numbers = trajectory.axis_numbers
+        while time.monotonic() < deadline:
+            status = self.get_status(axis_numbers)
+            if status is not None:
+                if status.error_code:
+                    self.last_error = status.error_code
+                    logger.error(f"ESP300 error {status.error_code} during trajectory")
+                    return False
+                index = trajectory.locate(
+                    status.positions,
+                    max(self.trajectory_progress, segment[0]),
+                    tolerance,
+                )
+                if index is not None and index <= last:
+                    self.trajectory_progress = index
+                # Checked separately so repeated points cannot hide the end
+                if status.all_done and (
+                    trajectory.locate(status.positions, last, tolerance) == last
+                ):
+                    self.trajectory_progress = last
+                    # The program is still dwelling at its last point; the
+                    # extra poll interval covers the controller noticing
+                    # the stop after we did
+                    if trajectory.dwell > 0:
+                        time.sleep(trajectory.dwell + self.min_poll_interval)
+                    return True
+
+            upcoming = trajectory.points[min(self.trajectory_progress + 1, last)]
+            targets = dict(zip(axis_numbers, upcoming))
+            interval = self._poll_interval(status, axis_numbers, targets, velocities)
+            time.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+
+        logger.error(f"Timeout executing trajectory points {segment}")
+        return False
+
     def get_device_info(self) -> Dict[str, Any]:
         """Get comprehensive device information."""
         info = {
@@ -665,7 +1188,28 @@ class ESP300Controller:
         }
 
         if self._connected:
-            # Get axis information
+            # Every axis field in one chained round trip
+            fields = self.query_axes(["TP", "SN?", "MO?", "MD?"])
+            if fields is not None:
+                try:
+                    for index, (axis_num, axis) in enumerate(self.axes.items()):
+                        position, units, enabled, done = fields[
+                            4 * index : 4 * index + 4
+                        ]
+                        info["axes"][axis_num] = {
+                            "name": axis.config.name,
+                            "position": float(position),
+                            "units": ESP300Axis.units_name(int(units))
+                            or axis.config.units,
+                            "enabled": bool(int(enabled)),
+                            "motion_done": bool(int(done)),
+                        }
+                    return info
+                except ValueError as e:
+                    logger.error(f"Invalid batched device info {fields}: {e}")
+                    info["axes"] = {}
+
+            # Get axis information one query at a time
             for axis_num, axis in self.axes.items():
                 axis_info = {
                     "name": axis.config.name,
@@ -0,0 +1,649 @@
+# -*- coding: utf-8 -*-
+"""
+Continuous frame acquisition for PVCAM cameras.
+
+FrameRingBuffer keeps the most recent frames in one preallocated array.
+ContinuousAcquisition runs a PyVCAM live (``start_live``) or sequence
+(``start_seq``) acquisition and copies every polled frame into the ring
+buffer from a producer thread. The camera then overlaps exposure with
+readout and consumers read frames at the sensor's native rate instead of
+paying the setup and teardown of one ``get_frame`` call per frame.
+FramePool recycles the frame buffers handed to downstream consumers,
+FrameAccumulator averages any number of frames in constant memory and
+PreviewStream reduces the stream to a rate-limited, low-resolution preview
+for display without ever blocking the acquisition.
+"""
+
+import logging
+import threading
+import time
+import weakref
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class FrameRingBuffer:
+    """
+    Fixed-size ring of the most recent camera frames.
+
+    Frames are numbered from 0 in arrival order. Readers wait for a frame
+    number and read it in place; a frame is overwritten ``capacity`` frames
+    later, and frames a reader falls behind on are counted as dropped.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of frames kept
+    shape : tuple, optional
+        Frame shape; allocated from the first frame when not given
+    dtype : numpy dtype
+        Pixel type
+    """
+
+    def __init__(self, capacity: int = 16, shape=None, dtype=np.uint16):
+        if capacity < 2:
+            raise ValueError("Ring buffer capacity must be at least 2 frames")
+        self.capacity = capacity
+        self.frames: Optional[np.ndarray] = None
+        self.timestamps = np.zeros(capacity)
+        self.count = 0
+        self.dropped = 0
+        self.closed = False
+        self._condition = threading.Condition()
+        if shape is not None:
+            self._allocate(tuple(shape), np.dtype(dtype))
+
+    def _allocate(self, shape: Tuple[int, ...], dtype: np.dtype):
+        self.frames = np.empty((self.capacity,) + shape, dtype=dtype)
+
+    def put(self, frame: np.ndarray, timestamp: Optional[float] = None):
+        """Copy a frame into the next slot (producer thread only)."""
+        if (
+            self.frames is None
+            or self.frames.shape[1:] != frame.shape
+            or self.frames.dtype != frame.dtype
+        ):
+            with self._condition:
+                self._allocate(frame.shape, frame.dtype)
+        slot = self.count % self.capacity
+        np.copyto(self.frames[slot], frame)
+        self.timestamps[slot] = time.monotonic() if timestamp is None else timestamp
+        with self._condition:
+            self.count += 1
+            self._condition.notify_all()
+
+    def oldest(self) -> int:
+        """Number of the oldest frame that cannot be overwritten while read."""
+        # The slot after the newest frame is the next one written
+        return max(self.count + 1 - self.capacity, 0)
+
+    def is_valid(self, number: int) -> bool:
+        """Whether a frame is still in the buffer, e.g. after reading it."""
+        return self.oldest() <= number < self.count
+
+    def wait(self, number: int, timeout: float) -> int:
+        """
+        Wait for a frame to arrive.
+
+        Returns
+        -------
+        int
+            ``number``, or the oldest frame still buffered if it was already
+            overwritten; -1 on timeout or once the buffer is closed
+        """
+        with self._condition:
+            if (
+                not self._condition.wait_for(
+                    lambda: self.count > number or self.closed, timeout=timeout
+                )
+                or self.count <= number
+            ):
+                return -1
+            oldest = self.oldest()
+            if number < oldest:
+                self.dropped += oldest - number
+                return oldest
+            return number
+
+    def close(self):
+        """Wake up waiting readers; no more frames will arrive."""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def frame(self, number: int) -> np.ndarray:
+        """The buffered frame ``number`` (a view into the ring)."""
+        return self.frames[number % self.capacity]
+
+    def latest(self) -> Optional[np.ndarray]:
+        """Copy of the newest frame, None if none arrived yet."""
+        while self.count:
+            number = self.count - 1
+            frame = self.frame(number).copy()
+            if self.is_valid(number):
+                return frame
+        return None
+
+    def average(
+        self,
+        first: int,
+        count: int,
+        timeout: float,
+        out: Optional[np.ndarray] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        Average ``count`` consecutive frames starting at frame ``first``.
+
+        Parameters
+        ----------
+        first : int
+            Number of the first frame
+        count : int
+            Number of frames averaged
+        timeout : float
+            Seconds to wait for the frames
+        out : numpy.ndarray, optional
+            Array receiving the result, e.g. from a FramePool; must be
+            floating point when ``count`` > 1. Allocated when not given.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            A single frame keeps its dtype, averages are float64; None if
+            the frames do not arrive in time
+        """
+        deadline = time.monotonic() + timeout
+        summed = 0
+        number = first
+        while summed < count:
+            number = self.wait(number, deadline - time.monotonic())
+            if number < 0:
+                return None
+            frame = self.frame(number)
+            if out is None:
+                out = np.empty(frame.shape, frame.dtype if count == 1 else np.float64)
+            if summed == 0:
+                np.copyto(out, frame, casting="unsafe")
+            else:
+                np.add(out, frame, out=out)
+            number += 1
+            if not self.is_valid(number - 1):
+                # Overwritten while reading: start over with later frames
+                self.dropped += summed + 1
+                summed = 0
+                continue
+            summed += 1
+        if count > 1:
+            out /= count
+        return out
+
+
+class FrameAccumulator:
+    """
+    Running mean (and optionally variance) of frames in constant memory.
+
+    Frames are folded into one sum buffer as they arrive instead of being
+    kept until the end, so memory does not grow with the number of frames
+    and each frame costs the same. Unsigned frames of up to 16 bits are
+    summed exactly in uint32 (promoted to uint64 if that could overflow) and
+    their squares in uint64; other frames in float64, with squares taken
+    about the first frame to limit cancellation.
+
+    Parameters
+    ----------
+    variance : bool
+        Also accumulate the sum of squares needed by ``variance``
+    """
+
+    def __init__(self, variance: bool = False):
+        self.track_variance = variance
+        self.count = 0
+        self._sum: Optional[np.ndarray] = None
+        self._squares: Optional[np.ndarray] = None
+        self._scratch: Optional[np.ndarray] = None
+        self._shift: Optional[np.ndarray] = None
+        self._raw: Optional[np.ndarray] = None
+        self._limit = 0
+
+    @property
+    def shape(self) -> Optional[Tuple[int, ...]]:
+        return None if self._sum is None else self._sum.shape
+
+    @staticmethod
+    def _is_exact(dtype: np.dtype) -> bool:
+        return np.issubdtype(dtype, np.unsignedinteger) and dtype.itemsize <= 2
+
+    def reset(self):
+        """Start a new average, keeping the buffers."""
+        self.count = 0
+
+    def _start(self, frame: np.ndarray):
+        exact = self._is_exact(frame.dtype)
+        sum_dtype = np.dtype(np.uint32 if exact else np.float64)
+        square_dtype = np.dtype(np.uint64 if exact else np.float64)
+        if (
+            self._sum is None
+            or self._sum.shape != frame.shape
+            or self._sum.dtype != sum_dtype
+        ):
+            self._sum = np.empty(frame.shape, sum_dtype)
+            self._squares = self._scratch = self._shift = None
+        if self.track_variance and (
+            self._squares is None or self._squares.dtype != square_dtype
+        ):
+            self._squares = np.empty(frame.shape, square_dtype)
+            # 16-bit squares fit in uint32 products
+            self._scratch = np.empty(frame.shape, np.uint32 if exact else np.float64)
+            self._shift = None if exact else np.empty(frame.shape, np.float64)
+        # Frames that fit in uint32 without overflow
+        self._limit = (2**32 - 1) // np.iinfo(frame.dtype).max if exact else 0
+
+        np.copyto(self._sum, frame)
+        if self.track_variance:
+            if exact:
+                np.multiply(frame, frame, out=self._squares, dtype=np.uint64)
+            else:
+                np.copyto(self._shift, frame)
+                self._squares.fill(0)
+
+    def add(self, frame: np.ndarray):
+        """Fold one frame into the running sums."""
+        if self.count == 0:
+            self._start(frame)
+            self.count = 1
+            return
+        if frame.shape != self._sum.shape:
+            raise ValueError(
+                f"Frame shape {frame.shape} does not match the accumulated "
+                f"{self._sum.shape}"
+            )
+        if self.count == self._limit and self._sum.dtype == np.uint32:
+            self._sum = self._sum.astype(np.uint64)
+        np.add(self._sum, frame, out=self._sum, casting="unsafe")
+        if self.track_variance:
+            if self._shift is None:
+                np.multiply(frame, frame, out=self._scratch, dtype=np.uint32)
+            else:
+                np.subtract(frame, self._shift, out=self._scratch)
+                np.square(self._scratch, out=self._scratch)
+            np.add(self._squares, self._scratch, out=self._squares)
+        self.count += 1
+
+    def accumulate(
+        self, buffer: "FrameRingBuffer", first: int, count: int, timeout: float
+    ) -> int:
+        """
+        Fold in ``count`` frames of a continuous acquisition as they arrive.
+
+        Parameters
+        ----------
+        buffer : FrameRingBuffer
+            Ring buffer of a running ContinuousAcquisition
+        first : int
+            Number of the first frame
+        count : int
+            Number of frames to add
+        timeout : float
+            Seconds to wait for the frames
+
+        Returns
+        -------
+        int
+            Frames added; fewer than ``count`` on timeout
+        """
+        deadline = time.monotonic() + timeout
+        added = 0
+        number = first
+        while added < count:
+            number = buffer.wait(number, deadline - time.monotonic())
+            if number < 0:
+                break
+            frame = buffer.frame(number)
+            if self._raw is None or self._raw.shape != frame.shape:
+                self._raw = np.empty_like(frame)
+            np.copyto(self._raw, frame, casting="unsafe")
+            number += 1
+            if not buffer.is_valid(number - 1):
+                # Overwritten while copying
+                buffer.dropped += 1
+                continue
+            self.add(self._raw)
+            added += 1
+        return added
+
+    def mean(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Mean frame, written into ``out`` (float) when given."""
+        if self.count == 0:
+            raise ValueError("No frames accumulated")
+        return np.divide(self._sum, self.count, out=out)
+
+    def variance(self, ddof: int = 1) -> np.ndarray:
+        """Per-pixel variance of the accumulated frames."""
+        if not self.track_variance:
+            raise ValueError("Accumulator does not track the variance")
+        if self.count <= ddof:
+            raise ValueError(f"Variance needs more than {ddof} frames")
+        sums = self._sum.astype(np.float64)
+        if self._shift is not None:
+            sums -= self.count * self._shift
+        variance = self._squares - sums * sums / self.count
+        variance /= self.count - ddof
+        return np.maximum(variance, 0.0, out=variance)
+
+
+def reduce_frame(
+    frame: np.ndarray, factor: int, mode: str = "bin", out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Reduce a 2D frame by an integer factor along both axes.
+
+    Parameters
+    ----------
+    frame : numpy.ndarray
+        2D frame
+    factor : int
+        Reduction factor; trailing rows and columns that do not fill a whole
+        block are left out
+    mode : str
+        ``"bin"`` averages each factor x factor block, ``"decimate"`` keeps
+        its first pixel
+    out : numpy.ndarray, optional
+        Float32 array of the reduced shape receiving the result
+
+    Returns
+    -------
+    numpy.ndarray
+        ``out``, or a new float32 frame
+    """
+    height, width = frame.shape[0] // factor, frame.shape[1] // factor
+    if height == 0 or width == 0:
+        raise ValueError(f"Frame {frame.shape} is smaller than the factor {factor}")
+    if out is None:
+        out = np.empty((height, width), np.float32)
+    if mode == "decimate":
+        np.copyto(out, frame[: height * factor : factor, : width * factor : factor])
+    elif mode == "bin":
+        blocks = frame[: height * factor, : width * factor].reshape(
+            height, factor, width, factor
+        )
+        np.mean(blocks, axis=(1, 3), dtype=np.float32, out=out)
+    else:
+        raise ValueError(f"Unknown reduction mode {mode!r}")
+    return out
+
+
+class PreviewStream:
+    """
+    Rate-limited, reduced-resolution view of a frame stream, for display.
+
+    ``submit`` only puts the newest frame into a one-frame mailbox, so the
+    acquisition never waits for the preview: a frame replaced before the
+    preview thread took it is stale and dropped. The preview thread wakes
+    at most ``rate`` times per second and reduces the newest frame into
+    ``latest``, so display costs do not grow with the camera frame rate or
+    resolution.
+
+    Parameters
+    ----------
+    factor : int
+        Reduction factor along both axes
+    rate : float
+        Maximum previews per second
+    mode : str
+        ``"bin"`` or ``"decimate"``, see ``reduce_frame``
+    """
+
+    def __init__(self, factor: int = 4, rate: float = 30.0, mode: str = "bin"):
+        self.factor = factor
+        self.rate = rate
+        self.mode = mode
+        self.latest: Optional[np.ndarray] = None
+        self.previewed = 0
+        self.dropped = 0
+        self._pending: Optional[np.ndarray] = None
+        self._condition = threading.Condition()
+        self._stop = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def reduce(self, frame: np.ndarray) -> np.ndarray:
+        """Preview of a frame, computed in the calling thread."""
+        return reduce_frame(frame, self.factor, self.mode)
+
+    def submit(self, frame: np.ndarray):
+        """Offer the newest frame for preview; never blocks on the preview."""
+        with self._condition:
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = frame
+            self._condition.notify()
+
+    def start(self):
+        """Start the preview thread."""
+        if self.is_running:
+            return
+        self._stop = False
+        self._thread = threading.Thread(
+            target=self._run, name="FramePreview", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the preview thread and drop any pending frame."""
+        with self._condition:
+            self._stop = True
+            self._pending = None
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _run(self):
+        next_time = 0.0
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._pending is not None or self._stop
+                )
+                if self._stop:
+                    return
+            # Let newer frames replace this one until the next preview is due
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                with self._condition:
+                    if self._condition.wait_for(lambda: self._stop, timeout=delay):
+                        return
+            with self._condition:
+                frame, self._pending = self._pending, None
+            if frame is None:
+                continue
+            next_time = time.monotonic() + 1.0 / max(self.rate, 1e-3)
+            try:
+                self.latest = self.reduce(frame)
+                self.previewed += 1
+            except Exception as e:
+                logger.warning(f"Preview failed: {e}")
+
+
+class _Lease:
+    """Owner of one pool buffer while arrays backed by it are alive."""
+
+    __slots__ = ("buffer", "__array_interface__", "__weakref__")
+
+    def __init__(self, buffer: np.ndarray):
+        self.buffer = buffer
+        self.__array_interface__ = buffer.__array_interface__
+
+
+class FramePool:
+    """
+    Reusable, preallocated frame buffers.
+
+    ``acquire`` hands out an array backed by a free buffer. The buffer goes
+    back to the pool once that array and every view derived from it are
+    garbage collected, so downstream consumers release a frame by dropping
+    it. New buffers are only allocated while all of them are in use, hence a
+    steady-state acquisition allocates no frame memory.
+
+    Parameters
+    ----------
+    shape : tuple
+        Frame shape
+    dtype : numpy dtype
+        Pixel type
+    size : int
+        Buffers allocated up front
+    """
+
+    def __init__(self, shape, dtype=np.uint16, size: int = 4):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.allocated = 0
+        self._free: List[np.ndarray] = []
+        self._lock = threading.Lock()
+        for _ in range(size):
+            self._free.append(self._allocate())
+
+    def _allocate(self) -> np.ndarray:
+        buffer = np.empty(self.shape, dtype=self.dtype)
+        # Touch every page now rather than on the first frame
+        buffer.fill(0)
+        self.allocated += 1
+        return buffer
+
+    @property
+    def available(self) -> int:
+        """Buffers currently free."""
+        return len(self._free)
+
+    def matches(self, shape, dtype) -> bool:
+        return self.shape == tuple(shape) and self.dtype == np.dtype(dtype)
+
+    def acquire(self) -> np.ndarray:
+        """A free buffer, returned to the pool when no longer referenced."""
+        with self._lock:
+            buffer = self._free.pop() if self._free else None
+        if buffer is None:
+            buffer = self._allocate()
+            logger.debug(f"Frame pool grown to {self.allocated} buffers")
+        lease = _Lease(buffer)
+        weakref.finalize(lease, self._release, buffer)
+        return np.asarray(lease)
+
+    def _release(self, buffer: np.ndarray):
+        with self._lock:
+            self._free.append(buffer)
+
+
+class ContinuousAcquisition:
+    """
+    Stream frames of a PyVCAM camera into a FrameRingBuffer.
+
+    Parameters
+    ----------
+    camera : pyvcam.camera.Camera
+        Open camera
+    exposure : float
+        Exposure time in the camera's exposure resolution (ms by default)
+    buffer_frames : int
+        Capacity of the ring buffer and of the PVCAM circular buffer
+    frames : int, optional
+        Acquire a sequence of this many frames (``start_seq``); stream until
+        stopped (``start_live``) when None
+    """
+
+    # Timeout of one poll_frame call, so stop() is noticed
+    poll_timeout_ms = 500
+
+    def __init__(
+        self,
+        camera,
+        exposure: float,
+        buffer_frames: int = 16,
+        frames: Optional[int] = None,
+    ):
+        self.camera = camera
+        self.exposure = exposure
+        self.frames = frames
+        self.buffer = FrameRingBuffer(buffer_frames)
+        self.fps = 0.0
+        self.error: Optional[Exception] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the acquisition and the producer thread."""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self.error = None
+        self.buffer.closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="PVCAMAcquisition", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the acquisition and wait for the producer thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_timeout_ms / 1000.0 + 2.0)
+            self._thread = None
+        self.buffer.close()
+
+    def frame_timeout(self, count: int = 1) -> float:
+        """Generous time in seconds for ``count`` frames to arrive."""
+        return count * self.exposure / 1000.0 + 2.0
+
+    def _run(self):
+        exp_time = int(round(self.exposure))
+        try:
+            if self.frames is None:
+                self.camera.start_live(
+                    exp_time=exp_time, buffer_frame_count=self.buffer.capacity
+                )
+            else:
+                self.camera.start_seq(exp_time=exp_time, num_frames=self.frames)
+        except Exception as e:
+            logger.error(f"Failed to start continuous acquisition: {e}")
+            self.error = e
+            return
+
+        received = 0
+        try:
+            while not self._stop.is_set():
+                if self.frames is not None and received >= self.frames:
+                    break
+                try:
+                    frame, fps, _ = self.camera.poll_frame(
+                        timeout_ms=self.poll_timeout_ms, copyData=False
+                    )
+                except RuntimeError as e:
+                    # PyVCAM raises on a poll timeout; keep waiting
+                    logger.debug(f"No frame within {self.poll_timeout_ms} ms: {e}")
+                    continue
+                # Copy out of the PVCAM buffer before it is reused
+                self.buffer.put(frame["pixel_data"])
+                self.fps = fps
+                received += 1
+        except Exception as e:
+            logger.error(f"Continuous acquisition failed: {e}")
+            self.error = e
+        finally:
+            try:
+                if self.frames is None:
+                    self.camera.stop_live()
+                else:
+                    self.camera.finish()
+            except Exception as e:
+                logger.warning(f"Failed to end acquisition: {e}")
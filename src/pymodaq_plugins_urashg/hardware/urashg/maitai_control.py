@@ -7,9 +7,16 @@ Titanium Sapphire laser with realistic mock behavior that matches actual hardwar
 
 import logging
 import random
+import threading
 import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from threading import Lock
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+from .serial_transport import SerialTransport
+from .shg_scene import SCENE_STATE
 
 
 class MaiTaiError(Exception):
@@ -18,6 +25,37 @@ class MaiTaiError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class MaiTaiState:
+    """
+    Laser state published by the background poller.
+
+    Fields are None when the corresponding query failed during the cycle.
+    ``errors`` holds the errors popped off the laser's queue that no
+    ``check_system_errors`` call has collected yet.
+    """
+
+    timestamp: float
+    wavelength: Optional[float] = None
+    power: Optional[float] = None
+    shutter_open: Optional[bool] = None
+    status_byte: Optional[int] = None
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def emission_possible(self) -> bool:
+        return bool(self.status_byte is not None and self.status_byte & 1)
+
+    @property
+    def modelocked(self) -> bool:
+        return bool(self.status_byte is not None and self.status_byte & 2)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was completed."""
+        return time.time() - self.timestamp
+
+
 class MaiTaiController:
     """
     Hardware controller for Spectra-Physics MaiTai Titanium Sapphire Laser.
@@ -26,6 +64,12 @@ class MaiTaiController:
     with realistic mock behavior that closely mimics actual hardware responses.
     """
 
+    # Resends of a query ("...?") after a reply timeout
+    query_retries = 1
+
+    # Polled errors kept until check_system_errors collects them
+    max_pending_errors = 50
+
     def __init__(
         self,
         port: str = "",
@@ -58,8 +102,30 @@ class MaiTaiController:
         # Internal connection state
         self._connected = False
         self._serial_connection = None
+        self._transport: Optional[SerialTransport] = None
         self._lock = Lock()
 
+        # Background status poller: user commands register in
+        # _priority_waiters so the poller yields the port to them. Every
+        # set command bumps _command_count; a cycle that overlapped one is
+        # not published. _pending_errors keeps errors the poller popped
+        # off the laser until check_system_errors collects them.
+        self._state: Optional[MaiTaiState] = None
+        self._state_lock = Lock()
+        self._command_count = 0
+        self._pending_errors = deque(maxlen=self.max_pending_errors)
+        self._poll_interval = 1.0
+        self._poll_thread: Optional[threading.Thread] = None
+        self._poll_stop = threading.Event()
+        self._poll_wakeup = threading.Event()
+        self._priority_guard = Lock()
+        self._priority_waiters = 0
+
+        # Wavelength settling: last commanded wavelength and the measured
+        # (step in nm, settle time in s) of every tune_and_wait
+        self._wavelength_target: Optional[float] = None
+        self.settle_history: List[Tuple[float, float]] = []
+
         # Mock state variables
         self._mock_wavelength = 780.0  # Default wavelength
         self._mock_power = 2.5  # Default power in watts
@@ -120,6 +186,7 @@ class MaiTaiController:
 
     def disconnect(self):
         """Disconnect from MaiTai laser."""
+        self.stop_polling()
         with self._lock:
             self._cleanup_connection()
             self._connected = False
@@ -128,6 +195,9 @@ class MaiTaiController:
     def _cleanup_connection(self):
         """Clean up serial connection."""
         try:
+            if self._transport is not None:
+                self._transport.close()
+                self._transport = None
             if self._serial_connection and self._serial_connection.is_open:
                 self._serial_connection.close()
         except Exception:
@@ -143,7 +213,6 @@ class MaiTaiController:
 
             for cmd in test_commands:
                 try:
-                    time.sleep(0.2)
                     response = self._send_command(cmd)
                     if response is not None and response.strip() != "":
                         self.logger.debug(f"MaiTai responded to {cmd}: {response}")
@@ -177,38 +246,77 @@ class MaiTaiController:
             return self._mock_send_command(command, expect_response)
 
         try:
-            if not self._serial_connection or not self._serial_connection.is_open:
+            transport = self._get_transport()
+            if transport is None:
                 self.logger.error("Serial connection not available")
                 return None
 
-            # Clear buffers
-            self._serial_connection.reset_input_buffer()
-            self._serial_connection.reset_output_buffer()
-
-            # Send command
-            cmd_bytes = (command + "\r\n").encode("ascii")
-            self.logger.debug(f"Sending bytes: {cmd_bytes}")
-            bytes_written = self._serial_connection.write(cmd_bytes)
-            self._serial_connection.flush()
-            self.logger.debug(f"Wrote {bytes_written} bytes")
-
-            if expect_response:
-                time.sleep(0.3)
-                response = (
-                    self._serial_connection.readline()
-                    .decode("ascii", errors="ignore")
-                    .strip()
-                )
-                self.logger.debug(f"Received response: '{response}'")
-                return response
-            else:
-                time.sleep(0.05)
-                return ""
+            self.logger.debug(f"Sending command: {command!r}")
+            reply = transport.query(
+                command,
+                response=expect_response,
+                retries=self.query_retries if command.endswith("?") else 0,
+            )
+            if reply is None:
+                self.logger.debug(f"No response to '{command}'")
+                return None
+
+            response = reply.decode("ascii", errors="ignore").strip()
+            self.logger.debug(f"Received response: '{response}'")
+            return response
 
         except Exception as e:
             self.logger.error(f"Communication error with command '{command}': {e}")
             return None
 
+    def _query_pipelined(self, commands: List[str]) -> List[Optional[str]]:
+        """
+        Send several queries back-to-back and return the responses in order.
+
+        Parameters
+        ----------
+        commands : list of str
+            Query strings, each answered by one line
+
+        Returns
+        -------
+        list
+            Responses in query order, None for each query left unanswered
+        """
+        if self.mock_mode:
+            return [self._mock_send_command(cmd) for cmd in commands]
+
+        try:
+            transport = self._get_transport()
+            if transport is None:
+                self.logger.error("Serial connection not available")
+                return [None] * len(commands)
+            replies = transport.pipeline(commands)
+        except Exception as e:
+            self.logger.error(f"Communication error with {commands}: {e}")
+            return [None] * len(commands)
+
+        return [
+            (
+                reply.decode("ascii", errors="ignore").strip()
+                if reply is not None
+                else None
+            )
+            for reply in replies
+        ]
+
+    def _get_transport(self) -> Optional[SerialTransport]:
+        """Return the transport of the open connection, or None."""
+        self._transport = SerialTransport.for_connection(
+            self._transport,
+            self._serial_connection,
+            terminator=b"\n",
+            write_terminator=b"\r\n",
+            timeout=self.timeout,
+            name="MaiTai",
+        )
+        return self._transport
+
     def _mock_send_command(self, command: str, expect_response: bool = True):
         """Enhanced mock command handling with realistic SCPI protocol simulation."""
         # Simulate realistic communication delay
@@ -230,6 +338,7 @@ class MaiTaiController:
                         if 690 <= wl <= 1040:
                             old_wl = self._mock_wavelength
                             self._mock_wavelength = wl
+                            SCENE_STATE.set_wavelength(wl)
                             # Simulate tuning time based on wavelength change
                             tune_time = abs(wl - old_wl) * 0.01  # ~10ms per nm
                             if tune_time > 0.1:
@@ -271,6 +380,7 @@ class MaiTaiController:
             elif command.startswith("*RST"):
                 # Reset command - restore defaults
                 self._mock_wavelength = 780.0
+                SCENE_STATE.set_wavelength(780.0)
                 self._mock_power = 2.5
                 self._mock_shutter = False
                 self.logger.debug("Mock MaiTai system reset")
@@ -281,7 +391,13 @@ class MaiTaiController:
                 return ""
 
         # Handle query commands (response expected)
-        if command == "WAVELENGTH?" or command == "WAVEL?":
+        if command == "READ:WAV?" or command == "READ:WAVELENGTH?":
+            # Measured wavelength - the mock tunes instantly
+            response = f"{self._mock_wavelength:.1f}nm"
+            self.logger.debug(f"Mock MaiTai measured wavelength: {response}")
+            return response
+
+        elif command == "WAVELENGTH?" or command == "WAVEL?":
             # Return wavelength with realistic format variations
             formats = [
                 f"{self._mock_wavelength:.1f}nm",
@@ -347,30 +463,129 @@ class MaiTaiController:
             self.logger.warning(f"Mock MaiTai: Unknown command '{command}'")
             return "ERROR: Unknown command"
 
+    @contextmanager
+    def _priority_lock(self):
+        """Take the port lock ahead of the background poller."""
+        with self._priority_guard:
+            self._priority_waiters += 1
+        try:
+            with self._lock:
+                yield
+        finally:
+            with self._priority_guard:
+                self._priority_waiters -= 1
+            # Refresh the snapshot right after a user command
+            self._poll_wakeup.set()
+
+    def _record_command(self, **changes):
+        """
+        Invalidate poller cycles in flight and apply a set command's effect
+        to the snapshot; the caller must hold the lock.
+
+        Power and status byte depend on both wavelength and shutter, so they
+        are cleared until the next cycle reads them again.
+        """
+        with self._state_lock:
+            self._command_count += 1
+            if self._state is not None:
+                self._state = replace(
+                    self._state, power=None, status_byte=None, **changes
+                )
+
+    def _fresh_state(self) -> Optional[MaiTaiState]:
+        """The poller snapshot if polling and recent enough, else None."""
+        state = self._state
+        if state is None or not self.is_polling:
+            return None
+        if state.age > 2 * self._poll_interval:
+            return None
+        return state
+
+    def _query_wavelength(self) -> Optional[float]:
+        """Query the wavelength; the caller must hold the lock."""
+        try:
+            response = self._send_command("WAVELENGTH?")
+            if response:
+                # Parse response like "801nm" -> 801.0
+                wavelength_str = response.replace("nm", "").strip()
+                wavelength = float(wavelength_str)
+                return wavelength
+        except Exception as e:
+            self.logger.error(f"Error getting wavelength: {e}")
+        return None
+
+    def _query_actual_wavelength(self) -> Optional[float]:
+        """Query the measured wavelength; the caller must hold the lock."""
+        try:
+            response = self._send_command("READ:WAV?")
+            if response:
+                return float(response.replace("nm", "").strip())
+        except Exception as e:
+            self.logger.error(f"Error reading actual wavelength: {e}")
+        return None
+
+    def _query_power(self) -> Optional[float]:
+        """Query the output power; the caller must hold the lock."""
+        try:
+            response = self._send_command("POWER?")
+            if response:
+                # Parse response like "3.000W" -> 3.0
+                power_str = response.replace("W", "").strip()
+                power = float(power_str)
+                return power
+        except Exception as e:
+            self.logger.error(f"Error getting power: {e}")
+        return None
+
+    def _query_shutter(self) -> Optional[bool]:
+        """Query the shutter state; the caller must hold the lock."""
+        response = self._send_command("SHUTTER?")
+        if response:
+            return response.strip() == "1"
+        return None
+
+    def _query_status_byte(self) -> Tuple[int, dict]:
+        """Query and decode the status byte; the caller must hold the lock."""
+        try:
+            response = self._send_command("*STB?")
+            if response:
+                status_byte = int(response.strip())
+
+                # Decode status byte based on documentation
+                status_info = {
+                    "connected": True,
+                    "emission_possible": bool(status_byte & 1),  # Bit 0
+                    "modelocked": bool(status_byte & 2),  # Bit 1
+                    "raw_status": status_byte,
+                }
+
+                return status_byte, status_info
+            else:
+                return 0, {"connected": False, "error": "No response"}
+
+        except Exception as e:
+            self.logger.error(f"Error getting status byte: {e}")
+            return 0, {"connected": False, "error": str(e)}
+
     def get_wavelength(self):
         """
         Get current wavelength.
 
+        Served from the poller snapshot while it is recent, otherwise
+        queried from the laser.
+
         Returns
         -------
         float or None
             Current wavelength in nm, None if error
         """
+        state = self._fresh_state()
+        if state is not None and state.wavelength is not None:
+            return state.wavelength
         with self._lock:
             if not self._connected:
                 return None
-
-            try:
-                response = self._send_command("WAVELENGTH?")
-                if response:
-                    # Parse response like "801nm" -> 801.0
-                    wavelength_str = response.replace("nm", "").strip()
-                    wavelength = float(wavelength_str)
-                    return wavelength
-            except Exception as e:
-                self.logger.error(f"Error getting wavelength: {e}")
-
-            return None
+            return self._query_wavelength()
 
     def set_wavelength(self, wavelength: float) -> bool:
         """
@@ -386,7 +601,7 @@ class MaiTaiController:
         bool
             True if command sent successfully, False otherwise
         """
-        with self._lock:
+        with self._priority_lock():
             if not self._connected:
                 self.logger.error("Cannot set wavelength - not connected")
                 return False
@@ -400,6 +615,8 @@ class MaiTaiController:
                 response = self._send_command(command, expect_response=False)
 
                 if response is not None:
+                    self._wavelength_target = wavelength_rounded
+                    self._record_command(wavelength=wavelength_rounded)
                     self.logger.info("Wavelength set command sent successfully")
                     return True
                 else:
@@ -410,6 +627,71 @@ class MaiTaiController:
                 self.logger.error(f"Error setting wavelength: {e}")
                 return False
 
+    def tune_and_wait(
+        self,
+        wavelength: float,
+        tolerance: float = 0.5,
+        timeout: float = 30.0,
+        poll_interval: float = 0.05,
+    ) -> Optional[float]:
+        """
+        Set the wavelength and wait until the laser has settled.
+
+        The laser is settled once the measured wavelength (``READ:WAV?``) is
+        within tolerance of the target and the status byte reports
+        modelocked operation.
+
+        Parameters
+        ----------
+        wavelength : float
+            Target wavelength in nm
+        tolerance : float
+            Allowed deviation of the measured wavelength in nm
+        timeout : float
+            Maximum wait in seconds
+        poll_interval : float
+            Pause between polls in seconds
+
+        Returns
+        -------
+        float or None
+            Settle time in seconds, None if the command failed or timed out
+        """
+        previous = self._wavelength_target
+        if previous is None:
+            # First tune since connecting: the step starts from the set point
+            previous = self.get_wavelength()
+        start = time.monotonic()
+        if not self.set_wavelength(wavelength):
+            return None
+
+        actual, modelocked = None, False
+        while time.monotonic() - start < timeout:
+            with self._priority_lock():
+                if not self._connected:
+                    return None
+                actual = self._query_actual_wavelength()
+                status_byte, _ = self._query_status_byte()
+            modelocked = bool(status_byte & 2)
+
+            converged = actual is not None and abs(actual - wavelength) <= tolerance
+            if converged and modelocked:
+                settle_time = time.monotonic() - start
+                step = abs(wavelength - previous) if previous is not None else 0.0
+                self.settle_history.append((step, settle_time))
+                self.logger.info(
+                    f"MaiTai settled at {actual:.1f} nm after {settle_time:.2f}s "
+                    f"({step:.1f} nm step)"
+                )
+                return settle_time
+            time.sleep(poll_interval)
+
+        self.logger.warning(
+            f"MaiTai did not settle at {wavelength} nm within {timeout}s "
+            f"(measured {actual} nm, modelocked={modelocked})"
+        )
+        return None
+
     def get_power(self):
         """
         Get current power level.
@@ -419,21 +701,13 @@ class MaiTaiController:
         float or None
             Current power in watts, None if error
         """
+        state = self._fresh_state()
+        if state is not None and state.power is not None:
+            return state.power
         with self._lock:
             if not self._connected:
                 return None
-
-            try:
-                response = self._send_command("POWER?")
-                if response:
-                    # Parse response like "3.000W" -> 3.0
-                    power_str = response.replace("W", "").strip()
-                    power = float(power_str)
-                    return power
-            except Exception as e:
-                self.logger.error(f"Error getting power: {e}")
-
-            return None
+            return self._query_power()
 
     def open_shutter(self) -> bool:
         """
@@ -471,7 +745,7 @@ class MaiTaiController:
         bool
             True if command sent successfully, False otherwise
         """
-        with self._lock:
+        with self._priority_lock():
             if not self._connected:
                 self.logger.error("Cannot set shutter - not connected")
                 return False
@@ -484,6 +758,7 @@ class MaiTaiController:
                 response = self._send_command(command, expect_response=False)
 
                 if response is not None:
+                    self._record_command(shutter_open=open_shutter)
                     self.logger.info(f"Shutter {action} command sent successfully")
                     return True
                 else:
@@ -503,19 +778,23 @@ class MaiTaiController:
         Tuple[bool, bool]
             (shutter_open, emission_possible) - Shutter state and laser emission status
         """
+        state = self._fresh_state()
+        if (
+            state is not None
+            and state.shutter_open is not None
+            and state.status_byte is not None
+        ):
+            return state.shutter_open, state.emission_possible
         with self._lock:
             if not self._connected:
                 return False, False
 
             try:
                 # Get shutter state
-                shutter_response = self._send_command("SHUTTER?")
-                shutter_open = False
-                if shutter_response:
-                    shutter_open = shutter_response.strip() == "1"
+                shutter_open = bool(self._query_shutter())
 
                 # Get emission status from status byte
-                _, status_info = self.get_status_byte()
+                _, status_info = self._query_status_byte()
                 emission_possible = status_info.get("emission_possible", False)
 
                 return shutter_open, emission_possible
@@ -533,35 +812,26 @@ class MaiTaiController:
         Tuple[int, dict]
             (status_byte, status_info) - Raw status byte and decoded information
         """
+        state = self._fresh_state()
+        if state is not None and state.status_byte is not None:
+            return state.status_byte, {
+                "connected": True,
+                "emission_possible": state.emission_possible,
+                "modelocked": state.modelocked,
+                "raw_status": state.status_byte,
+            }
         with self._lock:
             if not self._connected:
                 return 0, {"connected": False}
-
-            try:
-                response = self._send_command("*STB?")
-                if response:
-                    status_byte = int(response.strip())
-
-                    # Decode status byte based on documentation
-                    status_info = {
-                        "connected": True,
-                        "emission_possible": bool(status_byte & 1),  # Bit 0
-                        "modelocked": bool(status_byte & 2),  # Bit 1
-                        "raw_status": status_byte,
-                    }
-
-                    return status_byte, status_info
-                else:
-                    return 0, {"connected": False, "error": "No response"}
-
-            except Exception as e:
-                self.logger.error(f"Error getting status byte: {e}")
-                return 0, {"connected": False, "error": str(e)}
+            return self._query_status_byte()
 
     def check_system_errors(self, quick_check: bool = False) -> Tuple[bool, List[str]]:
         """
         Check for system errors using SYSTem:ERR command.
 
+        Errors the background poller already popped off the laser's queue
+        are returned first, followed by those still in the queue.
+
         Parameters
         ----------
         quick_check : bool
@@ -573,56 +843,173 @@ class MaiTaiController:
             (has_errors, error_messages) - True if errors found, list of error descriptions
         """
         with self._lock:
+            with self._state_lock:
+                errors = list(self._pending_errors)
+                self._pending_errors.clear()
+                if self._state is not None and self._state.errors:
+                    self._state = replace(self._state, errors=[])
             if not self._connected:
-                return False, ["Not connected"]
+                return bool(errors), errors or ["Not connected"]
 
-            errors = []
-            has_errors = False
+            has_errors, queued = self._read_error_queue(quick_check)
+            return has_errors or bool(errors), errors + queued
 
-            try:
-                # Query system errors - limit iterations for quick check
-                max_iterations = 1 if quick_check else 5
-
-                for _ in range(max_iterations):
-                    response = self._send_command("SYSTem:ERR?")
-                    if response and response.strip():
-                        # Parse error code and message
-                        parts = (
-                            response.split(",", 1) if "," in response else [response]
-                        )
-                        error_code = parts[0].strip()
-                        error_msg = (
-                            parts[1].strip() if len(parts) > 1 else "Unknown error"
-                        )
+    def _read_error_queue(self, quick_check: bool) -> Tuple[bool, List[str]]:
+        """Pop errors off the laser's queue; the caller must hold the lock."""
+        errors = []
+        has_errors = False
 
-                        # Check if this is a real error (non-zero error code)
-                        try:
-                            code_num = int(error_code)
-                            if code_num != 0:
-                                has_errors = True
-                                errors.append(f"Error {code_num}: {error_msg}")
-                                if (
-                                    quick_check
-                                ):  # For quick check, stop after first error
-                                    break
-                            else:
-                                # Error code 0 means no more errors
+        try:
+            # Query system errors - limit iterations for quick check
+            max_iterations = 1 if quick_check else 5
+
+            # The whole error queue is read in one pipelined round trip
+            queries = ["SYSTem:ERR?"] * max_iterations
+            for response in self._query_pipelined(queries):
+                if response and response.strip():
+                    # Parse error code and message
+                    parts = response.split(",", 1) if "," in response else [response]
+                    error_code = parts[0].strip()
+                    error_msg = parts[1].strip() if len(parts) > 1 else "Unknown error"
+
+                    # Check if this is a real error (non-zero error code)
+                    try:
+                        code_num = int(error_code)
+                        if code_num != 0:
+                            has_errors = True
+                            errors.append(f"Error {code_num}: {error_msg}")
+                            if quick_check:  # For quick check, stop after first error
                                 break
-                        except ValueError:
-                            # Non-numeric error code
-                            if error_code != "0":
-                                has_errors = True
-                                errors.append(f"Error: {response}")
-                                if quick_check:
-                                    break
-                    else:
-                        break
+                        else:
+                            # Error code 0 means no more errors
+                            break
+                    except ValueError:
+                        # Non-numeric error code
+                        if error_code != "0":
+                            has_errors = True
+                            errors.append(f"Error: {response}")
+                            if quick_check:
+                                break
+                else:
+                    break
 
-            except Exception as e:
-                self.logger.error(f"Error checking system errors: {e}")
-                return True, [f"Error checking failed: {e}"]
+        except Exception as e:
+            self.logger.error(f"Error checking system errors: {e}")
+            return True, [f"Error checking failed: {e}"]
+
+        return has_errors, errors
+
+    def start_polling(self, interval: float = 1.0):
+        """
+        Start polling the laser state in a background thread.
+
+        Each cycle queries wavelength, power, shutter, status byte and the
+        error queue, taking the lock per query so user commands are delayed
+        by at most one query. Read the result with ``get_state``; while the
+        snapshot is recent, ``get_wavelength``, ``get_power``,
+        ``get_enhanced_shutter_state`` and ``get_status_byte`` answer from it
+        instead of the port.
+
+        Parameters
+        ----------
+        interval : float
+            Pause between polling cycles in seconds
+        """
+        self._poll_interval = interval
+        if self.is_polling:
+            self._poll_wakeup.set()
+            return
+        self._poll_stop.clear()
+        self._poll_thread = threading.Thread(
+            target=self._poll_loop, name="MaiTaiPoller", daemon=True
+        )
+        self._poll_thread.start()
+        self.logger.debug(f"MaiTai status polling started ({interval}s)")
+
+    def stop_polling(self):
+        """Stop the background poller and wait for it to exit."""
+        thread = self._poll_thread
+        if thread is None:
+            return
+        self._poll_stop.set()
+        self._poll_wakeup.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout=self.timeout + 1.0)
+        self._poll_thread = None
+        self.logger.debug("MaiTai status polling stopped")
+
+    @property
+    def is_polling(self) -> bool:
+        """Check if the background poller is running."""
+        return self._poll_thread is not None and self._poll_thread.is_alive()
 
-            return has_errors, errors
+    def get_state(self) -> Optional[MaiTaiState]:
+        """
+        Get the latest snapshot published by the poller.
+
+        Returns
+        -------
+        MaiTaiState or None
+            Most recent complete state, None before the first cycle
+        """
+        return self._state
+
+    def _poll_query(self, query):
+        """Run one poller query unless stopping; yield to user commands."""
+        while self._priority_waiters and not self._poll_stop.is_set():
+            time.sleep(0.005)
+        if self._poll_stop.is_set():
+            return None
+        with self._lock:
+            if not self._connected:
+                return None
+            return query()
+
+    def _poll_errors(self) -> List[str]:
+        """Pop one error off the laser and keep it until it is collected."""
+        with self._lock:
+            if not self._connected:
+                return list(self._pending_errors)
+            _, errors = self._read_error_queue(quick_check=True)
+            with self._state_lock:
+                for error in errors:
+                    self.logger.warning(f"MaiTai reported {error}")
+                    self._pending_errors.append(error)
+                return list(self._pending_errors)
+
+    def _poll_loop(self):
+        while not self._poll_stop.is_set():
+            self._poll_wakeup.clear()
+            cycle = self._command_count
+            try:
+                wavelength = self._poll_query(self._query_wavelength)
+                power = self._poll_query(self._query_power)
+                shutter_open = self._poll_query(self._query_shutter)
+                status = self._poll_query(self._query_status_byte)
+                while self._priority_waiters and not self._poll_stop.is_set():
+                    time.sleep(0.005)
+                errors = [] if self._poll_stop.is_set() else self._poll_errors()
+            except Exception as e:
+                self.logger.error(f"MaiTai status polling error: {e}")
+            else:
+                with self._state_lock:
+                    # A set command during the cycle may have made it stale
+                    if cycle != self._command_count:
+                        continue
+                    if not self._poll_stop.is_set():
+                        self._state = MaiTaiState(
+                            timestamp=time.time(),
+                            wavelength=wavelength,
+                            power=power,
+                            shutter_open=shutter_open,
+                            status_byte=(
+                                status[0]
+                                if status and status[1].get("connected")
+                                else None
+                            ),
+                            errors=errors,
+                        )
+            self._poll_wakeup.wait(self._poll_interval)
 
     @property
     def connected(self) -> bool:
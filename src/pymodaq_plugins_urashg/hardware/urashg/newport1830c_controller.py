@@ -8,12 +8,74 @@ Provides clean interface for PyMoDAQ plugin.
 import logging
 import math
 import random
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .serial_transport import SerialTransport
 
 logger = logging.getLogger(__name__)
 
 
+class PowerRingBuffer:
+    """
+    Fixed-size, thread-safe buffer of timestamped power readings.
+
+    Timestamps are ``time.monotonic()`` values; once full, the oldest
+    readings are overwritten.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self._times = np.zeros(capacity)
+        self._values = np.zeros(capacity)
+        self._count = 0  # Total readings ever appended
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def append(self, timestamp: float, value: float):
+        """Add one reading."""
+        with self._lock:
+            index = self._count % self.capacity
+            self._times[index] = timestamp
+            self._values[index] = value
+            self._count += 1
+
+    def clear(self):
+        """Drop all readings."""
+        with self._lock:
+            self._count = 0
+
+    def snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Copy of all buffered (timestamps, values), oldest first."""
+        with self._lock:
+            if self._count <= self.capacity:
+                return (
+                    self._times[: self._count].copy(),
+                    self._values[: self._count].copy(),
+                )
+            start = self._count % self.capacity
+            return np.roll(self._times, -start), np.roll(self._values, -start)
+
+    def window(
+        self, duration: float, now: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Readings taken during the last ``duration`` seconds."""
+        now = time.monotonic() if now is None else now
+        times, values = self.snapshot()
+        mask = times >= now - duration
+        return times[mask], values[mask]
+
+    def latest(self, count: int) -> np.ndarray:
+        """The most recent ``count`` values, oldest first."""
+        _, values = self.snapshot()
+        return values[-count:] if count > 0 else values[:0]
+
+
 class Newport1830CController:
     """
     Hardware controller for Newport 1830-C optical power meter.
@@ -21,6 +83,13 @@ class Newport1830CController:
     Handles serial communication and basic device control.
     """
 
+    # Resends of a query ("...?") after a reply timeout
+    query_retries = 1
+
+    # Streamed readings older than this many reading periods per requested
+    # reading are treated as stale by get_multiple_readings
+    stream_max_age_periods = 2.0
+
     def __init__(
         self,
         port: str = "",
@@ -35,7 +104,16 @@ class Newport1830CController:
         self.mock_mode = mock_mode
 
         self._serial = None
+        self._transport: Optional[SerialTransport] = None
         self._connected = False
+        self._lock = threading.Lock()
+
+        # Streaming acquisition
+        self.stream_buffer: Optional[PowerRingBuffer] = None
+        self._stream_thread: Optional[threading.Thread] = None
+        self._stream_stop = threading.Event()
+        self._stream_interval = 0.0
+        self._stream_period = 0.0  # Measured spacing of streamed readings
 
         # Current device settings
         self._current_wavelength = 800.0
@@ -110,6 +188,7 @@ class Newport1830CController:
     def disconnect(self):
         """Disconnect from power meter."""
         try:
+            self.stop_streaming()
             self._cleanup_connection()
             logger.info("Newport 1830-C disconnected")
         except Exception as e:
@@ -118,6 +197,9 @@ class Newport1830CController:
     def _cleanup_connection(self):
         """Clean up serial connection."""
         try:
+            if self._transport is not None:
+                self._transport.close()
+                self._transport = None
             if self._serial and self._serial.is_open:
                 self._serial.close()
             self._serial = None
@@ -131,6 +213,13 @@ class Newport1830CController:
         """
         Send command to power meter and get response with realistic mock simulation.
         """
+        with self._lock:
+            return self._send_command_unlocked(command, expect_response)
+
+    def _send_command_unlocked(
+        self, command: str, expect_response: bool = True
+    ) -> Optional[str]:
+        """Body of ``_send_command``; the caller must hold the lock."""
         if self.mock_mode:
             # Enhanced mock responses based on Newport 1830-C protocol
             time.sleep(random.uniform(0.1, 0.3))  # Simulate communication delay
@@ -217,31 +306,162 @@ class Newport1830CController:
                     logger.warning(f"Mock Newport: Unknown query command: {command}")
                     return "ERROR"
 
-        # Real hardware communication would go here
         try:
-            if not self._serial or not self._serial.is_open:
+            transport = self._get_transport()
+            if transport is None:
                 logger.error("Serial connection not available")
                 return None
 
             # Newport 1830-C communication protocol
-            cmd_bytes = (command + "\n").encode("ascii")
-            self._serial.write(cmd_bytes)
-            self._serial.flush()
-
-            if expect_response:
-                time.sleep(0.5)
-                response = (
-                    self._serial.read(1000).decode("ascii", errors="ignore").strip()
-                )
-                return response if response else None
-            else:
-                time.sleep(0.1)
+            reply = transport.query(
+                command,
+                response=expect_response,
+                retries=self.query_retries if command.endswith("?") else 0,
+            )
+            if reply is None:
+                return None
+            if not expect_response:
                 return ""
+            response = reply.decode("ascii", errors="ignore").strip()
+            return response if response else None
 
         except Exception as e:
             logger.error(f"Communication error: {e}")
             return None
 
+    def _query_pipelined(self, commands: List[str]) -> List[Optional[str]]:
+        """
+        Send several queries back-to-back and return the responses in order.
+
+        Args:
+            commands: Query strings, each answered by one line
+
+        Returns:
+            List of responses, None for each query left unanswered
+        """
+        with self._lock:
+            if self.mock_mode:
+                return [self._send_command_unlocked(cmd) for cmd in commands]
+
+            try:
+                transport = self._get_transport()
+                if transport is None:
+                    logger.error("Serial connection not available")
+                    return [None] * len(commands)
+                replies = transport.pipeline(commands)
+            except Exception as e:
+                logger.error(f"Communication error: {e}")
+                return [None] * len(commands)
+
+        responses = []
+        for reply in replies:
+            response = reply.decode("ascii", errors="ignore").strip() if reply else ""
+            responses.append(response if response else None)
+        return responses
+
+    def _get_transport(self) -> Optional[SerialTransport]:
+        """Return the transport of the open connection, or None."""
+        self._transport = SerialTransport.for_connection(
+            self._transport,
+            self._serial,
+            terminator=b"\n",
+            write_terminator=b"\n",
+            timeout=self.timeout,
+            name="Newport1830C",
+        )
+        return self._transport
+
+    def start_streaming(self, capacity: int = 4096, interval: float = 0.0):
+        """
+        Start reading the power back-to-back into ``stream_buffer``.
+
+        Other commands remain usable; they are interleaved between two
+        readings.
+
+        Args:
+            capacity: Number of readings kept in the ring buffer
+            interval: Pause between readings in seconds (0 = free-running)
+        """
+        self._stream_interval = interval
+        if self.is_streaming:
+            return
+        if self.stream_buffer is None or self.stream_buffer.capacity != capacity:
+            self.stream_buffer = PowerRingBuffer(capacity)
+        self._stream_stop.clear()
+        self._stream_thread = threading.Thread(
+            target=self._stream_loop, name="Newport1830CStream", daemon=True
+        )
+        self._stream_thread.start()
+        logger.debug("Newport 1830-C streaming started")
+
+    def stop_streaming(self):
+        """Stop the streaming reader thread."""
+        thread = self._stream_thread
+        if thread is None:
+            return
+        self._stream_stop.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout=self.timeout + 1.0)
+        self._stream_thread = None
+        logger.debug("Newport 1830-C streaming stopped")
+
+    @property
+    def is_streaming(self) -> bool:
+        """Check if the streaming reader is running."""
+        return self._stream_thread is not None and self._stream_thread.is_alive()
+
+    def _stream_loop(self):
+        last_timestamp = None
+        while not self._stream_stop.is_set():
+            try:
+                # Appending under the lock keeps a reading taken before a
+                # settings change from landing after _discard_stream
+                with self._lock:
+                    response = (
+                        self._send_command_unlocked("D?") if self._connected else None
+                    )
+                    timestamp = time.monotonic()
+                    if response is not None:
+                        self.stream_buffer.append(timestamp, float(response))
+                        if last_timestamp is not None:
+                            self._stream_period = timestamp - last_timestamp
+                        last_timestamp = timestamp
+            except (ValueError, TypeError):
+                logger.debug(f"Invalid streamed power reading: {response!r}")
+            except Exception as e:
+                logger.error(f"Newport 1830-C streaming error: {e}")
+                self._stream_stop.wait(0.1)
+            # Give commands waiting for the lock a chance to run
+            self._stream_stop.wait(max(self._stream_interval, 0.001))
+
+    def _discard_stream(self):
+        """Drop streamed readings taken under the previous settings."""
+        if self.stream_buffer is not None:
+            self.stream_buffer.clear()
+
+    def get_stream_statistics(self, window: float) -> Optional[Dict[str, float]]:
+        """
+        Statistics of the streamed readings over the last ``window`` seconds.
+
+        Args:
+            window: Averaging window in seconds
+
+        Returns:
+            Dict with mean, std, count and span (s) of the readings, or None
+            if no reading fell in the window
+        """
+        if self.stream_buffer is None:
+            return None
+        times, values = self.stream_buffer.window(window)
+        if values.size == 0:
+            return None
+        return {
+            "mean": float(values.mean()),
+            "std": float(values.std()),
+            "count": int(values.size),
+            "span": float(times[-1] - times[0]),
+        }
+
     def _initialize_settings(self):
         """Apply initial settings to power meter."""
         try:
@@ -306,6 +526,7 @@ class Newport1830CController:
             response = self._send_command(f"W{int(wavelength)}", expect_response=False)
             if response is not None:
                 self._current_wavelength = wavelength
+                self._discard_stream()
                 logger.debug(f"Wavelength set to {wavelength} nm")
                 return True
             return False
@@ -366,6 +587,7 @@ class Newport1830CController:
             response = self._send_command(cmd, expect_response=False)
             if response is not None:
                 self._current_units = units
+                self._discard_stream()
                 logger.debug(f"Units set to {units}")
                 return True
             return False
@@ -416,10 +638,19 @@ class Newport1830CController:
         }
 
         if self._connected:
-            # Get current readings
-            power = self.get_power()
-            if power is not None:
-                info["current_power"] = power
+            # One pipelined round trip instead of a query cycle per value
+            wavelength, units, power = self._query_pipelined(["W?", "U?", "D?"])
+            try:
+                if wavelength:
+                    self._current_wavelength = float(wavelength)
+                    info["wavelength"] = self._current_wavelength
+                if units in ("1", "3"):
+                    self._current_units = "W" if units == "1" else "dBm"
+                    info["units"] = self._current_units
+                if power:
+                    info["current_power"] = float(power)
+            except ValueError as e:
+                logger.error(f"Invalid device info response: {e}")
 
         return info
 
@@ -446,6 +677,7 @@ class Newport1830CController:
         try:
             if self.mock_mode:
                 self._current_range = power_range
+                self._discard_stream()
                 logger.info(f"Mock: Set power range to {power_range}")
                 return True
 
@@ -460,6 +692,7 @@ class Newport1830CController:
 
             if response:
                 self._current_range = power_range
+                self._discard_stream()
                 logger.info(f"Set power range to {power_range}")
                 return True
             return False
@@ -504,12 +737,24 @@ class Newport1830CController:
         """
         Get multiple power readings for averaging.
 
+        While streaming, the latest streamed readings are reused if ``count``
+        of them are recent (see ``stream_max_age_periods``); otherwise the
+        meter is queried directly.
+
         Args:
             count: Number of readings to take
 
         Returns:
             List of power readings
         """
+        if self.is_streaming:
+            # Reuse the free-running readings instead of competing for the bus
+            period = max(self._stream_period, self._stream_interval, 0.001)
+            max_age = self.stream_max_age_periods * count * period
+            _, values = self.stream_buffer.window(max_age)
+            if len(values) >= count:
+                return values[len(values) - count :].tolist()
+
         readings = []
         try:
             for _ in range(count):
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Multi-ROI intensity integration for camera frames.
+
+RoiIntegrator sums any number of rectangular ROIs from one summed-area table
+(integral image) per frame: every rectangle then costs four lookups, done
+for all rectangles at once with fancy indexing. Building the table costs
+about twenty plain frame sums, so for a few small ROIs direct slice sums are
+cheaper; by default the integrator picks whichever is cheaper for its ROIs.
+Arbitrary mask-defined ROIs (e.g. flakes or domains segmented from a
+reference image) are summed in one ``np.add.reduceat`` over their
+precomputed pixel indices.
+"""
+
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# (start_row, height, start_col, width), as returned by get_roi_bounds
+Rectangle = Tuple[int, int, int, int]
+
+
+def parse_rectangles(text: str) -> List[Rectangle]:
+    """
+    Parse rectangular ROIs, one ``y, height, x, width`` per line.
+
+    Blank lines and ``#`` comments are ignored; commas and whitespace both
+    separate values.
+
+    Raises
+    ------
+    ValueError
+        If a line does not hold four non-negative integers with a
+        positive height and width
+    """
+    rectangles = []
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        try:
+            values = [int(value) for value in line.replace(",", " ").split()]
+        except ValueError:
+            values = []
+        if len(values) != 4 or min(values) < 0 or values[1] == 0 or values[3] == 0:
+            raise ValueError(f"ROI line {number} is not 'y, height, x, width': {line}")
+        rectangles.append(tuple(values))
+    return rectangles
+
+
+class RoiIntegrator:
+    """
+    Integrate many ROIs of a frame in a single vectorized step.
+
+    Parameters
+    ----------
+    rectangles : sequence of (y, height, x, width), optional
+        Rectangular ROIs; clipped to the frame
+    masks : numpy.ndarray or sequence of numpy.ndarray, optional
+        Either a label image (one ROI per distinct non-zero label, in
+        increasing label order) or boolean masks, one per ROI, with the
+        frame's shape
+
+    method : {"auto", "table", "slices"}
+        Sum rectangles from a summed-area table, with one slice sum each, or
+        whichever is estimated to be cheaper
+
+    Integer frames are summed exactly in int64, others in float64. The
+    result lists the rectangles first, then the masks.
+    """
+
+    # Cost of building the summed-area table and of the per-call overhead of
+    # one slice sum, in pixels of a plain sum (measured on 2048x2048 uint16)
+    table_cost = 20.0
+    slice_overhead = 10000.0
+
+    def __init__(
+        self,
+        rectangles: Optional[Sequence[Rectangle]] = None,
+        masks=None,
+        method: str = "auto",
+    ):
+        if method not in ("auto", "table", "slices"):
+            raise ValueError(f"Unknown ROI integration method: {method}")
+        self.method = method
+        self.rectangles = np.array(list(rectangles or []), dtype=np.intp).reshape(-1, 4)
+        self.mask_shape: Optional[Tuple[int, ...]] = None
+        self._mask_index = np.empty(0, dtype=np.intp)
+        self._mask_offsets = np.empty(0, dtype=np.intp)
+        self._mask_labels: List[str] = []
+        if masks is not None:
+            self._index_masks(masks)
+
+        self._table: Optional[np.ndarray] = None
+        self._layout = None
+        self._layout_shape: Optional[Tuple[int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.rectangles) + len(self._mask_offsets)
+
+    @property
+    def labels(self) -> List[str]:
+        """Names of the ROIs, in result order."""
+        return [f"ROI{i}" for i in range(len(self.rectangles))] + self._mask_labels
+
+    def _index_masks(self, masks):
+        if isinstance(masks, np.ndarray) and masks.ndim == 2 and masks.dtype != bool:
+            # Label image: group pixel indices by label
+            flat = masks.ravel()
+            order = np.argsort(flat, kind="stable")
+            order = order[flat[order] != 0]
+            labels, sizes = np.unique(flat[order], return_counts=True)
+            self._mask_index = order
+            self._mask_labels = [f"Mask{label}" for label in labels]
+            self.mask_shape = masks.shape
+        else:
+            if isinstance(masks, np.ndarray) and masks.ndim == 2:
+                masks = [masks]
+            masks = [np.asarray(mask, dtype=bool) for mask in masks]
+            if any(mask.shape != masks[0].shape for mask in masks):
+                raise ValueError("ROI masks must all have the same shape")
+            indices = [np.flatnonzero(mask) for mask in masks]
+            sizes = np.array([len(index) for index in indices], dtype=np.intp)
+            self._mask_index = (
+                np.concatenate(indices) if indices else np.empty(0, dtype=np.intp)
+            )
+            self._mask_labels = [f"Mask{i}" for i in range(len(masks))]
+            self.mask_shape = masks[0].shape if masks else None
+
+        if np.any(sizes == 0):
+            raise ValueError("ROI masks must not be empty")
+        # Start of each ROI's pixels in the concatenated index
+        self._mask_offsets = np.zeros(len(sizes), dtype=np.intp)
+        np.cumsum(sizes[:-1], out=self._mask_offsets[1:])
+
+    def _summed_area_table(self, frame: np.ndarray) -> np.ndarray:
+        """Integral image with a leading row and column of zeros (reused)."""
+        dtype = np.int64 if np.issubdtype(frame.dtype, np.integer) else np.float64
+        shape = (frame.shape[0] + 1, frame.shape[1] + 1)
+        if (
+            self._table is None
+            or self._table.shape != shape
+            or self._table.dtype != dtype
+        ):
+            self._table = np.zeros(shape, dtype=dtype)
+        inner = self._table[1:, 1:]
+        # Along rows first: about twice as fast on C-ordered frames
+        np.cumsum(frame, axis=1, dtype=dtype, out=inner)
+        np.cumsum(inner, axis=0, out=inner)
+        return self._table
+
+    def _rectangle_layout(self, shape: Tuple[int, int]):
+        """
+        Clipped rectangle corners, their bounding box and whether to use the
+        summed-area table, cached per frame shape.
+        """
+        if self._layout_shape != shape:
+            y, h, x, w = self.rectangles.T
+            y0 = np.clip(y, 0, shape[0])
+            x0 = np.clip(x, 0, shape[1])
+            y1 = np.clip(y + h, 0, shape[0])
+            x1 = np.clip(x + w, 0, shape[1])
+            box = (y0.min(), x0.min(), y1.max(), x1.max())
+
+            if self.method == "auto":
+                slice_cost = np.sum((y1 - y0) * (x1 - x0)) + self.slice_overhead * len(
+                    y
+                )
+                box_area = (box[2] - box[0]) * (box[3] - box[1])
+                use_table = slice_cost > self.table_cost * box_area
+            else:
+                use_table = self.method == "table"
+
+            # Table corners are relative to the bounding box
+            corners = (y0 - box[0], x0 - box[1], y1 - box[0], x1 - box[1])
+            self._layout = (use_table, box, corners, (y0, x0, y1, x1))
+            self._layout_shape = shape
+        return self._layout
+
+    def _integrate_rectangles(self, frame: np.ndarray, values: np.ndarray):
+        use_table, box, corners, bounds = self._rectangle_layout(frame.shape)
+        if use_table:
+            table = self._summed_area_table(frame[box[0] : box[2], box[1] : box[3]])
+            y0, x0, y1, x1 = corners
+            values[:] = table[y1, x1] - table[y0, x1] - table[y1, x0] + table[y0, x0]
+        else:
+            dtype = np.int64 if np.issubdtype(frame.dtype, np.integer) else np.float64
+            for i, (y0, x0, y1, x1) in enumerate(zip(*(b.tolist() for b in bounds))):
+                values[i] = frame[y0:y1, x0:x1].sum(dtype=dtype)
+
+    def integrate(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Sum every ROI of a 2D frame.
+
+        Returns
+        -------
+        numpy.ndarray
+            One float64 value per ROI, rectangles first
+        """
+        values = np.empty(len(self), dtype=np.float64)
+        count = len(self.rectangles)
+
+        if count:
+            self._integrate_rectangles(frame, values[:count])
+
+        if len(self._mask_offsets):
+            if frame.shape != self.mask_shape:
+                raise ValueError(
+                    f"Frame shape {frame.shape} does not match the ROI masks "
+                    f"{self.mask_shape}"
+                )
+            dtype = np.int64 if np.issubdtype(frame.dtype, np.integer) else np.float64
+            pixels = frame.ravel()[self._mask_index]
+            values[count:] = np.add.reduceat(pixels, self._mask_offsets, dtype=dtype)
+
+        return values
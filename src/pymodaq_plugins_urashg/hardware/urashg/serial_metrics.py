@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Per-command serial bus metrics for the URASHG controllers.
+
+Every SerialTransport records, per device and per command mnemonic, the
+number of commands, the reply latency distribution, bytes sent and
+received, timeouts and retries, plus the time the bus spent busy. The
+figures are collected in the shared ``METRICS`` registry::
+
+    from pymodaq_plugins_urashg.hardware.urashg.serial_metrics import METRICS
+
+    METRICS.reset()
+    ...  # run a scan
+    for device, stats in METRICS.snapshot().items():
+        print(device, stats["utilization"], stats["commands"]["gp"]["latency"])
+
+Each transport updates its metrics from its own I/O thread only, so the
+counters need no locking; snapshots taken from other threads may be off by
+the command in flight.
+"""
+
+import json
+import logging
+import math
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Command mnemonic: leading axis number and trailing arguments removed
+_MNEMONIC = re.compile(r"^\d*([A-Za-z*:?]+)")
+
+
+def command_key(command: str) -> str:
+    """
+    Group a command under its mnemonic, e.g. ``1PA2.5`` -> ``PA``.
+
+    Chained commands keep one mnemonic per distinct part
+    (``1TP;2TP;TE?`` -> ``TP;TE?``).
+    """
+    keys = []
+    for part in command.split(";"):
+        match = _MNEMONIC.match(part.strip().split(" ")[0])
+        key = match.group(1) if match else part.strip()
+        if key not in keys:
+            keys.append(key)
+    return ";".join(keys)
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the spirit of HdrHistogram.
+
+    Each power-of-two range above ``lowest`` is split into ``sub_buckets``
+    linear buckets, so values between ``lowest`` and ``highest`` seconds
+    are recorded with a relative precision of 1/``sub_buckets``.
+    """
+
+    def __init__(
+        self, lowest: float = 1e-6, highest: float = 100.0, sub_buckets: int = 32
+    ):
+        self.lowest = lowest
+        self.sub_buckets = sub_buckets
+        self.magnitudes = int(math.ceil(math.log2(highest / lowest))) + 1
+        self.counts = np.zeros(self.magnitudes * sub_buckets, dtype=np.int64)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _index(self, value: float) -> int:
+        ratio = max(value / self.lowest, 1.0)
+        magnitude = min(int(math.log2(ratio)), self.magnitudes - 1)
+        sub = int((ratio / 2.0**magnitude - 1.0) * self.sub_buckets)
+        return magnitude * self.sub_buckets + min(sub, self.sub_buckets - 1)
+
+    def _upper_edge(self, index: int) -> float:
+        magnitude, sub = divmod(index, self.sub_buckets)
+        return self.lowest * 2.0**magnitude * (1.0 + (sub + 1) / self.sub_buckets)
+
+    def record(self, value: float):
+        """Add one latency in seconds."""
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, percent: float) -> float:
+        """Latency below which ``percent`` % of the values fall (0 if empty)."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100.0 * self.count))
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        return min(self._upper_edge(index), self.max)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Summary statistics in seconds."""
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "min": self.min,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+@dataclass
+class CommandStats:
+    """Counters of one command mnemonic on one device."""
+
+    count: int = 0
+    timeouts: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.snapshot(),
+        }
+
+
+class TransportMetrics:
+    """Metrics of one serial device."""
+
+    def __init__(self, device: str):
+        self.device = device
+        self.reset()
+
+    def reset(self):
+        """Clear all counters and restart the utilization window."""
+        self.commands: Dict[str, CommandStats] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.unsolicited = 0
+        self.busy_time = 0.0
+        self.since = time.monotonic()
+
+    def command(self, key: str) -> CommandStats:
+        """Counters of a command mnemonic, created on first use."""
+        stats = self.commands.get(key)
+        if stats is None:
+            stats = self.commands[key] = CommandStats()
+        return stats
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the time since the last reset the bus was busy."""
+        elapsed = time.monotonic() - self.since
+        return min(self.busy_time / elapsed, 1.0) if elapsed > 0 else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "unsolicited": self.unsolicited,
+            "busy_time": self.busy_time,
+            "utilization": self.utilization,
+            "commands": {
+                key: stats.snapshot() for key, stats in list(self.commands.items())
+            },
+        }
+
+
+class MetricsRegistry:
+    """Metrics of all devices, with an optional periodic dump to a file."""
+
+    def __init__(self):
+        self._devices: Dict[str, TransportMetrics] = {}
+        self._lock = threading.Lock()
+        self._dump_thread: Optional[threading.Thread] = None
+        self._dump_stop = threading.Event()
+
+    def device(self, name: str) -> TransportMetrics:
+        """Metrics of a device, created on first use."""
+        with self._lock:
+            metrics = self._devices.get(name)
+            if metrics is None:
+                metrics = self._devices[name] = TransportMetrics(name)
+            return metrics
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Metrics of every device, keyed by device name."""
+        with self._lock:
+            devices = list(self._devices.values())
+        return {metrics.device: metrics.snapshot() for metrics in devices}
+
+    def reset(self):
+        """Clear the metrics of every device."""
+        with self._lock:
+            for metrics in self._devices.values():
+                metrics.reset()
+
+    def dump(self, path: str):
+        """Append the current snapshot to ``path`` as one JSON line."""
+        record = {"timestamp": time.time(), "devices": self.snapshot()}
+        with open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def start_dump(self, path: str, interval: float = 10.0):
+        """Dump a snapshot to ``path`` every ``interval`` seconds."""
+        self.stop_dump()
+        self._dump_stop.clear()
+        self._dump_thread = threading.Thread(
+            target=self._dump_loop,
+            args=(path, interval),
+            name="SerialMetricsDump",
+            daemon=True,
+        )
+        self._dump_thread.start()
+
+    def stop_dump(self):
+        """Stop the periodic dump."""
+        if self._dump_thread is None:
+            return
+        self._dump_stop.set()
+        self._dump_thread.join(timeout=1.0)
+        self._dump_thread = None
+
+    def _dump_loop(self, path: str, interval: float):
+        while not self._dump_stop.wait(interval):
+            try:
+                self.dump(path)
+            except OSError as e:
+                logger.error(f"Failed to dump serial metrics to {path}: {e}")
+
+
+# Registry shared by every SerialTransport
+METRICS = MetricsRegistry()
@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+"""
+Shared serial transport for the URASHG instrument controllers.
+
+A SerialTransport owns one open serial port and a dedicated I/O thread.
+Commands are queued and executed in order; each reply is framed by a
+terminator (or read as a fixed number of bytes), matched to its request and
+handed back through a ``concurrent.futures.Future``. Controllers on
+different ports therefore talk to their instruments concurrently, and a
+caller waits only as long as its instrument takes to answer.
+
+Several queries can be pipelined: they are written back-to-back and their
+replies demultiplexed in order, so a batch costs one round trip plus the
+transfer time instead of one round trip per query.
+
+Frames that do not answer the current request (late replies, unsolicited
+status messages) are passed to an optional callback. Latencies, byte counts,
+timeouts and retries are recorded per command in ``serial_metrics``.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Union
+
+from .serial_metrics import METRICS, TransportMetrics, command_key
+
+logger = logging.getLogger(__name__)
+
+Command = Union[str, bytes]
+
+
+@dataclass
+class TransportRequest:
+    """One queued command (or pipelined commands) and how to read the reply."""
+
+    parts: List[bytes]
+    response: bool = True
+    timeout: float = 1.0
+    retries: int = 0
+    length: Optional[int] = None
+    match: Optional[Callable[[bytes], bool]] = None
+    # Number of pipelined replies (None for a single reply)
+    count: Optional[int] = None
+    future: Future = field(default_factory=Future)
+
+    @property
+    def payload(self) -> bytes:
+        return b"".join(self.parts)
+
+
+class SerialTransport:
+    """
+    Queued request/response I/O on one serial port.
+
+    The port only needs the pyserial methods ``write``, ``read``,
+    ``in_waiting``, ``flush`` and ``is_open``; it stays owned by the
+    controller, which closes it after closing the transport.
+    """
+
+    # Sleep (s) between polls of a port that has nothing to read
+    poll_interval = 0.001
+
+    # Wait (s) for a new request before reading unsolicited frames
+    idle_interval = 0.005
+
+    def __init__(
+        self,
+        connection,
+        terminator: bytes = b"\n",
+        write_terminator: bytes = b"\r\n",
+        timeout: float = 1.0,
+        retries: int = 0,
+        on_unsolicited: Optional[Callable[[bytes], None]] = None,
+        name: str = "serial",
+        key: Callable[[str], str] = command_key,
+        metrics: Optional[TransportMetrics] = None,
+    ):
+        """
+        Args:
+            connection: Open pyserial port (or compatible object)
+            terminator: Bytes ending every reply frame
+            write_terminator: Bytes appended to string commands
+            timeout: Default reply timeout in seconds
+            retries: Default number of resends after a reply timeout
+            on_unsolicited: Called with every frame that answers no request
+            name: Label used for the I/O thread and log messages
+            key: Maps a command to the name its metrics are grouped under
+            metrics: Where to record metrics (default: the ``METRICS``
+                entry of ``name`` and the port)
+        """
+        self.connection = connection
+        self.terminator = terminator
+        self.write_terminator = write_terminator
+        self.timeout = timeout
+        self.retries = retries
+        self.on_unsolicited = on_unsolicited
+        self.name = name
+        self.key = key
+        if metrics is None:
+            port = getattr(connection, "port", None)
+            metrics = METRICS.device(f"{name}@{port}" if port else name)
+        self.metrics = metrics
+
+        self._queue: "queue.Queue[Optional[TransportRequest]]" = queue.Queue()
+        self._rx_buffer = bytearray()
+        # Bytes on the wire of the last frame popped, terminator included
+        self._frame_size = 0
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"{name}-transport", daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def for_connection(
+        cls, transport: Optional["SerialTransport"], connection, **options
+    ) -> Optional["SerialTransport"]:
+        """
+        Return a transport bound to ``connection``, reusing ``transport``.
+
+        A new transport is started when ``transport`` is missing, closed or
+        bound to another port. Returns None when the port is not open.
+        """
+        if transport is not None and (
+            transport.connection is not connection or not transport.is_alive
+        ):
+            transport.close()
+            transport = None
+        if connection is None or not connection.is_open:
+            if transport is not None:
+                transport.close()
+            return None
+        return transport or cls(connection, **options)
+
+    @property
+    def is_alive(self) -> bool:
+        """Check if the I/O thread is accepting requests."""
+        return not self._closed and self._thread.is_alive()
+
+    def encode(self, command: Command) -> bytes:
+        """Bytes written for a command; strings get the write terminator."""
+        if isinstance(command, bytes):
+            return command
+        return command.encode("ascii") + self.write_terminator
+
+    def submit(
+        self,
+        command: Command,
+        response: bool = True,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        length: Optional[int] = None,
+        match: Optional[Callable[[bytes], bool]] = None,
+    ) -> Future:
+        """
+        Queue a command without waiting for it.
+
+        Args:
+            command: String (terminator appended) or raw bytes
+            response: Whether a reply frame is expected
+            timeout: Reply timeout in seconds (default: transport timeout)
+            retries: Resends after a timeout (default: transport retries)
+            length: Read exactly this many bytes instead of a terminated frame
+            match: Predicate selecting the reply among received frames
+
+        Returns:
+            Future resolving to the reply frame without its terminator,
+            ``b""`` for commands without response, or None on timeout
+        """
+        if self._closed:
+            raise ConnectionError(f"{self.name} transport is closed")
+        request = TransportRequest(
+            parts=[self.encode(command)],
+            response=response,
+            timeout=self.timeout if timeout is None else timeout,
+            retries=self.retries if retries is None else retries,
+            length=length,
+            match=match,
+        )
+        self._queue.put(request)
+        return request.future
+
+    def query(self, command: Command, **options) -> Optional[bytes]:
+        """Send a command and block until its reply (see ``submit``)."""
+        return self.submit(command, **options).result()
+
+    def submit_pipeline(
+        self, commands: Sequence[Command], timeout: Optional[float] = None
+    ) -> Future:
+        """
+        Queue queries to be written back-to-back, without waiting.
+
+        Every command must produce exactly one reply frame. Once a reply is
+        missing, it and all later replies are reported as None since the
+        remaining frames can no longer be attributed reliably.
+
+        Args:
+            commands: Queries in the order their replies are expected
+            timeout: Timeout per reply in seconds (default: transport timeout)
+
+        Returns:
+            Future resolving to the list of reply frames (or None), in order
+        """
+        if self._closed:
+            raise ConnectionError(f"{self.name} transport is closed")
+        request = TransportRequest(
+            parts=[self.encode(command) for command in commands],
+            timeout=self.timeout if timeout is None else timeout,
+            count=len(commands),
+        )
+        self._queue.put(request)
+        return request.future
+
+    def pipeline(
+        self, commands: Sequence[Command], timeout: Optional[float] = None
+    ) -> List[Optional[bytes]]:
+        """Pipeline queries and block until all replies (see ``submit_pipeline``)."""
+        if not commands:
+            return []
+        return self.submit_pipeline(commands, timeout).result()
+
+    def write(self, command: Command) -> Future:
+        """Queue a command that has no reply."""
+        return self.submit(command, response=False)
+
+    async def query_async(self, command: Command, **options) -> Optional[bytes]:
+        """Awaitable ``query`` for asyncio callers."""
+        return await asyncio.wrap_future(self.submit(command, **options))
+
+    def close(self):
+        """Stop the I/O thread and fail requests still queued."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is not None and request.future.set_running_or_notify_cancel():
+                request.future.set_exception(
+                    ConnectionError(f"{self.name} transport is closed")
+                )
+
+    def _run(self):
+        while True:
+            try:
+                request = self._queue.get(timeout=self.idle_interval)
+            except queue.Empty:
+                try:
+                    self._dispatch_pending()
+                except Exception as e:
+                    logger.debug(f"{self.name} read error while idle: {e}")
+                continue
+
+            if request is None:
+                return
+            if not request.future.set_running_or_notify_cancel():
+                continue
+            try:
+                request.future.set_result(self._execute(request))
+            except Exception as e:
+                request.future.set_exception(e)
+
+    def _execute(self, request: TransportRequest) -> Optional[bytes]:
+        # Anything received before the command is not its reply
+        self._dispatch_pending()
+
+        start = time.monotonic()
+        try:
+            return self._exchange(request)
+        finally:
+            self.metrics.busy_time += time.monotonic() - start
+
+    def _exchange(self, request: TransportRequest) -> Optional[bytes]:
+        stats = []
+        for part in request.parts:
+            command = self.metrics.command(
+                self.key(part.decode("ascii", errors="replace").strip())
+            )
+            command.count += 1
+            stats.append(command)
+
+        for attempt in range(request.retries + 1):
+            if attempt:
+                logger.debug(f"{self.name}: retrying {request.payload!r}")
+                stats[0].retries += 1
+            sent = time.monotonic()
+            self.connection.write(request.payload)
+            self.connection.flush()
+            self.metrics.bytes_sent += len(request.payload)
+            for part, command in zip(request.parts, stats):
+                command.bytes_sent += len(part)
+
+            if not request.response:
+                return b""
+            if request.count is not None:
+                return self._read_replies(request, stats, sent)
+
+            deadline = sent + request.timeout
+            while True:
+                frame = self._read_frame(deadline, request.length)
+                if frame is None:
+                    break
+                if request.match is None or request.match(frame):
+                    self._record_reply(stats[0], sent)
+                    return frame
+                self._unsolicited(frame)
+
+        stats[0].timeouts += 1
+        logger.debug(f"{self.name}: no reply to {request.payload!r}")
+        return None
+
+    def _read_replies(
+        self, request: TransportRequest, stats: list, sent: float
+    ) -> List[Optional[bytes]]:
+        replies: List[Optional[bytes]] = []
+        while len(replies) < request.count:
+            frame = self._read_frame(time.monotonic() + request.timeout)
+            if frame is None:
+                logger.debug(
+                    f"{self.name}: pipeline stalled after {len(replies)} replies"
+                )
+                break
+            # Latency of a pipelined reply counts from the batch write
+            self._record_reply(stats[len(replies)], sent)
+            replies.append(frame)
+        for command in stats[len(replies) :]:
+            command.timeouts += 1
+        return replies + [None] * (request.count - len(replies))
+
+    def _record_reply(self, command, sent: float):
+        command.latency.record(time.monotonic() - sent)
+        command.bytes_received += self._frame_size
+
+    def _read_available(self) -> bool:
+        waiting = self.connection.in_waiting
+        if waiting:
+            chunk = self.connection.read(waiting)
+            self._rx_buffer.extend(chunk)
+            self.metrics.bytes_received += len(chunk)
+        return bool(waiting)
+
+    def _next_frame(self, length: Optional[int] = None) -> Optional[bytes]:
+        """Pop one complete frame from the receive buffer, if any."""
+        if length is not None:
+            if len(self._rx_buffer) < length:
+                return None
+            frame = bytes(self._rx_buffer[:length])
+            del self._rx_buffer[:length]
+            self._frame_size = length
+            return frame
+
+        while True:
+            end = self._rx_buffer.find(self.terminator)
+            if end < 0:
+                return None
+            frame = bytes(self._rx_buffer[:end]).strip(b"\r\n")
+            del self._rx_buffer[: end + len(self.terminator)]
+            if frame:
+                self._frame_size = end + len(self.terminator)
+                return frame
+
+    def _read_frame(self, deadline: float, length: Optional[int] = None):
+        """Read one frame, or return None once ``deadline`` passes."""
+        while True:
+            frame = self._next_frame(length)
+            if frame is not None:
+                return frame
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            if not self._read_available():
+                time.sleep(min(self.poll_interval, remaining))
+
+    def _dispatch_pending(self):
+        """Hand every already-received frame to the unsolicited callback."""
+        self._read_available()
+        while True:
+            frame = self._next_frame()
+            if frame is None:
+                return
+            self._unsolicited(frame)
+
+    def _unsolicited(self, frame: bytes):
+        self.metrics.unsolicited += 1
+        if self.on_unsolicited is None:
+            logger.debug(f"{self.name}: discarding frame {frame!r}")
+            return
+        try:
+            self.on_unsolicited(frame)
+        except Exception as e:
+            logger.error(f"{self.name}: error handling frame {frame!r}: {e}")
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic RASHG scenes for the mock camera modes.
+
+ShgScene precomputes the spatial second-order susceptibility of a sample
+once, as a few real basis maps each carrying an in-plane chi_ijk pattern, so
+rendering a frame is a small linear combination of those maps weighted by
+the current polarization optics. The optical path is
+
+    laser (x) -> QWP -> HWP incident -> sample -> HWP analyzer -> polarizer (x)
+
+(the QWP at 0 degrees leaves the laser linearly polarized) and the
+detected SHG intensity is |sum_b c_b map_b|^2, with the coefficients c_b
+from Jones calculus, scaled by the wavelength's spectral response. The expected image is cached while the optics and the exposure
+stay the same, and shot and read noise come from one pool of pregenerated
+normal deviates at a random offset per frame (a Gaussian approximation of
+Poisson noise), so repeated frames cost a multiply-add.
+
+Mock Elliptec and MaiTai controllers publish their positions to the shared
+``SCENE_STATE``, which every mock camera renders from.
+"""
+
+import logging
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Elliptec mount addresses of the polarization optics
+MOUNT_ROLES = {"2": "hwp_incident", "3": "qwp", "8": "hwp_analyzer"}
+
+# In-plane chi_ijk components, i then jk, with jk in (xx, yy, xy)
+COMPONENTS = ("xxx", "xyy", "xxy", "yxx", "yyy", "yxy")
+
+# D3h crystal (e.g. a TMD monolayer) with its armchair axis along x, and
+# the same crystal rotated by 30 degrees; a crystal at angle phi is
+# cos(3 phi) * D3H_X + sin(3 phi) * D3H_Y
+D3H_X = np.array([1.0, -1.0, 0.0, 0.0, 0.0, -1.0])
+D3H_Y = np.array([0.0, 0.0, 1.0, 1.0, -1.0, 0.0])
+
+
+class SceneState:
+    """Current polarization optics angles (degrees) and laser wavelength (nm)."""
+
+    def __init__(self):
+        self.angles: Dict[str, float] = {role: 0.0 for role in MOUNT_ROLES.values()}
+        self.wavelength = 780.0
+
+    def set_mount(self, mount_address: str, degrees: float):
+        """Record an Elliptec mount position; unknown addresses are ignored."""
+        role = MOUNT_ROLES.get(str(mount_address))
+        if role is not None:
+            self.angles[role] = float(degrees)
+
+    def set_wavelength(self, wavelength: float):
+        self.wavelength = float(wavelength)
+
+
+# State shared by the mock controllers and cameras
+SCENE_STATE = SceneState()
+
+
+def _half_wave(angle: float) -> np.ndarray:
+    c, s = np.cos(2 * angle), np.sin(2 * angle)
+    return np.array([[c, s], [s, -c]], dtype=complex)
+
+
+def _quarter_wave(angle: float) -> np.ndarray:
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array(
+        [[c * c + 1j * s * s, (1 - 1j) * s * c], [(1 - 1j) * s * c, s * s + 1j * c * c]]
+    )
+
+
+def polarization_weights(qwp: float, hwp_incident: float, hwp_analyzer: float):
+    """
+    Weight of each chi_ijk component (COMPONENTS order) in the detected SHG
+    field for the given waveplate angles in degrees.
+    """
+    field = (
+        _half_wave(np.radians(hwp_incident))
+        @ _quarter_wave(np.radians(qwp))
+        @ np.array([1.0, 0.0])
+    )
+    ex, ey = field
+    quadratic = np.array([ex * ex, ey * ey, 2 * ex * ey])
+    analyzer = _half_wave(np.radians(hwp_analyzer))[0]  # x output polarizer
+    return np.outer(analyzer, quadratic).ravel()
+
+
+def exciton_response(
+    center_ev: float = 2.9, width_ev: float = 0.15, background: float = 0.1
+):
+    """
+    Spectral response of an exciton resonance at the SHG photon energy: a
+    Lorentzian over a non-resonant background, 1 at resonance.
+    """
+
+    def response(wavelength: float) -> float:
+        detuning = (2 * 1239.84 / wavelength - center_ev) / width_ev
+        return (background + 1.0 / (1.0 + detuning**2)) / (1.0 + background)
+
+    return response
+
+
+class ShgScene:
+    """
+    Precomputed SHG response of a sample, rendered into camera frames.
+
+    Parameters
+    ----------
+    maps : numpy.ndarray
+        (B, height, width) real basis maps
+    patterns : numpy.ndarray
+        (B, 6) chi_ijk pattern of each map, in COMPONENTS order
+    peak_rate : float
+        Detected counts per ms where the SHG field amplitude is 1
+    spectrum : callable, optional
+        Relative SHG efficiency at a wavelength in nm (default: flat)
+    bias : float
+        Camera offset in counts
+    read_noise : float
+        Read noise in counts (RMS)
+    dark_rate : float
+        Dark counts per pixel per ms
+    seed : int, optional
+        Seed of the noise generator
+    """
+
+    def __init__(
+        self,
+        maps: np.ndarray,
+        patterns: np.ndarray,
+        peak_rate: float = 20.0,
+        spectrum=None,
+        bias: float = 100.0,
+        read_noise: float = 1.6,
+        dark_rate: float = 5e-4,
+        seed: Optional[int] = None,
+    ):
+        maps = np.asarray(maps, dtype=np.float32)
+        patterns = np.asarray(patterns, dtype=float).reshape(len(maps), 6)
+        self.shape: Tuple[int, int] = maps.shape[1:]
+        self._maps = maps.reshape(len(maps), -1)
+        self.patterns = patterns
+        self.peak_rate = peak_rate
+        self.spectrum = spectrum or (lambda wavelength: 1.0)
+        self.bias = bias
+        self.read_noise = read_noise
+        self.dark_rate = dark_rate
+        self._rng = np.random.default_rng(seed)
+        self._noise: Optional[np.ndarray] = None
+        self._scratch = np.empty(self._maps.shape[1], np.float32)
+        self._expected_key = None
+        self._expected: Optional[np.ndarray] = None
+        self._sigma: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def flakes(
+        cls,
+        shape: Tuple[int, int] = (256, 256),
+        count: int = 6,
+        beam_waist: float = 0.4,
+        seed: Optional[int] = 0,
+        **kwargs,
+    ) -> "ShgScene":
+        """
+        Triangular D3h monolayer flakes, each with its own lattice
+        orientation (aligned with its edges), under a Gaussian beam.
+
+        ``beam_waist`` is relative to the half-width of the frame; other
+        keyword arguments go to ShgScene.
+        """
+        rng = np.random.default_rng(seed)
+        height, width = shape
+        y = np.linspace(-1.0, 1.0, height, dtype=np.float32)[:, None]
+        x = np.linspace(-1.0, 1.0, width, dtype=np.float32)[None, :]
+
+        amplitude = np.zeros(shape, np.float32)
+        orientation = np.zeros(shape, np.float32)
+        for _ in range(count):
+            cy, cx = rng.uniform(-0.6, 0.6, 2)
+            size = rng.uniform(0.15, 0.35)
+            phi = rng.uniform(0.0, 2 * np.pi / 3)
+            # Inside the triangle: on the inner side of its three edges
+            inside = np.ones(shape, bool)
+            for k in range(3):
+                normal = phi + np.pi / 2 + k * 2 * np.pi / 3
+                inside &= (x - cx) * np.cos(normal) + (y - cy) * np.sin(
+                    normal
+                ) <= size / 2
+            amplitude[inside] = rng.uniform(0.6, 1.0)
+            orientation[inside] = phi
+
+        amplitude *= np.exp(-(x**2 + y**2) / beam_waist**2)
+        maps = np.stack(
+            [amplitude * np.cos(3 * orientation), amplitude * np.sin(3 * orientation)]
+        )
+        return cls(maps, np.stack([D3H_X, D3H_Y]), seed=seed, **kwargs)
+
+    def coefficients(
+        self, qwp: float, hwp_incident: float, hwp_analyzer: float
+    ) -> np.ndarray:
+        """Complex weight of each basis map in the detected SHG field."""
+        return self.patterns @ polarization_weights(qwp, hwp_incident, hwp_analyzer)
+
+    def expected(
+        self, exposure_ms: float, state: Optional[SceneState] = None
+    ) -> np.ndarray:
+        """Noise-free counts (bias included) for the given optics state."""
+        state = state or SCENE_STATE
+        with self._lock:
+            return self._expected_counts(exposure_ms, state).reshape(self.shape)
+
+    def _expected_counts(self, exposure_ms: float, state: SceneState) -> np.ndarray:
+        coefficients = self.coefficients(**state.angles)
+        gain = self.peak_rate * exposure_ms * self.spectrum(state.wavelength)
+        key = (tuple(coefficients), gain, exposure_ms)
+        if key != self._expected_key:
+            field = coefficients.real.astype(np.float32) @ self._maps
+            counts = field * field
+            if np.any(coefficients.imag):
+                field = coefficients.imag.astype(np.float32) @ self._maps
+                counts += field * field
+            counts *= np.float32(gain)
+            counts += np.float32(self.dark_rate * exposure_ms)
+            self._sigma = np.sqrt(counts + np.float32(self.read_noise**2))
+            counts += np.float32(self.bias)
+            self._expected = counts
+            self._expected_key = key
+        return self._expected
+
+    def _noise_view(self) -> np.ndarray:
+        size = len(self._scratch)
+        if self._noise is None:
+            self._noise = self._rng.standard_normal(2 * size, dtype=np.float32)
+        offset = int(self._rng.integers(0, size))
+        return self._noise[offset : offset + size]
+
+    def render(
+        self,
+        exposure_ms: float,
+        state: Optional[SceneState] = None,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Render one noisy 16-bit frame.
+
+        Parameters
+        ----------
+        exposure_ms : float
+            Exposure time in milliseconds
+        state : SceneState, optional
+            Optics state (default: the shared SCENE_STATE)
+        out : numpy.ndarray, optional
+            uint16 frame to render into
+
+        Returns
+        -------
+        numpy.ndarray
+            ``out``, or a new uint16 frame
+        """
+        state = state or SCENE_STATE
+        if out is None:
+            out = np.empty(self.shape, np.uint16)
+        with self._lock:
+            expected = self._expected_counts(exposure_ms, state)
+            frame = self._scratch
+            np.multiply(self._sigma, self._noise_view(), out=frame)
+            frame += expected
+            np.clip(frame, 0.0, 65535.0, out=frame)
+            np.rint(frame, out=frame)
+            out.reshape(-1)[:] = frame
+        return out
+
+
+_default_scenes: Dict[Tuple[int, int], ShgScene] = {}
+_default_lock = threading.Lock()
+
+
+def default_scene(shape: Sequence[int] = (256, 256)) -> ShgScene:
+    """Shared flake scene of the given frame shape, built on first use."""
+    shape = (int(shape[0]), int(shape[1]))
+    with _default_lock:
+        scene = _default_scenes.get(shape)
+        if scene is None:
+            logger.debug(f"Building synthetic SHG scene {shape}")
+            scene = _default_scenes[shape] = ShgScene.flakes(
+                shape, spectrum=exciton_response()
+            )
+        return scene
@@ -0,0 +1,32 @@
+"""
+Serial instrument simulators served on pseudo-terminals.
+
+Each simulator exposes a ``port`` path that the real controllers open in
+place of the hardware, so their serial code paths can be tested and timed
+without instruments attached (Linux/macOS only). Run them standalone with::
+
+    python -m pymodaq_plugins_urashg.hardware.urashg.simulators elliptec maitai
+"""
+
+from .base import SerialSimulator, SimulatedAxis
+from .elliptec import ElliptecSimulator
+from .esp300 import ESP300Simulator
+from .maitai import MaiTaiSimulator
+from .newport import Newport1830CSimulator
+
+SIMULATORS = {
+    "elliptec": ElliptecSimulator,
+    "esp300": ESP300Simulator,
+    "maitai": MaiTaiSimulator,
+    "newport": Newport1830CSimulator,
+}
+
+__all__ = [
+    "SerialSimulator",
+    "SimulatedAxis",
+    "ElliptecSimulator",
+    "ESP300Simulator",
+    "MaiTaiSimulator",
+    "Newport1830CSimulator",
+    "SIMULATORS",
+]
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Serve instrument simulators on pseudo-terminals until interrupted.
+
+Example::
+
+    python -m pymodaq_plugins_urashg.hardware.urashg.simulators \
+        elliptec newport --latency 0.01 --baudrate 9600
+
+prints the port of each simulator, which can then be entered as the serial
+port of the corresponding plugin or controller.
+"""
+
+import argparse
+import time
+
+from . import SIMULATORS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("devices", nargs="+", choices=sorted(SIMULATORS))
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="reply latency in seconds"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="random extra latency in seconds"
+    )
+    parser.add_argument(
+        "--baudrate", type=int, default=None, help="simulated line speed"
+    )
+    args = parser.parse_args(argv)
+
+    simulators = []
+    try:
+        for device in args.devices:
+            simulator = SIMULATORS[device](
+                latency=args.latency, jitter=args.jitter, baudrate=args.baudrate
+            )
+            simulators.append(simulator.start())
+            print(f"{device}: {simulator.port}", flush=True)
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for simulator in simulators:
+            simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
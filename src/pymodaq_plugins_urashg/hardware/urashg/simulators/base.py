@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Pseudo-terminal transport shared by the instrument simulators.
+
+A simulator owns the master side of a pty pair and answers the commands
+written to the slave side, whose path (``port``) can be opened with
+pyserial exactly like the real instrument.
+
+A simple link model makes the timing realistic: every reply is delayed by
+a processing latency (plus optional jitter), and with a baud rate set
+every byte takes ten bit times on the simulated wire in both directions.
+"""
+
+import logging
+import os
+import random
+import select
+import threading
+import time
+import tty
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SimulatedAxis:
+    """Constant-velocity axis model."""
+
+    def __init__(self, velocity: float, position: float = 0.0):
+        self.velocity = velocity
+        self.enabled = True
+        self.units = 2
+        self._start = position
+        self._target = position
+        self._t0 = 0.0
+
+    def position(self, now: Optional[float] = None) -> float:
+        now = time.monotonic() if now is None else now
+        travel = self._target - self._start
+        covered = self.velocity * (now - self._t0)
+        if covered >= abs(travel):
+            return self._target
+        return self._start + covered * (1 if travel > 0 else -1)
+
+    @property
+    def target(self) -> float:
+        return self._target
+
+    def is_done(self) -> bool:
+        return self.position() == self._target
+
+    def time_to_target(self) -> float:
+        """Seconds until the current move ends."""
+        return abs(self._target - self.position()) / self.velocity
+
+    def move_to(self, target: float):
+        now = time.monotonic()
+        self._start = self.position(now)
+        self._target = target
+        self._t0 = now
+
+    def stop(self):
+        self.move_to(self.position())
+
+
+class SerialSimulator:
+    """
+    Base class for line-oriented serial instrument simulators.
+
+    Subclasses implement ``handle_line`` and set the terminators of their
+    protocol.
+    """
+
+    # Byte that ends an incoming command
+    command_terminator = b"\n"
+
+    # Bytes appended to every reply
+    reply_terminator = b"\r\n"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        baudrate: Optional[int] = None,
+    ):
+        """
+        Args:
+            latency: Processing delay in seconds before every reply
+            jitter: Upper bound in seconds of a random delay added to latency
+            baudrate: Simulated line speed (None for an instantaneous link)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.baudrate = baudrate
+
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+
+        self._rx_buffer = bytearray()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._write_lock = threading.Lock()
+
+        # Every command received, for inspection in tests
+        self.received: List[str] = []
+
+    def handle_line(self, line: str) -> Optional[str]:
+        """
+        Process one command line and return the reply, if any.
+
+        Args:
+            line: Command without its terminator
+
+        Returns:
+            Reply without terminator, or None when the command is silent
+        """
+        raise NotImplementedError
+
+    def start(self) -> "SerialSimulator":
+        """Start serving the pty in a background thread."""
+        if not self._running:
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._serve, name=type(self).__name__, daemon=True
+            )
+            self._thread.start()
+            logger.debug(f"{type(self).__name__} serving on {self.port}")
+        return self
+
+    def stop(self):
+        """Stop serving and close the pty."""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        for fd in (self._master, self._slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def wire_time(self, num_bytes: int) -> float:
+        """Seconds ``num_bytes`` take on the simulated line (8N1 framing)."""
+        if not self.baudrate:
+            return 0.0
+        return num_bytes * 10.0 / self.baudrate
+
+    def send(self, reply: str):
+        """Write a reply (or an unsolicited message) to the port."""
+        data = reply.encode("ascii") + self.reply_terminator
+        with self._write_lock:
+            time.sleep(self.wire_time(len(data)))
+            os.write(self._master, data)
+
+    def _serve(self):
+        while self._running:
+            try:
+                readable, _, _ = select.select([self._master], [], [], 0.05)
+                if not readable:
+                    continue
+                self._rx_buffer += os.read(self._master, 1024)
+            except OSError:
+                break
+
+            while self.command_terminator in self._rx_buffer:
+                raw, _, rest = self._rx_buffer.partition(self.command_terminator)
+                self._rx_buffer = bytearray(rest)
+                line = raw.decode("ascii", errors="replace").strip()
+                if not line:
+                    continue
+                # The command is only complete once its last byte arrived
+                time.sleep(self.wire_time(len(raw) + len(self.command_terminator)))
+                self.received.append(line)
+                try:
+                    reply = self.handle_line(line)
+                except Exception as e:
+                    logger.error(f"{type(self).__name__} failed on {line!r}: {e}")
+                    continue
+                if reply is not None:
+                    time.sleep(self.latency + random.uniform(0.0, self.jitter))
+                    self.send(reply)
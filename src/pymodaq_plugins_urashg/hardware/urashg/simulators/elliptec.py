@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Simulated Thorlabs ELL14 rotation mounts sharing one Elliptec bus.
+
+Implements the ELLx commands used by ElliptecController: ``in``, ``gp``,
+``gs``, ``gv``, ``sv``, ``ma``, ``mr``, ``ho`` and ``st``. Moves answer with
+a ``PO`` reply sent unprompted once the mount stops, and ``gs`` reports
+``09`` (busy) while it is moving, as on the hardware.
+"""
+
+import threading
+from typing import Dict, Optional
+
+from .base import SerialSimulator, SimulatedAxis
+
+# GS status codes
+STATUS_OK = "00"
+STATUS_COMMAND_ERROR = "03"
+STATUS_BUSY = "09"
+
+
+class ElliptecSimulator(SerialSimulator):
+    """ELL14 mounts served on a pseudo-terminal."""
+
+    command_terminator = b"\r"
+    reply_terminator = b"\r\n"
+
+    # Encoder pulses per revolution of an ELL14
+    pulses_per_rev = 23000
+
+    def __init__(self, addresses: str = "2,3,8", velocity: float = 360.0, **link):
+        """
+        Args:
+            addresses: Comma-separated bus addresses of the mounts
+            velocity: Rotation speed at 100 % velocity, in degrees per second
+            **link: Link model (latency, jitter, baudrate) of SerialSimulator
+        """
+        super().__init__(**link)
+        self.max_velocity = velocity * self.pulses_per_rev / 360.0
+        self.mounts: Dict[str, SimulatedAxis] = {
+            addr.strip(): SimulatedAxis(self.max_velocity)
+            for addr in addresses.split(",")
+        }
+        self.velocity_percent = {addr: 100 for addr in self.mounts}
+        self._timers: Dict[str, threading.Timer] = {}
+
+    def degrees(self, address: str) -> float:
+        """Current angle of a mount, for inspection in tests."""
+        return self.mounts[address].position() * 360.0 / self.pulses_per_rev
+
+    def handle_line(self, line: str) -> Optional[str]:
+        address, instruction, data = line[:1], line[1:3].lower(), line[3:]
+        mount = self.mounts.get(address)
+        if mount is None:
+            # Nobody on the bus answers an unknown address
+            return None
+
+        if instruction == "in":
+            # Type, serial number, year, firmware, hardware, travel, pulses
+            serial_number = 11400500 + int(address, 16)
+            return (
+                f"{address}IN0E{serial_number:08d}20231700"
+                f"{360:04X}{self.pulses_per_rev:08X}"
+            )
+        if instruction == "gp":
+            return self._position_reply(address)
+        if instruction == "gs":
+            return self._status_reply(
+                address, STATUS_OK if mount.is_done() else STATUS_BUSY
+            )
+        if instruction == "gv":
+            return f"{address}GV{self.velocity_percent[address]:02X}"
+        if instruction == "sv":
+            percent = int(data, 16)
+            self.velocity_percent[address] = percent
+            mount.velocity = self.max_velocity * max(percent, 1) / 100.0
+            return self._status_reply(address, STATUS_OK)
+        if instruction == "ma":
+            return self._move(address, self._decode(data))
+        if instruction == "mr":
+            return self._move(address, mount.target + self._decode(data))
+        if instruction == "ho":
+            return self._move(address, 0)
+        if instruction == "st":
+            self._cancel(address)
+            mount.stop()
+            return self._position_reply(address)
+
+        return self._status_reply(address, STATUS_COMMAND_ERROR)
+
+    def stop(self):
+        for address in list(self._timers):
+            self._cancel(address)
+        super().stop()
+
+    @staticmethod
+    def _decode(data: str) -> int:
+        """Decode an 8-digit two's complement pulse count."""
+        pulses = int(data, 16)
+        return pulses - 0x100000000 if pulses & 0x80000000 else pulses
+
+    def _position_reply(self, address: str, pulses: Optional[float] = None) -> str:
+        if pulses is None:
+            pulses = self.mounts[address].position()
+        return f"{address}PO{int(round(pulses)) & 0xFFFFFFFF:08X}"
+
+    @staticmethod
+    def _status_reply(address: str, status: str) -> str:
+        return f"{address}GS{status}"
+
+    def _move(self, address: str, target: int) -> Optional[str]:
+        mount = self.mounts[address]
+        self._cancel(address)
+        mount.move_to(target)
+        duration = mount.time_to_target()
+        if duration == 0:
+            return self._position_reply(address)
+
+        timer = threading.Timer(duration, self._finish_move, args=(address,))
+        timer.daemon = True
+        self._timers[address] = timer
+        timer.start()
+        return None
+
+    def _finish_move(self, address: str):
+        self._timers.pop(address, None)
+        if self._running:
+            self.send(self._position_reply(address, self.mounts[address].target))
+
+    def _cancel(self, address: str):
+        timer = self._timers.pop(address, None)
+        if timer is not None:
+            timer.cancel()
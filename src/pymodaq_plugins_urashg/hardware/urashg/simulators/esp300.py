@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Simulated Newport ESP300 motion controller.
+
+Implements the subset of the ESP300 command set used by ESP300Controller:
+motion (PA, PR, OR, ST, MO, MF), queries (TP, MD?, VA?, TE?, SN?, MO?),
+semicolon-chained commands with comma-separated replies, and stored
+programs (EP, QP, EX, XX, WS, WT).
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from .base import SerialSimulator, SimulatedAxis
+
+_COMMAND = re.compile(r"^(\d*)([A-Z]{2})(\?)?(.*)$")
+
+
+class ESP300Simulator(SerialSimulator):
+    """ESP300 served on a pseudo-terminal."""
+
+    command_terminator = b"\n"
+    reply_terminator = b"\r\n"
+
+    def __init__(self, num_axes: int = 3, velocity: float = 20.0, **link):
+        """
+        Args:
+            num_axes: Number of simulated axes
+            velocity: Default axis velocity in units per second
+            **link: Link model (latency, jitter, baudrate) of SerialSimulator
+        """
+        super().__init__(**link)
+        self.axes = {num: SimulatedAxis(velocity) for num in range(1, num_axes + 1)}
+        self.programs: Dict[int, List[str]] = {}
+        self.errors = deque()
+        self._recording: Optional[int] = None
+        self._program_thread: Optional[threading.Thread] = None
+
+    def handle_line(self, line: str) -> Optional[str]:
+        if self._recording is not None:
+            if line.upper() == "QP":
+                self._recording = None
+            else:
+                self.programs[self._recording].append(line)
+            return None
+
+        replies = []
+        for token in line.split(";"):
+            reply = self._execute(token.strip())
+            if reply is not None:
+                replies.append(reply)
+        return ",".join(replies) if replies else None
+
+    def _execute(self, token: str) -> Optional[str]:
+        match = _COMMAND.match(token.upper())
+        if match is None:
+            self.errors.append(6)
+            return None
+        number, mnemonic, query, argument = match.groups()
+        number = int(number) if number else None
+
+        if mnemonic == "TE":
+            return str(self.errors.popleft() if self.errors else 0)
+        if mnemonic in ("EP", "EX", "XX"):
+            return self._program_command(mnemonic, number)
+        if mnemonic == "WT":
+            time.sleep(float(argument or 0) / 1000.0)
+            return None
+        if mnemonic == "WS" and number is None:
+            self._wait_for_stop(list(self.axes))
+            return None
+
+        axis = self.axes.get(number)
+        if axis is None:
+            self.errors.append(9 if number is not None else 37)
+            return None
+
+        if mnemonic == "TP":
+            return f"{axis.position():.6f}"
+        if mnemonic == "MD":
+            return "1" if axis.is_done() else "0"
+        if mnemonic == "VA":
+            if query:
+                return f"{axis.velocity:.6f}"
+            axis.velocity = float(argument)
+            return None
+        if mnemonic == "MO":
+            if query:
+                return "1" if axis.enabled else "0"
+            axis.enabled = True
+            return None
+        if mnemonic == "MF":
+            axis.enabled = False
+            return None
+        if mnemonic == "SN":
+            if query:
+                return str(axis.units)
+            axis.units = int(argument)
+            return None
+        if mnemonic == "PA":
+            axis.move_to(float(argument))
+            return None
+        if mnemonic == "PR":
+            axis.move_to(axis.position() + float(argument))
+            return None
+        if mnemonic == "OR":
+            axis.move_to(0.0)
+            return None
+        if mnemonic == "ST":
+            axis.stop()
+            return None
+        if mnemonic == "WS":
+            self._wait_for_stop([number])
+            if argument:
+                time.sleep(float(argument) / 1000.0)
+            return None
+        if mnemonic in ("SL", "SR"):
+            return None
+
+        self.errors.append(6)
+        return None
+
+    def _program_command(self, mnemonic: str, number: Optional[int]) -> None:
+        if number is None:
+            self.errors.append(38)
+        elif mnemonic == "EP":
+            self.programs[number] = []
+            self._recording = number
+        elif number not in self.programs:
+            self.errors.append(35)
+        elif mnemonic == "XX":
+            del self.programs[number]
+        elif self.program_running:
+            self.errors.append(27)
+        else:
+            self._program_thread = threading.Thread(
+                target=self._run_program, args=(self.programs[number],), daemon=True
+            )
+            self._program_thread.start()
+        return None
+
+    @property
+    def program_running(self) -> bool:
+        """True while a stored program is executing."""
+        return self._program_thread is not None and self._program_thread.is_alive()
+
+    def _run_program(self, lines: List[str]):
+        for line in lines:
+            if not self._running:
+                return
+            for token in line.split(";"):
+                self._execute(token.strip())
+
+    def _wait_for_stop(self, numbers: List[int]):
+        while self._running and not all(
+            self.axes[num].is_done() for num in numbers if num in self.axes
+        ):
+            time.sleep(0.001)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Simulated Spectra-Physics MaiTai Ti:Sapphire laser.
+
+Implements the SCPI subset used by MaiTaiController: wavelength set and
+queries (WAVELENGTH, READ:WAV?), power, shutter, ``*STB?``, ``*IDN?`` and
+the ``SYSTem:ERR?`` queue. The measured wavelength slews towards the
+commanded one at a finite tuning rate and the laser only reports modelocked
+operation once it has arrived, so settle detection can be exercised.
+"""
+
+import random
+from collections import deque
+from typing import Optional
+
+from .base import SerialSimulator, SimulatedAxis
+
+NO_ERROR = "0,No error"
+
+
+class MaiTaiSimulator(SerialSimulator):
+    """MaiTai laser served on a pseudo-terminal."""
+
+    command_terminator = b"\n"
+    reply_terminator = b"\n"
+
+    # Tunable range (nm)
+    min_wavelength = 690.0
+    max_wavelength = 1040.0
+
+    def __init__(
+        self,
+        wavelength: float = 800.0,
+        power: float = 2.5,
+        tuning_rate: float = 50.0,
+        **link,
+    ):
+        """
+        Args:
+            wavelength: Initial wavelength in nm
+            power: Output power in W with the shutter open
+            tuning_rate: Wavelength slew rate in nm per second
+            **link: Link model (latency, jitter, baudrate) of SerialSimulator
+        """
+        super().__init__(**link)
+        self.wavelength = SimulatedAxis(tuning_rate, position=wavelength)
+        self.power = power
+        self.shutter_open = False
+        self.emission = True
+        self.errors = deque()
+
+    @property
+    def modelocked(self) -> bool:
+        return self.emission and self.wavelength.is_done()
+
+    def handle_line(self, line: str) -> Optional[str]:
+        command, _, argument = line.upper().partition(" ")
+        argument = argument.strip()
+
+        if command in ("WAVELENGTH", "WAV"):
+            return self._set_wavelength(argument)
+        if command in ("WAVELENGTH?", "WAV?"):
+            return f"{self.wavelength.target:.1f}nm"
+        if command in ("READ:WAV?", "READ:WAVELENGTH?"):
+            return f"{self.wavelength.position():.2f}nm"
+        if command in ("POWER?", "POW?", "READ:POW?", "READ:POWER?"):
+            power = self.power if self.shutter_open and self.emission else 0.0
+            return f"{power * random.uniform(0.99, 1.01):.3f}W"
+        if command in ("SHUTTER", "SHUT"):
+            self.shutter_open = argument in ("1", "ON", "OPEN")
+            return None
+        if command in ("SHUTTER?", "SHUT?"):
+            return "1" if self.shutter_open else "0"
+        if command == "*STB?":
+            return str(int(self.emission) | (2 if self.modelocked else 0))
+        if command == "*IDN?":
+            return "Spectra Physics,MaiTai,SN0001,v2.1.0"
+        if command in ("SYSTEM:ERR?", "SYST:ERR?"):
+            return self.errors.popleft() if self.errors else NO_ERROR
+        if command in ("ON", "OFF"):
+            self.emission = command == "ON"
+            return None
+        if command == "*RST":
+            self.shutter_open = False
+            self.wavelength.move_to(800.0)
+            return None
+
+        self.errors.append("-113,Undefined header")
+        return None
+
+    def _set_wavelength(self, argument: str) -> None:
+        try:
+            wavelength = float(argument)
+        except ValueError:
+            self.errors.append("-104,Data type error")
+            return None
+        if not self.min_wavelength <= wavelength <= self.max_wavelength:
+            self.errors.append("-222,Data out of range")
+            return None
+        self.wavelength.move_to(wavelength)
+        return None
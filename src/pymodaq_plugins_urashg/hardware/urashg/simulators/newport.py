@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Simulated Newport 1830-C optical power meter.
+
+Implements the commands used by Newport1830CController: wavelength (W, W?),
+units (U1, U3, U?), power reading (D?), range (AR, Rn), filter (Fx) and
+zero (Z). Range, filter and zero commands are acknowledged with a line
+since the controller waits for one.
+"""
+
+import math
+import random
+from typing import Optional
+
+from .base import SerialSimulator
+
+ACKNOWLEDGE = "OK"
+
+
+class Newport1830CSimulator(SerialSimulator):
+    """Newport 1830-C served on a pseudo-terminal."""
+
+    command_terminator = b"\n"
+    reply_terminator = b"\r\n"
+
+    def __init__(self, power: float = 3.5e-3, noise: float = 1e-3, **link):
+        """
+        Args:
+            power: Optical power on the detector in W
+            noise: Relative standard deviation of the readings
+            **link: Link model (latency, jitter, baudrate) of SerialSimulator
+        """
+        super().__init__(**link)
+        self.power = power
+        self.noise = noise
+        self.wavelength = 800
+        self.units = "1"  # 1 = W, 3 = dBm
+        self.range = 0  # 0 = auto
+        self.filter = "M"
+        self.zero_offset = 0.0
+
+    def reading(self) -> float:
+        """One noisy power reading in W, zero offset applied."""
+        return self.power * (1.0 + random.gauss(0.0, self.noise)) - self.zero_offset
+
+    def handle_line(self, line: str) -> Optional[str]:
+        command = line.upper()
+
+        if command == "D?":
+            power = self.reading()
+            if self.units == "3":
+                return f"{10.0 * math.log10(max(power, 1e-12) / 1e-3):.3f}"
+            return f"{power:.4E}"
+        if command == "W?":
+            return str(self.wavelength)
+        if command == "U?":
+            return self.units
+        if command == "*IDN?":
+            return "Newport,1830-C,0,1.0"
+        if command.startswith("W"):
+            self.wavelength = int(float(command[1:]))
+            return None
+        if command in ("U1", "U3"):
+            self.units = command[1]
+            return None
+        if command == "AR":
+            self.range = 0
+            return ACKNOWLEDGE
+        if command.startswith("R") and command[1:].isdigit():
+            self.range = int(command[1:])
+            return ACKNOWLEDGE
+        if command in ("FS", "FM", "FF"):
+            self.filter = command[1]
+            return ACKNOWLEDGE
+        if command == "Z":
+            self.zero_offset += self.reading()
+            return ACKNOWLEDGE
+
+        return None
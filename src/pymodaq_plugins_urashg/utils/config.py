@@ -59,6 +59,7 @@ class Config(BaseConfig if PYMODAQ_CONFIG_AVAILABLE else dict):
                         "mount_addresses": [2, 3, 8],
                         "home_on_startup": False,
                         "position_tolerance": 0.1,
+                        "position_cache_ttl": 0.5,
                     },
                     "maitai": {
                         "serial_port": "/dev/ttyUSB2",
@@ -66,16 +67,21 @@ class Config(BaseConfig if PYMODAQ_CONFIG_AVAILABLE else dict):
                         "timeout": 5.0,
                         "wavelength_range_min": 700.0,
                         "wavelength_range_max": 1000.0,
+                        "poll_interval": 0.0,
                     },
                     "camera": {
                         "exposure_default": 100.0,
                         "gain_default": 1,
                         "cooling_enabled": True,
                         "cooling_temperature": -20,
+                        "binning": 1,
+                        "roi_enabled": False,
                         "roi_x": 0,
                         "roi_y": 0,
                         "roi_width": 2048,
                         "roi_height": 2048,
+                        "continuous_acquisition": False,
+                        "buffer_frames": 16,
                     },
                 },
                 "measurement": {
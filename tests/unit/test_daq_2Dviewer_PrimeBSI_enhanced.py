@@ -230,6 +230,173 @@ class TestPrimeBSIPluginEnhanced:
             # Note: In error cases, dte_signal should not be called
             mock_dte_signal.emit.assert_not_called()
 
+    def test_grab_data_continuous(self, primebsi_plugin_enhanced):
+        """Test continuous acquisition averaging Naverage streamed frames."""
+        import time
+
+        plugin = primebsi_plugin_enhanced
+        frames = iter(range(1000))
+        plugin.camera.poll_frame.side_effect = lambda **kwargs: (
+            time.sleep(0.001)
+            or {"pixel_data": np.full((8, 8), next(frames), dtype=np.uint16)},
+            1000.0,
+            0,
+        )
+        from pymodaq_data.data import Axis
+        plugin.x_axis = Axis(label="x", units="pixels", data=np.arange(8))
+        plugin.y_axis = Axis(label="y", units="pixels", data=np.arange(8))
+        plugin.settings.child("camera_settings", "exposure").setValue(1.0)
+        plugin.settings.child("camera_settings", "continuous").setValue(True)
+
+        with patch.object(plugin, 'dte_signal') as mock_signal:
+            plugin.grab_data(Naverage=4)
+            deadline = time.monotonic() + 5.0
+            while not mock_signal.emit.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+            plugin.stop()
+
+        mock_signal.emit.assert_called_once()
+        frame = mock_signal.emit.call_args[0][0][0].data[0]
+        # Four consecutive frames average to their middle value
+        assert np.all(frame == frame[0, 0]) and (frame[0, 0] * 2) % 2 == 1
+        plugin.camera.get_frame.assert_not_called()
+        plugin.camera.start_live.assert_called_once_with(exp_time=1, buffer_frame_count=16)
+        plugin.camera.stop_live.assert_called_once()
+        assert plugin._acquisition is None and plugin._consumer is None
+
+    def test_grab_data_dark_correction(self, primebsi_plugin_enhanced, tmp_path):
+        """Test master dark acquisition and its reuse per exposure."""
+        from pymodaq_data.data import Axis
+
+        plugin = primebsi_plugin_enhanced
+        plugin.camera.sensor_size = (8, 8)
+        plugin.x_axis = Axis(label="x", units="pixels", data=np.arange(8))
+        plugin.y_axis = Axis(label="y", units="pixels", data=np.arange(8))
+        plugin.camera.get_frame.side_effect = None
+        calibration = plugin.settings.child("calibration")
+        calibration.child("calibration_dir").setValue(str(tmp_path))
+        calibration.child("calibration_frames").setValue(4)
+        exposure = plugin.settings.child("camera_settings", "exposure")
+
+        def grab(value):
+            plugin.camera.get_frame.return_value = np.full(64, value, dtype=np.uint16)
+            with patch.object(plugin, 'dte_signal') as mock_signal:
+                plugin.grab_data(Naverage=1)
+            return mock_signal.emit.call_args[0][0][0].data[0]
+
+        for value, exposure_ms in ((100, 10.0), (150, 20.0)):
+            exposure.setValue(exposure_ms)
+            plugin.camera.get_frame.return_value = np.full(64, value, dtype=np.uint16)
+            plugin.commit_settings(calibration.child("acquire_dark"))
+        assert plugin.camera.get_frame.call_count == 8
+        assert len(list(tmp_path.glob("dark_*.npz"))) == 2
+
+        calibration.child("dark_correction").setValue(True)
+        plugin.commit_settings(calibration.child("dark_correction"))
+        frame = grab(300)
+        assert frame.dtype == np.float32 and np.all(frame == 150.0)
+
+        # Switching exposure picks the matching master without re-acquiring
+        exposure.setValue(10.0)
+        assert np.all(grab(300) == 200.0)
+        assert plugin.camera.get_frame.call_count == 10
+
+        # No master for this exposure: frames pass uncorrected
+        exposure.setValue(30.0)
+        with patch.object(plugin, 'emit_status') as mock_status:
+            assert np.all(grab(300) == 300)
+        assert "No master dark" in mock_status.call_args[0][0].attribute[0]
+
+    def test_grab_data_sensor_roi(self, primebsi_plugin_enhanced):
+        """Test that only the binned sensor ROI is read out and emitted."""
+        plugin = primebsi_plugin_enhanced
+        plugin.settings.child("camera_settings", "exposure").setValue(1.0)
+        assert plugin.ini_detector()[1]
+        assert plugin.x_axis.size == 2048
+
+        roi_settings = plugin.settings.child("roi_settings")
+        roi_settings.child("roi_x").setValue(100)
+        roi_settings.child("roi_y").setValue(200)
+        roi_settings.child("roi_width").setValue(65)
+        roi_settings.child("roi_height").setValue(32)
+        roi_settings.child("binning").setValue(2)
+        roi_settings.child("sensor_roi").setValue(True)
+        plugin.commit_settings(roi_settings.child("sensor_roi"))
+
+        plugin.camera.set_roi.assert_called_with(100, 200, 64, 32)
+        assert plugin.camera.binning == (2, 2)
+        assert plugin.x_axis.get_data()[:2].tolist() == [100.5, 102.5]
+        assert plugin.y_axis.size == 16
+
+        with patch.object(plugin, 'dte_signal') as mock_signal:
+            plugin.grab_data(Naverage=1)
+
+        dte = mock_signal.emit.call_args[0][0]
+        frame = dte.get_data_from_name("PrimeBSI").data[0]
+        assert frame.shape == (16, 32)
+        signal = dte.get_data_from_name("SHG Signal").data[0][0]
+        assert signal == frame.sum(dtype=np.float64)
+        assert plugin.settings.child("camera_settings", "frame_rate").value() > 0
+
+    def test_grab_data_preview(self, primebsi_plugin_enhanced):
+        """Test that the reduced preview is displayed and the full frame saved."""
+        plugin = primebsi_plugin_enhanced
+        frame = np.arange(2048 * 2048, dtype=np.uint16).reshape(2048, 2048)
+        plugin.camera.get_frame.side_effect = None
+        plugin.camera.get_frame.return_value = frame.ravel()
+
+        preview_settings = plugin.settings.child("preview_settings")
+        preview_settings.child("preview_factor").setValue(8)
+        preview_settings.child("preview").setValue(True)
+        plugin.commit_settings(preview_settings.child("preview"))
+
+        with patch.object(plugin, 'dte_signal') as mock_signal:
+            plugin.grab_data(Naverage=1)
+
+        dte = mock_signal.emit.call_args[0][0]
+        full = dte.get_data_from_name("PrimeBSI")
+        assert full.do_plot is False
+        assert full.data[0].shape == (2048, 2048)
+        preview = dte.get_data_from_name("PrimeBSI Preview")
+        assert preview.do_save is False
+        assert preview.data[0].shape == (256, 256)
+        assert preview.data[0][0, 0] == np.mean(frame[:8, :8])
+        assert preview.get_axis_from_index(1)[0].get_data()[0] == 3.5
+
+        preview_settings.child("preview_mode").setValue("decimate")
+        plugin.commit_settings(preview_settings.child("preview_mode"))
+        with patch.object(plugin, 'dte_signal') as mock_signal:
+            plugin.grab_data(Naverage=1)
+        preview = mock_signal.emit.call_args[0][0].get_data_from_name("PrimeBSI Preview")
+        assert preview.data[0][1, 1] == frame[8, 8]
+
+    def test_grab_data_multi_roi(self, primebsi_plugin_enhanced, tmp_path):
+        """Test that all ROIs are emitted as one 1D data object."""
+        plugin = primebsi_plugin_enhanced
+        frame = np.arange(2048 * 2048, dtype=np.uint16).reshape(2048, 2048)
+        plugin.camera.get_frame.side_effect = None
+        plugin.camera.get_frame.return_value = frame.ravel()
+        labels = np.zeros((2048, 2048), dtype=np.uint8)
+        labels[100:110, 200:220] = 1
+        np.save(tmp_path / "labels.npy", labels)
+
+        roi_settings = plugin.settings.child("roi_settings")
+        roi_settings.child("rois").setValue("0, 2, 0, 3\n10, 5, 20, 5")
+        roi_settings.child("roi_mask_file").setValue(str(tmp_path / "labels.npy"))
+        plugin.commit_settings(roi_settings.child("rois"))
+
+        with patch.object(plugin, 'dte_signal') as mock_signal:
+            plugin.grab_data(Naverage=1)
+
+        dte = mock_signal.emit.call_args[0][0]
+        signals = dte.get_data_from_name("ROI Signals")
+        assert signals.dim == "Data1D"
+        assert signals.data[0].tolist() == [
+            frame[:2, :3].sum(),
+            frame[10:15, 20:25].sum(),
+            frame[labels == 1].sum(dtype=np.int64),
+        ]
+
     def test_commit_settings_exposure(self, primebsi_plugin_enhanced):
         """Test exposure time parameter changes."""
         plugin = primebsi_plugin_enhanced
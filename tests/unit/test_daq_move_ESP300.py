@@ -55,3 +55,34 @@ def test_close(esp300_plugin):
     esp300_plugin.close()
     if esp300_plugin.controller is not None:
         esp300_plugin.controller.disconnect.assert_called_once()
+
+
+def test_move_abs_reports_controller_error(esp300_plugin):
+    """Test that an error seen while waiting for motion reaches the status."""
+    from unittest.mock import Mock
+
+    from pymodaq_plugins_urashg.hardware.urashg.esp300_controller import (
+        ESP300AxisError,
+    )
+
+    controller = esp300_plugin.controller
+    controller.is_connected.return_value = True
+    controller.move_multiple_axes.return_value = False
+    controller.last_error = 123
+    controller.describe_error = lambda code: str(ESP300AxisError(code))
+    esp300_plugin._current_axes = ["x", "y"]
+    esp300_plugin.emit_status = Mock()
+    esp300_plugin.move_done = Mock()
+
+    esp300_plugin.move_abs([1.0, 2.0])
+
+    esp300_plugin.move_done.assert_not_called()
+    statuses = [
+        call.args[0].attribute[0]
+        for call in esp300_plugin.emit_status.call_args_list
+        if call.args[0].command == "Update_Status"
+    ]
+    expected = f"Multi-axis move failed: {ESP300AxisError(123)}"
+    assert statuses == [f"Move error: {expected}"]
+    last_error = esp300_plugin.settings.child("status_group", "last_error").value()
+    assert last_error == expected
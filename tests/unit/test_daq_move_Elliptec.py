@@ -54,6 +54,10 @@ def elliptec_plugin_with_mock_controller():
     mock_controller.home_all.return_value = True
     mock_controller.home.return_value = True
     mock_controller.move_absolute.return_value = True
+    # Coordinated moves resolve to per-mount moves on the mock
+    mock_controller.move_absolute_multiple.side_effect = lambda targets: {
+        addr: mock_controller.move_absolute(addr, pos) for addr, pos in targets.items()
+    }
     mock_controller.move_relative.return_value = True
     mock_controller.get_all_positions.return_value = {"2": 10.0, "3": 20.0, "8": 30.0}
 
@@ -136,6 +140,17 @@ def test_move_abs_with_list(elliptec_plugin_with_mock_controller):
     assert calls[2][0] == ("8", 120.0)
 
 
+def test_move_abs_moves_mounts_together(elliptec_plugin_with_mock_controller):
+    """Test that move_abs issues a single coordinated move for all mounts."""
+    plugin = elliptec_plugin_with_mock_controller
+
+    plugin.move_abs([30.0, 60.0, 120.0])
+
+    plugin.controller.move_absolute_multiple.assert_called_once_with(
+        {"2": 30.0, "3": 60.0, "8": 120.0}
+    )
+
+
 def test_move_abs_bounds_checking(elliptec_plugin_with_mock_controller):
     """Test that move_abs properly applies bounds checking."""
     plugin = elliptec_plugin_with_mock_controller
@@ -322,6 +337,25 @@ def test_move_abs_controller_failure(elliptec_plugin_with_mock_controller):
     assert plugin.controller.move_absolute.call_count == 3
 
 
+def test_move_abs_reports_failed_mounts(elliptec_plugin_with_mock_controller):
+    """Test that the status names the mounts whose move failed."""
+    plugin = elliptec_plugin_with_mock_controller
+    plugin.emit_status = Mock()
+    plugin.move_done = Mock()
+    plugin.controller.move_absolute_multiple.side_effect = None
+    plugin.controller.move_absolute_multiple.return_value = {
+        "2": True,
+        "3": False,
+        "8": True,
+    }
+
+    plugin.move_abs([45.0, 90.0, 135.0])
+
+    plugin.move_done.assert_not_called()
+    command = plugin.emit_status.call_args[0][0]
+    assert command.attribute == ["Failed to move QWP to 90.0°", "log"]
+
+
 def test_plugin_parameters(elliptec_plugin):
     """Test that plugin has correct parameter structure."""
     # Check that essential parameter groups exist
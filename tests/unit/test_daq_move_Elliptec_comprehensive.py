@@ -39,6 +39,10 @@ def mock_elliptec_controller():
         
         # Mock movement operations
         mock_controller.move_absolute.return_value = True
+        # Coordinated moves resolve to per-mount moves on the mock
+        mock_controller.move_absolute_multiple.side_effect = lambda targets: {
+            addr: mock_controller.move_absolute(addr, pos) for addr, pos in targets.items()
+        }
         mock_controller.move_relative.return_value = True
         mock_controller.home.return_value = True
         mock_controller.home_all.return_value = True
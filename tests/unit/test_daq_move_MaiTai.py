@@ -527,3 +527,32 @@ def test_move_done_signal_integration():
     # Test that move_done is called after successful move
     plugin.move_abs(850.0)
     plugin.move_done.assert_called_once()
+
+
+def test_move_abs_with_status_poller():
+    """Test that a move is reflected at once while the status poller runs."""
+    import time
+
+    from pymodaq_plugins_urashg.daq_move_plugins.daq_move_MaiTai import DAQ_Move_MaiTai
+    from pymodaq_plugins_urashg.hardware.urashg.maitai_control import MaiTaiController
+
+    plugin = DAQ_Move_MaiTai()
+    plugin.move_done = Mock()
+    plugin.controller = MaiTaiController(mock_mode=True)
+    plugin.controller.connect()
+    plugin.settings.child("connection_group", "poll_interval").setValue(0.05)
+    plugin._apply_poll_interval()
+    try:
+        deadline = time.monotonic() + 5.0
+        while plugin.controller.get_state() is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert plugin.get_actuator_value()[0][0] == pytest.approx(780.0)
+
+        plugin.move_abs(790.0)
+        plugin.move_done.assert_called_once()
+        assert plugin.get_actuator_value()[0][0] == pytest.approx(790.0)
+
+        plugin.move_rel(5.0)
+        assert plugin.get_actuator_value()[0][0] == pytest.approx(795.0)
+    finally:
+        plugin.controller.disconnect()
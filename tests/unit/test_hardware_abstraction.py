@@ -4,11 +4,180 @@ Comprehensive tests for hardware abstraction layer to improve coverage.
 This module tests the various hardware controllers and utilities that provide
 the foundation for the PyMoDAQ plugins.
 """
+import os
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import numpy as np
 
 
+class FakeSerialPort:
+    """Minimal pyserial stand-in that answers writes from a reply table."""
+
+    def __init__(self, replies=None):
+        self.replies = replies or {}
+        self.written = []
+        self.is_open = True
+        self._pending = b""
+
+    @property
+    def in_waiting(self):
+        return len(self._pending)
+
+    def write(self, data):
+        self.written.append(data)
+        self._pending += self.replies.get(data, b"")
+        return len(data)
+
+    def read(self, size=1):
+        chunk, self._pending = self._pending[:size], self._pending[size:]
+        return chunk
+
+    def readline(self):
+        line, sep, rest = self._pending.partition(b"\n")
+        self._pending = rest
+        return line + sep
+
+    def read_until(self, expected=b"\n"):
+        line, sep, rest = self._pending.partition(expected)
+        self._pending = rest
+        return line + sep
+
+    def reset_input_buffer(self):
+        self._pending = b""
+
+    def reset_output_buffer(self):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.is_open = False
+
+
+class TestSerialTransport:
+    """Test suite for the shared serial transport."""
+
+    def test_transport_request_response(self):
+        """Test framing, correlation, retries and unsolicited frames."""
+        import asyncio
+
+        from pymodaq_plugins_urashg.hardware.urashg.serial_transport import SerialTransport
+
+        port = FakeSerialPort(
+            {
+                b"A?\r\n": b"late\r\nA=1\r\n",
+                b"B?\r\n": b"\x01\x02\x03",
+            }
+        )
+        unsolicited = []
+        transport = SerialTransport(port, timeout=0.05, on_unsolicited=unsolicited.append)
+        try:
+            assert transport.query("A?", match=lambda f: f.startswith(b"A=")) == b"A=1"
+            assert unsolicited == [b"late"]
+            assert transport.query("B?", length=3) == b"\x01\x02\x03"
+
+            # Commands are executed in submission order
+            futures = [transport.write("X"), transport.submit("A?"), transport.write("Y")]
+            assert [f.result() for f in futures] == [b"", b"late", b""]
+            assert port.written[-3:] == [b"X\r\n", b"A?\r\n", b"Y\r\n"]
+
+            # A silent instrument is asked again, then reported as None
+            port.written.clear()
+            assert transport.query("C?", retries=2) is None
+            assert port.written == [b"C?\r\n"] * 3
+
+            assert asyncio.run(transport.query_async(b"A?\r\n")) == b"late"
+        finally:
+            transport.close()
+
+        assert not transport.is_alive
+        with pytest.raises(ConnectionError):
+            transport.submit("A?")
+
+    def test_transport_pipeline(self):
+        """Test that pipelined queries are one write with replies in order."""
+        from pymodaq_plugins_urashg.hardware.urashg.serial_transport import SerialTransport
+
+        port = FakeSerialPort({b"A?\nB?\nC?\n": b"1\r\n2\r\n3\r\n"})
+        transport = SerialTransport(port, write_terminator=b"\n", timeout=0.05)
+        try:
+            assert transport.pipeline(["A?", "B?", "C?"]) == [b"1", b"2", b"3"]
+            assert port.written == [b"A?\nB?\nC?\n"]
+            assert transport.pipeline(["A?"]) == [None]
+            assert transport.pipeline([]) == []
+
+            # Replies after a missing one are not attributed
+            port.replies[b"A?\nB?\nC?\n"] = b"1\r\n"
+            assert transport.pipeline(["A?", "B?", "C?"]) == [b"1", None, None]
+        finally:
+            transport.close()
+
+    def test_transport_metrics(self, tmp_path):
+        """Test per-command latency, timeout, retry and byte metrics."""
+        import json
+
+        from pymodaq_plugins_urashg.hardware.urashg.serial_metrics import (
+            LatencyHistogram,
+            MetricsRegistry,
+            command_key,
+        )
+        from pymodaq_plugins_urashg.hardware.urashg.serial_transport import SerialTransport
+
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.record(value * 1e-3)
+        assert histogram.percentile(50) == pytest.approx(50e-3, rel=1 / 16)
+        assert histogram.percentile(99) == pytest.approx(99e-3, rel=1 / 16)
+        assert histogram.percentile(100) == pytest.approx(100e-3)
+        assert command_key("1PA2.5") == "PA"
+        assert command_key("1TP;2TP;TE?") == "TP;TE?"
+
+        registry = MetricsRegistry()
+        metrics = registry.device("test")
+        port = FakeSerialPort({b"A?\n": b"1\r\n", b"A?\nB?\n": b"1\r\n2\r\n"})
+        transport = SerialTransport(
+            port, write_terminator=b"\n", timeout=0.05, metrics=metrics
+        )
+        try:
+            assert transport.query("A?") == b"1"
+            assert transport.query("C?", retries=1) is None
+            assert transport.pipeline(["A?", "B?"]) == [b"1", b"2"]
+        finally:
+            transport.close()
+
+        snapshot = registry.snapshot()["test"]
+        assert snapshot["commands"]["A?"]["count"] == 2
+        assert snapshot["commands"]["A?"]["latency"]["count"] == 2
+        assert snapshot["commands"]["B?"]["bytes_received"] == 3
+        assert snapshot["commands"]["C?"]["retries"] == 1
+        assert snapshot["commands"]["C?"]["timeouts"] == 1
+        assert snapshot["bytes_sent"] == len(b"A?\nC?\nC?\nA?\nB?\n")
+        assert snapshot["bytes_received"] == len(b"1\r\n1\r\n2\r\n")
+        assert 0 < snapshot["utilization"] <= 1
+
+        registry.dump(tmp_path / "metrics.jsonl")
+        line = (tmp_path / "metrics.jsonl").read_text().splitlines()[0]
+        assert json.loads(line)["devices"]["test"]["commands"]["C?"]["timeouts"] == 1
+
+    def test_transport_for_connection(self):
+        """Test that a transport follows the controller's connection."""
+        from pymodaq_plugins_urashg.hardware.urashg.serial_transport import SerialTransport
+
+        first, second = FakeSerialPort(), FakeSerialPort()
+        transport = SerialTransport.for_connection(None, first)
+        assert SerialTransport.for_connection(transport, first) is transport
+
+        replaced = SerialTransport.for_connection(transport, second)
+        assert replaced is not transport and replaced.connection is second
+        assert not transport.is_alive
+
+        second.close()
+        assert SerialTransport.for_connection(replaced, second) is None
+        assert not replaced.is_alive
+
+
 class TestElliptecWrapper:
     """Test suite for Elliptec hardware wrapper."""
     
@@ -111,6 +280,262 @@ class TestElliptecWrapper:
                 pytest.skip("ElliptecController not available")
 
 
+    def test_elliptec_reply_parsing(self):
+        """Test parsing of ELLx reply frames."""
+        from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import ElliptecReply
+
+        reply = ElliptecReply.from_bytes(b"2POFFFFFF38")
+        assert reply.address == "2"
+        assert reply.header == "PO"
+        assert reply.position_pulses == -200
+        assert not reply.is_error
+
+        status = ElliptecReply.from_bytes(b"8GS02")
+        assert status.is_error
+        assert status.position_pulses is None
+
+        assert ElliptecReply.from_bytes(b"\xff\x00") is None
+
+    def test_elliptec_send_command_reads_until_terminator(self):
+        """Test that replies are returned as soon as the frame is complete."""
+        import time
+
+        from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import ElliptecController
+
+        controller = ElliptecController(mount_addresses="2,3", timeout=2.0)
+        controller._connection = FakeSerialPort(
+            {
+                # Stale reply from another mount precedes the expected one
+                b"2gp\r": b"3PO00000000\r\n2PO00001F40\r\n",
+            }
+        )
+
+        start = time.monotonic()
+        response = controller._send_command("2gp")
+        assert time.monotonic() - start < 0.2
+        assert response == b"2PO00001F40"
+        assert controller.get_position("2") == pytest.approx(8000 / 23000 * 360.0)
+
+    def test_elliptec_send_command_matches_reply_header(self):
+        """Test that a late PO frame is not taken as the reply to a query."""
+        from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import ElliptecController
+
+        controller = ElliptecController(mount_addresses="2", timeout=0.1)
+        controller._connection = FakeSerialPort(
+            {
+                # Completion of the move arrives ahead of the status reply
+                b"2gs\r": b"2PO00000B3B\r\n2GS00\r\n",
+                b"2in\r": b"2PO00000B3B\r\n2IN0E1140051720200801016800023000\r\n",
+            }
+        )
+
+        controller.move_absolute_multiple({"2": 45.0}, wait=False)
+        assert controller._query("2gs").header == "GS"
+        # The PO frame still completed the move through _on_frame
+        assert not controller.is_moving("2")
+        assert controller._positions["2"] == pytest.approx(45.0)
+
+        assert controller._query("2in").header == "IN"
+
+    def test_elliptec_send_command_deadline(self):
+        """Test that a missing reply gives up at the deadline."""
+        from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import ElliptecController
+
+        controller = ElliptecController(mount_addresses="2", timeout=0.05)
+        controller._connection = FakeSerialPort()
+
+        assert controller._send_command("2gp") is None
+        assert controller._query("2gs") is None
+
+
+    def test_elliptec_move_absolute_multiple(self):
+        """Test that coordinated moves are written back-to-back."""
+        from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import ElliptecController
+
+        controller = ElliptecController(mount_addresses="2,3,8", timeout=0.1)
+        port = FakeSerialPort(
+            {
+                b"2ma00000B3B\r": b"2PO00000B3B\r\n",
+                b"3ma00001676\r": b"3PO00001676\r\n",
+                b"8ma00001C13\r": b"8GS02\r\n",  # Mechanical timeout on mount 8
+            }
+        )
+        controller._connection = port
+
+        assert controller.move_absolute_multiple({"2": 45.0, "3": 90.0}) == {
+            "2": True,
+            "3": True,
+        }
+        assert port.written == [b"2ma00000B3B\r", b"3ma00001676\r"]
+        assert controller._positions["3"] == 90.0
+
+        assert controller.move_absolute_multiple({"2": 45.0, "8": 112.5}) == {
+            "2": True,
+            "8": False,
+        }
+        assert controller._positions["8"] == 0.0
+
+    def test_elliptec_mock_move_absolute_multiple_errors(self):
+        """Test that error replies fail a mount in mock mode."""
+        from unittest.mock import patch
+
+        from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import ElliptecController
+
+        controller = ElliptecController(mount_addresses="2,3,8", mock_mode=True)
+        controller.connect()
+        replies = {"2": b"", "3": b"ER04", "8": b"8GS02"}
+        with patch.object(
+            controller, "_send_command", side_effect=lambda cmd: replies[cmd[0]]
+        ):
+            results = controller.move_absolute_multiple(
+                {"2": 45.0, "3": 90.0, "8": 112.5}
+            )
+
+        assert results == {"2": True, "3": False, "8": False}
+        assert controller._positions["2"] == 45.0
+        assert controller._positions["3"] != 90.0
+        assert controller._positions["8"] != 112.5
+        assert controller._motion_errors == {"3": "ER04", "8": "02"}
+
+
+    def test_elliptec_wait_until_settled(self):
+        """Test completion tracking from PO replies with gs polling fallback."""
+        from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import ElliptecController
+
+        controller = ElliptecController(mount_addresses="2,3", timeout=0.1)
+        # Mount 2 announces completion itself; mount 3 only answers gs polls
+        port = FakeSerialPort(
+            {
+                b"2ma00000B3B\r": b"2PO00000B3B\r\n",
+                b"3gs\r": b"3GS00\r\n",
+            }
+        )
+        controller._connection = port
+
+        results = controller.move_absolute_multiple({"2": 45.0, "3": 90.0}, wait=False)
+        assert all(results.values())
+        assert controller.is_moving("2") and controller.is_moving("3")
+
+        assert controller.wait_until_settled(timeout=1.0) is True
+        assert not controller.is_moving()
+        assert controller._positions["2"] == pytest.approx(45.0)
+        assert b"3gs\r" in port.written
+        assert b"2gs\r" not in port.written
+
+    def test_elliptec_wait_until_settled_timeout(self):
+        """Test that a mount that stays busy times out."""
+        from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import ElliptecController
+
+        controller = ElliptecController(mount_addresses="2", timeout=0.1)
+        controller._connection = FakeSerialPort({b"2gs\r": b"2GS09\r\n"})
+
+        controller.move_absolute_multiple({"2": 45.0}, wait=False)
+        assert controller.wait_until_settled(timeout=0.3) is False
+        assert controller.is_moving("2")
+
+
+    def test_elliptec_trajectory_encoding(self):
+        """Test that vectorized encoding matches single-move commands."""
+        from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import (
+            ElliptecController,
+            ElliptecError,
+        )
+
+        controller = ElliptecController(mount_addresses="2,3,8")
+        angles = np.random.default_rng(0).uniform(-360.0, 360.0, size=(50, 3))
+        trajectory = controller.compile_trajectory(angles)
+
+        assert len(trajectory) == 50
+        for step in (0, 17, 49):
+            expected = b"".join(
+                f"{addr}ma{controller._degrees_to_hex(angle)}\r".encode("ascii")
+                for addr, angle in zip(["2", "3", "8"], angles[step])
+            )
+            assert trajectory.step_bytes(step) == expected
+
+        with pytest.raises(ElliptecError):
+            controller.compile_trajectory(np.zeros((4, 2)))
+
+    def test_elliptec_trajectory_replay(self):
+        """Test that a trajectory step is one write and settles on PO replies."""
+        from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import ElliptecController
+
+        controller = ElliptecController(mount_addresses="2,3", timeout=0.1)
+        trajectory = controller.compile_trajectory([[45.0, 90.0]])
+        port = FakeSerialPort(
+            {trajectory.step_bytes(0): b"2PO00000B3B\r\n3PO00001676\r\n"}
+        )
+        controller._connection = port
+
+        assert controller.run_trajectory_step(trajectory, 0) is True
+        assert port.written == [trajectory.step_bytes(0)]
+        assert not controller.is_moving()
+        assert np.allclose(trajectory.arrival_error(0, controller._positions), 0.0)
+
+    def test_elliptec_position_cache(self):
+        """Test that idle mounts are served from the cache until it goes stale."""
+        import time
+
+        from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import ElliptecController
+
+        controller = ElliptecController(
+            mount_addresses="2,3", timeout=0.1, position_cache_ttl=0.2
+        )
+        port = FakeSerialPort(
+            {
+                b"2gp\r": b"2PO00000B3B\r\n",
+                b"3gp\r": b"3PO00001676\r\n",
+                b"2ma00001676\r": b"2PO00001676\r\n",
+            }
+        )
+        controller._connection = port
+
+        assert controller.get_all_positions() == pytest.approx({"2": 45.0, "3": 90.0})
+        assert controller.get_all_positions() == pytest.approx({"2": 45.0, "3": 90.0})
+        assert port.written == [b"2gp\r", b"3gp\r"]
+
+        # The PO reply of a completed move refreshes the cache
+        port.written.clear()
+        assert controller.move_absolute("2", 90.0)
+        assert controller.get_position("2") == pytest.approx(90.0)
+        assert port.written == [b"2ma00001676\r"]
+
+        # A mount in motion is always queried
+        controller._moving["3"] = time.monotonic()
+        port.written.clear()
+        controller.get_position("3")
+        assert port.written == [b"3gp\r"]
+
+        time.sleep(0.25)
+        port.written.clear()
+        controller.get_position("2")
+        assert port.written == [b"2gp\r"]
+
+
+    @pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires a pty")
+    def test_elliptec_on_simulator(self):
+        """Test the hardware code path against the ELL14 pty simulator."""
+        from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import ElliptecController
+        from pymodaq_plugins_urashg.hardware.urashg.simulators import ElliptecSimulator
+
+        with ElliptecSimulator("2,3", velocity=900.0) as simulator:
+            controller = ElliptecController(
+                port=simulator.port, mount_addresses="2,3", timeout=0.5
+            )
+            assert controller.connect()
+            assert controller.get_device_info("2").startswith("2IN0E")
+
+            assert all(controller.move_absolute_multiple({"2": 90.0, "3": -45.0}).values())
+            assert simulator.degrees("2") == pytest.approx(90.0, abs=0.02)
+            assert simulator.degrees("3") == pytest.approx(-45.0, abs=0.02)
+            controller.position_cache_ttl = 0.0
+            assert controller.get_position("3") == pytest.approx(-45.0, abs=0.02)
+
+            assert controller.home_all()
+            assert controller.get_all_positions() == pytest.approx({"2": 0.0, "3": 0.0})
+            controller.disconnect()
+
+
 class TestMaiTaiControl:
     """Test suite for MaiTai laser control."""
     
@@ -199,6 +624,197 @@ class TestMaiTaiControl:
             except ImportError:
                 pytest.skip("MaiTaiController not available")
 
+    def test_maitai_background_polling(self):
+        """Test the polled state snapshot and preemption by user commands."""
+        import time
+
+        from pymodaq_plugins_urashg.hardware.urashg.maitai_control import MaiTaiController
+
+        controller = MaiTaiController(mock_mode=True)
+        controller.connect()
+        assert controller.get_state() is None
+
+        controller.start_polling(interval=0.05)
+        try:
+            deadline = time.monotonic() + 5.0
+            while controller.get_state() is None and time.monotonic() < deadline:
+                time.sleep(0.05)
+            state = controller.get_state()
+            assert state is not None
+            assert state.wavelength == pytest.approx(780.0)
+            assert state.shutter_open is False
+            assert state.age < 5.0
+
+            # A user command waits for at most the query in progress
+            start = time.monotonic()
+            assert controller.set_wavelength(790.0)
+            assert time.monotonic() - start < 1.0
+
+            deadline = time.monotonic() + 5.0
+            while time.monotonic() < deadline:
+                state = controller.get_state()
+                if state.wavelength == pytest.approx(790.0):
+                    break
+                time.sleep(0.05)
+            assert state.wavelength == pytest.approx(790.0)
+        finally:
+            controller.disconnect()
+        assert not controller.is_polling
+
+    def test_maitai_polling_drops_cycles_overlapping_commands(self):
+        """Test that a cycle started before a set command is not published."""
+        import threading
+        import time
+
+        from pymodaq_plugins_urashg.hardware.urashg.maitai_control import MaiTaiController
+
+        controller = MaiTaiController(mock_mode=True)
+        controller.connect()
+        query_wavelength = controller._query_wavelength
+        read_done = threading.Event()
+
+        def slow_query_wavelength():
+            wavelength = query_wavelength()
+            read_done.set()
+            return wavelength
+
+        controller._query_wavelength = slow_query_wavelength
+        controller.start_polling(interval=10.0)
+        try:
+            # Set the wavelength after the poller has read the old one
+            assert read_done.wait(timeout=5.0)
+            assert controller.set_wavelength(790.0)
+
+            deadline = time.monotonic() + 5.0
+            while controller.get_state() is None and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert controller.get_state().wavelength == pytest.approx(790.0)
+
+            # Getters answer from the fresh snapshot, not the port
+            controller._query_power = Mock(side_effect=AssertionError)
+            controller._query_wavelength = Mock(side_effect=AssertionError)
+            assert controller.get_power() == controller.get_state().power
+            assert controller.get_wavelength() == pytest.approx(790.0)
+        finally:
+            controller.disconnect()
+
+    def test_maitai_polled_errors_kept_until_read(self):
+        """Test that errors popped by the poller reach check_system_errors."""
+        import time
+
+        from pymodaq_plugins_urashg.hardware.urashg.maitai_control import MaiTaiController
+
+        controller = MaiTaiController(mock_mode=True)
+        controller.connect()
+        reported = ["100,Temperature warning - cavity"]
+        queries = []
+
+        def mock_send_command(command, expect_response=True):
+            if command.upper() == "SYSTEM:ERR?":
+                queries.append(command)
+                return reported.pop() if reported else "0,No error"
+            return MaiTaiController._mock_send_command(
+                controller, command, expect_response
+            )
+
+        controller._mock_send_command = mock_send_command
+        controller.start_polling(interval=0.01)
+        try:
+            # Later cycles find an empty queue but keep the stored error
+            deadline = time.monotonic() + 10.0
+            while len(queries) < 3 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert len(queries) >= 3
+        finally:
+            controller.stop_polling()
+
+        expected = ["Error 100: Temperature warning - cavity"]
+        assert controller.get_state().errors == expected
+        assert controller.check_system_errors() == (True, expected)
+        assert controller.check_system_errors() == (False, [])
+
+    def test_maitai_tune_and_wait(self):
+        """Test settle detection from the measured wavelength and modelock bit."""
+        from pymodaq_plugins_urashg.hardware.urashg.maitai_control import MaiTaiController
+
+        controller = MaiTaiController(mock_mode=True)
+        controller.connect()
+
+        settle_time = controller.tune_and_wait(785.0, tolerance=0.2, timeout=5.0)
+        assert settle_time is not None and settle_time < 5.0
+        assert controller.settle_history[-1][1] == settle_time
+
+        # Measured wavelength stuck off target: never settles
+        controller._query_actual_wavelength = lambda: 700.0
+        assert controller.tune_and_wait(790.0, timeout=0.3) is None
+
+        # Not modelocked: never settles
+        controller._query_actual_wavelength = lambda: 790.0
+        controller._query_status_byte = lambda: (1, {"connected": True})
+        assert controller.tune_and_wait(790.0, timeout=0.3) is None
+
+    def test_maitai_enhanced_shutter_state(self):
+        """Test that the combined shutter query does not re-enter the lock."""
+        import threading
+
+        from pymodaq_plugins_urashg.hardware.urashg.maitai_control import MaiTaiController
+
+        controller = MaiTaiController(mock_mode=True)
+        controller.connect()
+        controller.open_shutter()
+
+        result = []
+        worker = threading.Thread(
+            target=lambda: result.append(controller.get_enhanced_shutter_state()),
+            daemon=True,
+        )
+        worker.start()
+        worker.join(timeout=5.0)
+        assert result == [(True, True)]
+
+    def test_maitai_system_errors_pipelined(self):
+        """Test that the error queue is drained in one round trip."""
+        from pymodaq_plugins_urashg.hardware.urashg.maitai_control import MaiTaiController
+
+        controller = MaiTaiController(timeout=0.1)
+        port = FakeSerialPort(
+            {
+                b"SYSTem:ERR?\r\n" * 5: (
+                    b"-113,Undefined header\r\n" b"0,No error\r\n" * 4
+                ),
+            }
+        )
+        controller._serial_connection = port
+        controller._connected = True
+
+        assert controller.check_system_errors() == (
+            True,
+            ["Error -113: Undefined header"],
+        )
+        assert len(port.written) == 1
+
+
+    @pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires a pty")
+    def test_maitai_on_simulator(self):
+        """Test tuning and the error queue against the MaiTai pty simulator."""
+        from pymodaq_plugins_urashg.hardware.urashg.maitai_control import MaiTaiController
+        from pymodaq_plugins_urashg.hardware.urashg.simulators import MaiTaiSimulator
+
+        with MaiTaiSimulator(wavelength=800.0, tuning_rate=100.0) as simulator:
+            controller = MaiTaiController(port=simulator.port, timeout=0.5)
+            assert controller.connect()
+            assert controller.get_wavelength() == 800.0
+
+            settle_time = controller.tune_and_wait(820.0, tolerance=0.1, timeout=2.0)
+            assert settle_time == pytest.approx(0.2, abs=0.1)
+
+            controller.set_wavelength(1200.0)
+            assert controller.check_system_errors() == (
+                True,
+                ["Error -222: Data out of range"],
+            )
+            controller.disconnect()
+
 
 class TestESP300Controller:
     """Test suite for ESP300 motion controller."""
@@ -264,6 +880,197 @@ class TestESP300Controller:
             except ImportError:
                 pytest.skip("ESP300Controller not available")
 
+    def test_esp300_batched_queries(self):
+        """Test that all axes are queried in one chained command."""
+        from pymodaq_plugins_urashg.hardware.urashg.esp300_controller import (
+            ESP300Axis,
+            ESP300Controller,
+        )
+
+        controller = ESP300Controller(timeout=0.1)
+        for num, cfg in controller.axes_config.items():
+            controller.axes[num] = ESP300Axis(num, controller, cfg)
+        port = FakeSerialPort(
+            {
+                b"1TP;2TP;3TP\r\n": b"1.5,-2.25,0.0\r\n",
+                b"1MD?;2MD?;3MD?\r\n": b"1,0,1\r\n",
+                b"1TP;1MD?;2TP;2MD?;3TP;3MD?;TE?\r\n": b"1.5,1,-2.25,0,0.0,1,0\r\n",
+                b"1TP\r\n": b"1.5\r\n",
+                b"2TP\r\n": b"-2.25\r\n",
+            }
+        )
+        controller._serial = port
+
+        assert controller.get_all_positions() == {1: 1.5, 2: -2.25, 3: 0.0}
+        assert controller.get_motion_done() == {1: True, 2: False, 3: True}
+        assert port.written == [b"1TP;2TP;3TP\r\n", b"1MD?;2MD?;3MD?\r\n"]
+
+        status = controller.get_status()
+        assert status.positions == {1: 1.5, 2: -2.25, 3: 0.0}
+        assert not status.all_done
+        assert status.error_code == 0
+
+        # A malformed batched reply falls back to per-axis queries
+        port.replies[b"1TP;2TP;3TP\r\n"] = b"1.5\r\n"
+        assert controller.get_all_positions() == {1: 1.5, 2: -2.25}
+
+    def test_esp300_wait_for_motion(self):
+        """Test that axes are waited for jointly with adaptive polling."""
+        from pymodaq_plugins_urashg.hardware.urashg.esp300_controller import (
+            ESP300Controller,
+            ESP300Status,
+        )
+
+        controller = ESP300Controller()
+        controller.query_axes = Mock(return_value=["10.0", "10.0"])
+        controller.get_status = Mock(
+            side_effect=[
+                # Axis 2 still far from its target: long sleep
+                ESP300Status({1: 0.9, 2: 5.0}, {1: False, 2: False}),
+                ESP300Status({1: 1.0, 2: 6.0}, {1: True, 2: False}),
+                ESP300Status({2: 9.99}, {2: False}),
+                ESP300Status({2: 10.0}, {2: True}),
+            ]
+        )
+
+        with patch("time.sleep") as sleep:
+            completion = controller.wait_for_motion(targets={1: 1.0, 2: 10.0})
+
+        assert set(completion) == {1, 2}
+        assert completion[1] <= completion[2]
+        assert controller.get_status.call_args_list[1].args == ([1, 2],)
+        assert controller.get_status.call_args_list[2].args == ([2],)
+        intervals = [call.args[0] for call in sleep.call_args_list]
+        assert intervals[0] == pytest.approx(0.01)
+        assert intervals[1] == pytest.approx(0.2)
+        assert intervals[2] == pytest.approx(0.01)
+
+    def test_esp300_wait_for_motion_keeps_error(self):
+        """Test that an error popped by a status poll is not lost."""
+        from pymodaq_plugins_urashg.hardware.urashg.esp300_controller import (
+            ESP300Controller,
+            ESP300Status,
+        )
+
+        controller = ESP300Controller()
+        controller.axes = {1: Mock()}
+        controller.query_axes = Mock(return_value=["10.0"])
+        controller.get_status = Mock(
+            side_effect=[
+                # Following error on axis 1 while moving
+                ESP300Status({1: 0.5}, {1: False}, error_code=123),
+                ESP300Status({1: 0.6}, {1: True}),
+            ]
+        )
+
+        with patch("time.sleep"):
+            assert controller.move_multiple_axes({1: 1.0}) is False
+        assert controller.last_error == 123
+        assert "axis 1" in controller.describe_error(controller.last_error)
+
+    def test_esp300_wait_for_motion_timeout(self):
+        """Test that axes still moving at the timeout are reported as None."""
+        from pymodaq_plugins_urashg.hardware.urashg.esp300_controller import (
+            ESP300Controller,
+            ESP300Status,
+        )
+
+        controller = ESP300Controller()
+        controller.get_status = Mock(
+            return_value=ESP300Status({1: 0.0, 2: 0.0}, {1: True, 2: False})
+        )
+
+        completion = controller.wait_for_motion([1, 2], timeout=0.05)
+        assert completion[1] is not None
+        assert completion[2] is None
+
+
+    @pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires a pty")
+    def test_esp300_trajectory_on_simulator(self):
+        """Test stored-program trajectories against the pty simulator."""
+        from pymodaq_plugins_urashg.hardware.urashg.esp300_controller import (
+            AxisConfig,
+            ESP300Controller,
+            ESP300Trajectory,
+        )
+        from pymodaq_plugins_urashg.hardware.urashg.simulators import ESP300Simulator
+
+        points = [[1.0, 0.0], [1.0, 1.0], [2.0, 1.0], [2.0, 2.0]]
+        trajectory = ESP300Trajectory(points, [1, 2], sync_points=[1])
+        assert [list(seg) for seg in trajectory.segments()] == [[0, 1], [2, 3]]
+        assert trajectory.program_lines(range(0, 1)) == [
+            "1PA1.000000;2PA0.000000",
+            "1WS;2WS",
+        ]
+        with pytest.raises(ValueError):
+            ESP300Trajectory(points, [1, 2, 3])
+
+        with ESP300Simulator(num_axes=2, velocity=50.0) as simulator:
+            controller = ESP300Controller(
+                port=simulator.port,
+                timeout=1.0,
+                axes_config=[AxisConfig(1, "x"), AxisConfig(2, "y")],
+            )
+            assert controller.connect()
+
+            programs = controller.upload_trajectory(trajectory)
+            assert programs == [1, 2]
+            assert simulator.programs[2] == trajectory.program_lines(range(2, 4))
+
+            synced = []
+            assert controller.run_trajectory(
+                trajectory, programs, on_sync=synced.append, timeout=5.0
+            )
+            assert synced == [1, 3]
+            assert controller.trajectory_progress == 3
+            assert controller.get_all_positions() == {1: 2.0, 2: 2.0}
+
+            # Motion commands only travel once per segment
+            assert sum(line.endswith("EX") for line in simulator.received) == 2
+            controller.disconnect()
+
+
+    @pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires a pty")
+    def test_esp300_trajectory_dwell_on_simulator(self):
+        """Test that a segment only ends once the dwell at its last point is over."""
+        import time
+
+        from pymodaq_plugins_urashg.hardware.urashg.esp300_controller import (
+            AxisConfig,
+            ESP300Controller,
+            ESP300Trajectory,
+        )
+        from pymodaq_plugins_urashg.hardware.urashg.simulators import ESP300Simulator
+
+        trajectory = ESP300Trajectory([[0.5], [1.0]], [1], dwell=0.5, sync_points=[0])
+
+        with ESP300Simulator(num_axes=1, velocity=2.0) as simulator:
+            controller = ESP300Controller(
+                port=simulator.port, timeout=1.0, axes_config=[AxisConfig(1, "x")]
+            )
+            assert controller.connect()
+            programs = controller.upload_trajectory(trajectory)
+
+            start = time.monotonic()
+            synced = []
+            assert controller.run_trajectory(
+                trajectory,
+                programs,
+                on_sync=lambda index: synced.append(
+                    (index, time.monotonic() - start, simulator.program_running)
+                ),
+                timeout=5.0,
+            )
+            elapsed = time.monotonic() - start
+
+            # 0.25 s of travel plus 0.5 s of dwell per point
+            assert [index for index, _, _ in synced] == [0, 1]
+            assert synced[0][1] >= 0.75
+            assert not any(running for _, _, running in synced)
+            assert elapsed >= 1.5
+            assert not simulator.errors
+            controller.disconnect()
+
 
 class TestNewport1830CController:
     """Test suite for Newport 1830-C power meter."""
@@ -316,6 +1123,119 @@ class TestNewport1830CController:
             except ImportError:
                 pytest.skip("Newport1830CController not available")
 
+    def test_newport_power_ring_buffer(self):
+        """Test the ring buffer wraps and windows by timestamp."""
+        from pymodaq_plugins_urashg.hardware.urashg.newport1830c_controller import PowerRingBuffer
+
+        buffer = PowerRingBuffer(capacity=4)
+        for i in range(6):
+            buffer.append(float(i), float(i) * 10)
+
+        times, values = buffer.snapshot()
+        assert len(buffer) == 4
+        assert list(times) == [2.0, 3.0, 4.0, 5.0]
+        assert list(buffer.latest(2)) == [40.0, 50.0]
+
+        times, values = buffer.window(1.5, now=5.0)
+        assert list(values) == [40.0, 50.0]
+
+    def test_newport_streaming(self):
+        """Test streamed readings are averaged over a time window."""
+        import time
+        from pymodaq_plugins_urashg.hardware.urashg.newport1830c_controller import Newport1830CController
+
+        controller = Newport1830CController(mock_mode=False)
+        controller._serial = FakeSerialPort({b"D?\n": b"1.5E-3\r\n"})
+        controller._connected = True
+
+        controller.start_streaming(capacity=64)
+        try:
+            deadline = time.monotonic() + 2.0
+            while len(controller.stream_buffer) < 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert controller.is_streaming
+            stats = controller.get_stream_statistics(10.0)
+            assert stats["count"] >= 5
+            assert stats["mean"] == pytest.approx(1.5e-3)
+            assert stats["std"] == pytest.approx(0.0)
+
+            # Averaging reuses the stream instead of querying again
+            assert controller.get_multiple_readings(3) == pytest.approx([1.5e-3] * 3)
+        finally:
+            controller.stop_streaming()
+        assert not controller.is_streaming
+        assert controller.get_stream_statistics(0.0) is None
+
+    def test_newport_streaming_discards_stale_readings(self):
+        """Test that old or pre-change streamed readings are not reused."""
+        import time
+        from pymodaq_plugins_urashg.hardware.urashg.newport1830c_controller import Newport1830CController
+
+        controller = Newport1830CController(mock_mode=False, timeout=0.05)
+        port = FakeSerialPort({b"D?\n": b"1.5E-3\r\n"})
+        controller._serial = port
+        controller._connected = True
+
+        controller.start_streaming(capacity=64)
+        try:
+            deadline = time.monotonic() + 2.0
+            while len(controller.stream_buffer) < 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            # Readings taken at the old wavelength are dropped
+            port.replies[b"D?\n"] = b"2.5E-3\r\n"
+            assert controller.set_wavelength(1064.0)
+            deadline = time.monotonic() + 2.0
+            while len(controller.stream_buffer) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert controller.get_multiple_readings(3) == pytest.approx([2.5e-3] * 3)
+
+            # A stalled meter falls back to direct queries
+            port.replies[b"D?\n"] = b""
+            time.sleep(0.3)
+            assert controller.get_multiple_readings(2) == []
+        finally:
+            controller.stop_streaming()
+
+    def test_newport_device_info_pipelined(self):
+        """Test that device info is read in one pipelined round trip."""
+        from pymodaq_plugins_urashg.hardware.urashg.newport1830c_controller import Newport1830CController
+
+        controller = Newport1830CController(timeout=0.1)
+        port = FakeSerialPort({b"W?\nU?\nD?\n": b"1064\r\n3\r\n2.5E-3\r\n"})
+        controller._serial = port
+        controller._connected = True
+
+        info = controller.get_device_info()
+        assert info["wavelength"] == 1064.0
+        assert info["units"] == "dBm"
+        assert info["current_power"] == pytest.approx(2.5e-3)
+        assert port.written == [b"W?\nU?\nD?\n"]
+
+
+    @pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires a pty")
+    def test_newport_on_simulator(self):
+        """Test readings and the baud-rate link model of the pty simulator."""
+        import time
+
+        from pymodaq_plugins_urashg.hardware.urashg.newport1830c_controller import Newport1830CController
+        from pymodaq_plugins_urashg.hardware.urashg.simulators import Newport1830CSimulator
+
+        with Newport1830CSimulator(power=2e-3, noise=0.0, baudrate=4800) as simulator:
+            controller = Newport1830CController(port=simulator.port, timeout=0.5)
+            assert controller.connect()
+
+            # "D?\n" and "2.0000E-03\r\n" take 15 bytes at 4800 baud
+            start = time.monotonic()
+            assert controller.get_power() == pytest.approx(2e-3)
+            assert time.monotonic() - start >= 15 * 10 / 4800
+
+            assert controller.set_units("dBm")
+            assert controller.get_power() == pytest.approx(3.010, abs=1e-3)
+            assert controller.set_power_range("Auto")
+            assert controller.zero_adjust()
+            controller.disconnect()
+
 
 class TestCameraUtils:
     """Test suite for camera utility functions."""
@@ -362,6 +1282,303 @@ class TestCameraUtils:
             pytest.skip("CameraUtils not available")
 
 
+    def test_frame_ring_buffer(self):
+        """Test frame numbering, overwrite detection and averaging."""
+        from pymodaq_plugins_urashg.hardware.urashg.frame_stream import FrameRingBuffer
+
+        buffer = FrameRingBuffer(capacity=4)
+        assert buffer.latest() is None
+        assert buffer.wait(0, timeout=0.01) == -1
+
+        for value in range(6):
+            buffer.put(np.full((2, 3), value, dtype=np.uint16))
+        assert buffer.frames.shape == (4, 2, 3)
+        assert buffer.latest()[0, 0] == 5
+
+        # Frames 0-2 are gone (slot of frame 2 is the next one written)
+        assert buffer.wait(0, timeout=0.01) == 3
+        assert buffer.dropped == 3
+        single = buffer.average(4, 1, timeout=0.01)
+        assert single.dtype == np.uint16 and single[0, 0] == 4
+        assert np.all(buffer.average(3, 3, timeout=0.01) == 4.0)
+        assert buffer.average(5, 2, timeout=0.01) is None
+
+        buffer.close()
+        assert buffer.wait(6, timeout=10.0) == -1
+
+    def test_frame_pool(self):
+        """Test that pooled frames are recycled once every view is dropped."""
+        import gc
+
+        from pymodaq_plugins_urashg.hardware.urashg.frame_stream import (
+            FramePool,
+            FrameRingBuffer,
+        )
+
+        pool = FramePool((4, 4), np.uint16, size=1)
+        frame = pool.acquire()
+        address = frame.__array_interface__["data"][0]
+        view = frame[1:, ::2]
+        del frame
+        gc.collect()
+        assert pool.available == 0  # Still referenced through the view
+
+        other = pool.acquire()  # Pool exhausted: grows
+        assert pool.allocated == 2
+        addresses = {address, other.__array_interface__["data"][0]}
+        del view, other
+        gc.collect()
+        assert pool.available == 2
+
+        # Steady state reuses the buffers
+        for _ in range(5):
+            frame = pool.acquire()
+            assert frame.__array_interface__["data"][0] in addresses
+            del frame
+        assert pool.allocated == 2
+
+        buffer = FrameRingBuffer(capacity=4)
+        for value in range(3):
+            buffer.put(np.full((4, 4), value, dtype=np.uint16))
+        out = FramePool((4, 4), np.float64).acquire()
+        assert buffer.average(0, 3, timeout=0.01, out=out) is out
+        assert np.all(out == 1.0)
+
+    def test_frame_accumulator(self):
+        """Test the streaming mean and variance against np.mean and np.var."""
+        import threading
+
+        from pymodaq_plugins_urashg.hardware.urashg.frame_stream import (
+            FrameAccumulator,
+            FrameRingBuffer,
+        )
+
+        frames = np.random.randint(0, 65536, (9, 16, 12)).astype(np.uint16)
+        accumulator = FrameAccumulator(variance=True)
+        for frame in frames:
+            accumulator.add(frame)
+        assert accumulator.count == 9
+        assert np.allclose(accumulator.mean(), frames.mean(axis=0))
+        assert np.allclose(accumulator.variance(), frames.var(axis=0, ddof=1))
+
+        # Float frames with a large offset keep their precision
+        accumulator = FrameAccumulator(variance=True)
+        for frame in frames:
+            accumulator.add(frame.astype(np.float32) + 1e6)
+        assert np.allclose(accumulator.mean(), frames.mean(axis=0) + 1e6)
+        assert np.allclose(accumulator.variance(), frames.var(axis=0, ddof=1))
+
+        accumulator.reset()
+        with pytest.raises(ValueError):
+            accumulator.mean()
+        accumulator.add(frames[0])
+        with pytest.raises(ValueError):
+            accumulator.add(frames[0, :8])
+
+        # Frames are folded in as a continuous acquisition delivers them
+        buffer = FrameRingBuffer(capacity=16)
+        accumulator = FrameAccumulator()
+
+        def produce():
+            for frame in frames:
+                buffer.put(frame)
+
+        threading.Thread(target=produce).start()
+        assert accumulator.accumulate(buffer, 0, 9, timeout=5.0) == 9
+        assert np.allclose(accumulator.mean(), frames.mean(axis=0))
+        buffer.close()
+        accumulator.reset()
+        assert accumulator.accumulate(buffer, 9, 2, timeout=0.1) == 0
+
+    def test_preview_stream(self):
+        """Test frame reduction and the rate-limited, latest-only preview."""
+        import time
+
+        from pymodaq_plugins_urashg.hardware.urashg.frame_stream import (
+            PreviewStream,
+            reduce_frame,
+        )
+
+        frame = np.arange(9 * 10, dtype=np.uint16).reshape(9, 10)
+        binned = reduce_frame(frame, 2)
+        assert binned.shape == (4, 5)
+        assert binned[0, 0] == np.mean(frame[:2, :2])
+        assert np.array_equal(reduce_frame(frame, 3, "decimate"), frame[:9:3, :9:3])
+        with pytest.raises(ValueError):
+            reduce_frame(frame, 11)
+
+        preview = PreviewStream(factor=2, rate=10.0)
+        preview.start()
+        try:
+            # A burst far faster than the preview rate: stale frames are dropped
+            for value in range(50):
+                preview.submit(np.full((8, 8), value, dtype=np.uint16))
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline and (
+                preview.latest is None or preview.latest[0, 0] != 49
+            ):
+                time.sleep(0.01)
+            assert preview.latest.shape == (4, 4)
+            assert preview.latest[0, 0] == 49
+            assert preview.previewed <= 2
+            assert preview.previewed + preview.dropped == 50
+        finally:
+            preview.stop()
+        assert not preview.is_running
+
+    def test_frame_calibration(self, tmp_path):
+        """Test master frame storage and dark/flat correction."""
+        from pymodaq_plugins_urashg.hardware.urashg.calibration import (
+            DARK,
+            FLAT,
+            CalibrationStore,
+            FrameCalibration,
+        )
+
+        settings = {"exposure": 10.0, "gain": "HDR", "roi": None}
+        dark = np.full((8, 6), 100.0)
+        flat = np.full((8, 6), 2.0)
+        flat[:, :3] = 1.0
+        flat[0, 0] = 0.0  # Dead pixel
+
+        store = CalibrationStore(tmp_path, max_cached=1)
+        store.put(DARK, settings, dark)
+        store.put(FLAT, settings, flat)
+        assert store.get(DARK, {**settings, "exposure": 20.0}) is None
+        # Flats do not depend on the exposure
+        assert store.get(FLAT, {**settings, "exposure": 20.0}) is not None
+
+        # Masters persist across stores
+        reloaded = CalibrationStore(tmp_path)
+        assert np.array_equal(reloaded.get(DARK, settings), dark)
+        assert reloaded.get(DARK, settings).dtype == np.float32
+
+        frame = np.full((8, 6), 300, dtype=np.uint16)
+        frame[1, 1] = 50  # Below the dark
+        out = np.empty((8, 6), np.float32)
+        corrected = FrameCalibration(dark, flat).apply(frame, out=out)
+        assert corrected is out
+        gain = flat[flat > 0].mean() / np.where(flat > 0, flat, 1.0)
+        expected = np.clip((frame - dark) * gain, 0, None)
+        expected[0, 0] = 0.0
+        assert np.allclose(corrected, expected)
+        assert corrected[1, 1] == 0.0
+
+        # Float frames are corrected in place
+        frame = np.full((8, 6), 300.0)
+        assert FrameCalibration(dark=dark).apply(frame) is frame
+        assert np.all(frame == 200.0)
+        with pytest.raises(ValueError):
+            FrameCalibration(dark=dark).apply(np.zeros((4, 4)))
+
+    def test_shg_scene(self):
+        """Test RASHG polarization patterns and noise of the synthetic scene."""
+        from pymodaq_plugins_urashg.hardware.urashg.elliptec_wrapper import (
+            ElliptecController,
+        )
+        from pymodaq_plugins_urashg.hardware.urashg.shg_scene import (
+            D3H_X,
+            D3H_Y,
+            SCENE_STATE,
+            SceneState,
+            ShgScene,
+        )
+
+        # One pixel of a D3h crystal rotated by phi: six-fold patterns
+        phi = 0.3
+        maps = np.array([[[np.cos(3 * phi)]], [[np.sin(3 * phi)]]])
+        scene = ShgScene(
+            maps, [D3H_X, D3H_Y], peak_rate=1.0, bias=0.0, read_noise=0.0, dark_rate=0.0
+        )
+        state = SceneState()
+        for theta in np.arange(0.0, 180.0, 15.0):
+            state.set_mount("2", theta / 2)  # Incident polarization at theta
+            state.set_mount("8", theta / 2)  # Parallel analyzer
+            parallel = scene.expected(1.0, state)[0, 0]
+            state.set_mount("8", theta / 2 + 45)  # Crossed analyzer
+            crossed = scene.expected(1.0, state)[0, 0]
+            assert parallel == pytest.approx(np.cos(3 * (np.radians(theta) - phi)) ** 2, abs=1e-6)
+            assert crossed == pytest.approx(np.sin(3 * (np.radians(theta) - phi)) ** 2, abs=1e-6)
+
+        # Noisy frames scatter around the expected counts
+        scene = ShgScene.flakes((64, 64), seed=1, read_noise=0.0)
+        expected = scene.expected(100.0, state)
+        frames = np.stack([scene.render(100.0, state) for _ in range(64)]).astype(float)
+        assert expected.max() > 500
+        bright = expected > expected.max() / 2
+        assert np.allclose(frames.mean(axis=0)[bright], expected[bright], rtol=0.05)
+        variance = frames.var(axis=0)[bright] / (expected[bright] - scene.bias)
+        assert variance.mean() == pytest.approx(1.0, rel=0.15)  # Shot noise
+
+        # Mock mounts drive the shared scene state
+        controller = ElliptecController(mount_addresses="2,3,8", mock_mode=True)
+        controller.connect()
+        assert controller.move_absolute("8", 30.0)
+        assert SCENE_STATE.angles["hwp_analyzer"] == 30.0
+        SCENE_STATE.set_mount("8", 0.0)
+
+    def test_multi_roi_integration(self):
+        """Test rectangle and mask ROIs against direct sums, for both methods."""
+        from pymodaq_plugins_urashg.hardware.urashg.roi_integration import (
+            RoiIntegrator,
+            parse_rectangles,
+        )
+
+        frame = np.random.randint(0, 4096, (64, 80)).astype(np.uint16)
+        labels = np.zeros(frame.shape, dtype=int)
+        labels[5:10, 5:9] = 3
+        labels[20:30, 1:3] = 7
+        rectangles = parse_rectangles("0, 10, 0, 10\n# reference\n60 10 70 20\n3,4,5,6\n")
+        assert rectangles == [(0, 10, 0, 10), (60, 10, 70, 20), (3, 4, 5, 6)]
+        expected = [
+            frame[:10, :10].sum(),
+            frame[60:, 70:].sum(),  # Clipped to the frame
+            frame[3:7, 5:11].sum(),
+            frame[labels == 3].sum(),
+            frame[labels == 7].sum(),
+        ]
+
+        for method in ("table", "slices", "auto"):
+            integrator = RoiIntegrator(rectangles, masks=labels, method=method)
+            assert len(integrator) == 5
+            assert integrator.integrate(frame).tolist() == expected
+
+        masks = RoiIntegrator(masks=np.stack([labels == 3, labels == 7]))
+        assert masks.labels == ["Mask0", "Mask1"]
+        assert masks.integrate(frame.astype(float)).tolist() == expected[3:]
+
+        # Many large overlapping ROIs are cheaper from the summed-area table
+        overlapping = RoiIntegrator([(0, 60, 0, 60)] * 50)
+        overlapping.integrate(frame)
+        assert overlapping._layout[0]
+
+        with pytest.raises(ValueError):
+            parse_rectangles("1, 2, 3")
+        with pytest.raises(ValueError):
+            RoiIntegrator(masks=[np.zeros((4, 4), dtype=bool)])
+        with pytest.raises(ValueError):
+            RoiIntegrator(masks=labels).integrate(frame[:10])
+
+    def test_continuous_acquisition_sequence(self):
+        """Test that a sequence is polled into the ring buffer and finished."""
+        from pymodaq_plugins_urashg.hardware.urashg.frame_stream import ContinuousAcquisition
+
+        camera = Mock()
+        frames = iter(range(100))
+        camera.poll_frame.side_effect = lambda **kwargs: (
+            {"pixel_data": np.full((4, 4), next(frames), dtype=np.uint16)}, 100.0, 0
+        )
+
+        acquisition = ContinuousAcquisition(camera, exposure=1, buffer_frames=8, frames=5)
+        acquisition.start()
+        assert np.all(acquisition.buffer.average(0, 5, timeout=2.0) == 2.0)
+        acquisition.stop()
+
+        camera.start_seq.assert_called_once_with(exp_time=1, num_frames=5)
+        camera.finish.assert_called_once()
+        assert camera.poll_frame.call_count == 5
+        assert acquisition.buffer.count == 5 and acquisition.fps == 100.0
+
 class TestRedPitayaControl:
     """Test suite for Red Pitaya FPGA control."""
     
@@ -471,6 +1688,87 @@ class TestSystemControl:
             pytest.skip("SystemControl not available")
 
 
+class TestDeviceScanner:
+    """Test suite for the serial device scanner."""
+
+    @pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires a pty")
+    def test_parallel_scan_on_simulators(self, tmp_path):
+        """Test that simulated devices are identified on their ports."""
+        from pymodaq_plugins_urashg.hardware.urashg.device_scanner import DeviceScanner
+        from pymodaq_plugins_urashg.hardware.urashg.simulators import (
+            ElliptecSimulator,
+            MaiTaiSimulator,
+        )
+
+        with ElliptecSimulator("2") as elliptec, MaiTaiSimulator() as maitai:
+            scanner = DeviceScanner(timeout=0.2, cache_path=tmp_path / "cache.json")
+            scanner.PORT_PATHS = [elliptec.port, maitai.port, "/dev/nonexistent"]
+            scanner.scan_available_ports = lambda: []
+
+            assert scanner.scan_all_devices() == {
+                "elliptec": elliptec.port,
+                "maitai": maitai.port,
+            }
+            # A rescan tries the previously found device first
+            assert scanner._probe_order(elliptec.port, scanner.detected_devices)[0] == "elliptec"
+
+    def test_probe_order_from_port_hints(self):
+        """Test that USB descriptors put the likely device first."""
+        from pymodaq_plugins_urashg.hardware.urashg.device_scanner import DeviceScanner
+
+        scanner = DeviceScanner(use_cache=False)
+        scanner.available_ports = [
+            {"device": "/dev/ttyUSB0", "description": "Thorlabs Elliptec", "manufacturer": None},
+        ]
+        assert scanner._probe_order("/dev/ttyUSB0")[0] == "elliptec"
+        assert scanner._probe_order("/dev/ttyUSB1") == list(DeviceScanner.DEVICE_PATTERNS)
+
+    @pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires a pty")
+    def test_identity_cache(self, tmp_path):
+        """Test that cached adapters are confirmed with a single query."""
+        import json
+
+        from pymodaq_plugins_urashg.hardware.urashg.device_scanner import DeviceScanner
+        from pymodaq_plugins_urashg.hardware.urashg.simulators import MaiTaiSimulator
+
+        cache_path = tmp_path / "cache.json"
+        info = {"vid": 0x0403, "pid": 0x6001, "serial_number": "FT1234"}
+        assert DeviceScanner.usb_identity(info) == "0403:6001:FT1234"
+        assert DeviceScanner.usb_identity({"vid": 0x0403, "pid": 0x6001}) is None
+
+        def make_scanner(port):
+            scanner = DeviceScanner(timeout=0.2, cache_path=cache_path)
+            scanner.PORT_PATHS = []
+
+            def list_ports():
+                scanner.available_ports = [dict(info, device=port)]
+                return scanner.available_ports
+
+            scanner.scan_available_ports = list_ports
+            probes = []
+            probe = scanner._probe
+            scanner._probe = lambda *args: probes.append(args[1:]) or probe(*args)
+            return scanner, probes
+
+        with MaiTaiSimulator() as maitai:
+            scanner, probes = make_scanner(maitai.port)
+            assert scanner.scan_all_devices() == {"maitai": maitai.port}
+            assert len(probes) == 1
+            assert json.loads(cache_path.read_text())["devices"]["0403:6001:FT1234"] == {
+                "device_type": "maitai",
+                "baudrate": 9600,
+                "command": "*IDN?",
+                "port": maitai.port,
+            }
+
+        # After a re-plug the adapter is confirmed with its cached command only
+        with MaiTaiSimulator() as maitai:
+            scanner, probes = make_scanner(maitai.port)
+            assert scanner.scan_all_devices() == {"maitai": maitai.port}
+            assert probes == [("maitai", [9600], ["*IDN?"])]
+            assert json.loads(cache_path.read_text())["devices"]["0403:6001:FT1234"]["port"] == maitai.port
+
+
 class TestUtilityFunctions:
     """Test suite for utility functions."""
     